@@ -0,0 +1,212 @@
+"""Benchmark the DNA Center SSoT load, diff and sync phases against the fake DNA Center API.
+
+For each size a synthetic topology is served by `fake_dnac.py` and synced into Nautobot twice: an initial sync into an
+empty database followed by a resync where Nautobot already holds every object. Wall time, database query count and
+peak Python memory are recorded for each phase and written to a JSON file that can be compared against a previous run.
+Changes are rolled back after each size unless `--commit` is passed.
+
+Run inside the development container so Nautobot and its database are available, ie `invoke benchmark`:
+    python development/benchmark.py --sizes 1000 10000 50000 --ports 30 --output benchmark.json
+    python development/benchmark.py --sizes 1000 --compare benchmark.json
+"""
+
+# pylint: disable=wrong-import-position
+import argparse
+import json
+import logging
+import platform
+import sys
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from importlib import metadata
+
+import nautobot
+
+nautobot.setup()
+
+from diffsync.enum import DiffSyncFlags  # noqa: E402
+from diffsync.helpers import DiffSyncSyncer  # noqa: E402
+from django.db import transaction  # noqa: E402
+
+from fake_dnac import FakeDnaCenterServer, SyntheticDataset  # noqa: E402
+from nautobot_ssot_dna_center.diffsync.adapters.dna_center import DnaCenterAdapter  # noqa: E402
+from nautobot_ssot_dna_center.diffsync.adapters.nautobot import NautobotAdapter  # noqa: E402
+from nautobot_ssot_dna_center.utils.dna_center import DnaCenterClient  # noqa: E402
+from nautobot_ssot_dna_center.utils.metrics import SyncMetrics  # noqa: E402
+
+PHASES = ["dnac_load", "nautobot_load", "diff", "sync", "sync_complete"]
+
+
+class BenchmarkJob:  # pylint: disable=too-few-public-methods
+    """Stand-in for DnaCenterDataSource providing the attributes the adapters and models use."""
+
+    def __init__(self, bulk_import: bool = False):
+        """Initialize job.
+
+        Args:
+            bulk_import (bool): Whether the Nautobot adapter should use bulk operations.
+        """
+        self.logger = logging.getLogger("benchmark.job")
+        self.debug = False
+        self.bulk_import = bulk_import
+        self.sync = None
+        self.metrics = SyncMetrics()
+
+
+class MemoryRecorder:
+    """Record peak Python memory of benchmark phases alongside the phase metrics recorded by `SyncMetrics`."""
+
+    def __init__(self, metrics: SyncMetrics, trace_memory: bool = True):
+        """Initialize recorder.
+
+        Args:
+            metrics (SyncMetrics): Metrics recording wall time and database queries of each phase.
+            trace_memory (bool): Whether to trace memory allocations, which slows down the measured code.
+        """
+        self.metrics = metrics
+        self.trace_memory = trace_memory
+        self.peak_memory = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        """Record the code run inside the context as phase name."""
+        if self.trace_memory:
+            tracemalloc.start()
+        try:
+            with self.metrics.phase(name):
+                yield
+        finally:
+            if self.trace_memory:
+                self.peak_memory[name] = round(tracemalloc.get_traced_memory()[1] / 1024**2, 1)
+                tracemalloc.stop()
+
+    @property
+    def results(self) -> dict:
+        """Get wall time, database queries and peak memory of each phase."""
+        phases = {name: dict(stats) for name, stats in self.metrics.summary()["phases"].items()}
+        for name, peak in self.peak_memory.items():
+            phases[name]["peak_memory_mb"] = peak
+        return phases
+
+
+def run_scenario(server: FakeDnaCenterServer, bulk_import: bool, max_workers: int, trace_memory: bool) -> dict:
+    """Load both adapters, calculate the diff and sync it into Nautobot, recording each phase.
+
+    Args:
+        server (FakeDnaCenterServer): Running fake DNA Center to load from.
+        bulk_import (bool): Whether the Nautobot adapter should use bulk operations.
+        max_workers (int): Number of concurrent requests made to the fake DNA Center.
+        trace_memory (bool): Whether to record peak memory of each phase.
+
+    Returns:
+        dict: Metrics of each phase along with object and diff counts.
+    """
+    job = BenchmarkJob(bulk_import=bulk_import)
+    recorder = MemoryRecorder(metrics=job.metrics, trace_memory=trace_memory)
+    flags = DiffSyncFlags.CONTINUE_ON_FAILURE | DiffSyncFlags.LOG_UNCHANGED_RECORDS
+    client = DnaCenterClient(
+        url=server.url, port=server.port, username="benchmark", password="benchmark", max_workers=max_workers
+    )
+    client.connect()
+    source = DnaCenterAdapter(job=job, sync=None, client=client, tenant=None)
+    target = NautobotAdapter(job=job, sync=None, tenant=None)
+
+    with recorder.phase("dnac_load"):
+        source.load()
+    with recorder.phase("nautobot_load"):
+        target.load()
+    with recorder.phase("diff"):
+        diff = target.diff_from(source, flags=flags)
+    syncer = DiffSyncSyncer(diff=diff, src_diffsync=source, dst_diffsync=target, flags=flags)
+    with recorder.phase("sync"):
+        changed = syncer.perform_sync()
+    with recorder.phase("sync_complete"):
+        if changed:
+            target.sync_complete(source, diff, flags, syncer.base_logger)
+
+    return {
+        "phases": recorder.results,
+        "objects": {name: len(source.get_all(name)) for name in ["device", "port", "ipaddress", "ip_on_intf"]},
+        "diff": diff.summary(),
+    }
+
+
+def run_size(devices: int, args: argparse.Namespace) -> dict:
+    """Benchmark an initial sync and a resync of a topology with the given number of Devices."""
+    dataset = SyntheticDataset(devices=devices, ports=args.ports)
+    results = {"devices": devices, "ports_per_device": args.ports}
+    with FakeDnaCenterServer(dataset, latency=args.latency) as server:
+        with transaction.atomic():
+            for scenario in ["initial", "resync"]:
+                print(f"Running {scenario} sync of {devices} devices.", flush=True)
+                results[scenario] = run_scenario(
+                    server=server,
+                    bulk_import=args.bulk_import,
+                    max_workers=args.max_workers,
+                    trace_memory=not args.no_memory,
+                )
+            if not args.commit:
+                transaction.set_rollback(True)
+        results["api_requests"] = dict(server.request_counts)
+    return results
+
+
+def compare(previous: dict, current: dict):
+    """Print change in wall time and queries of each phase between two benchmark runs."""
+    print(f"Comparing {previous['version']} ({previous['timestamp']}) to {current['version']}:")
+    old_sizes = {size["devices"]: size for size in previous["results"]}
+    for size in current["results"]:
+        old_size = old_sizes.get(size["devices"])
+        if not old_size:
+            continue
+        for scenario in ["initial", "resync"]:
+            for phase in PHASES:
+                old = old_size[scenario]["phases"][phase]
+                new = size[scenario]["phases"][phase]
+                change = (new["seconds"] - old["seconds"]) / old["seconds"] * 100 if old["seconds"] else 0.0
+                print(
+                    f"{size['devices']:>7} {scenario:<8} {phase:<14} "
+                    f"{old['seconds']:>9.2f}s -> {new['seconds']:>9.2f}s ({change:+.1f}%) "
+                    f"queries {old['queries']} -> {new['queries']}"
+                )
+
+
+def main():
+    """Parse command line arguments, run the benchmarks and write the results."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000], help="Numbers of Devices.")
+    parser.add_argument("--ports", type=int, default=30, help="Number of interfaces per Device.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds to delay each API response by.")
+    parser.add_argument("--max-workers", type=int, default=10, help="Concurrent requests made to DNA Center.")
+    parser.add_argument("--bulk-import", action="store_true", help="Use bulk operations in the Nautobot adapter.")
+    parser.add_argument("--no-memory", action="store_true", help="Skip tracing memory for more accurate timings.")
+    parser.add_argument("--commit", action="store_true", help="Keep the synced data instead of rolling back.")
+    parser.add_argument("--output", default="benchmark.json", help="File to write results to.")
+    parser.add_argument("--compare", help="Results of a previous run to compare against.")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    previous = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            previous = json.load(file)
+    report = {
+        "version": metadata.version("nautobot-ssot-dna-center"),
+        "nautobot_version": metadata.version("nautobot"),
+        "python_version": platform.python_version(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "options": {key: value for key, value in vars(args).items() if key not in ["output", "compare"]},
+        "results": [run_size(devices, args) for devices in args.sizes],
+    }
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    print(f"Wrote results to {args.output}.")
+
+    if previous:
+        compare(previous, report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
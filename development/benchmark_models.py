@@ -0,0 +1,188 @@
+"""Measure memory held by the port and IP address DiffSync models loaded by both adapters.
+
+Interfaces and IP addresses generated by `fake_dnac.py` are serialized to JSON and parsed again so every value is a
+separate string object, as returned by the DNA Center API or a database query. `Port`, `IPAddress` and
+`IPAddressOnInterface` models are then built from them the way the adapters load them, the parsed data is released and
+the memory still held by the models, including the values they reference, is reported per object. The `nautobot`
+scenario assigns a UUID to each model as the Nautobot adapter does, the `dna_center` scenario leaves it unset.
+
+Each model is measured twice: as a `baseline` plain `DiffSyncModel` subclass with the same fields, which is how the
+models were defined before `CompactModel`, and as the `compact` model the adapters load.
+
+Run inside the development container so the plugin settings are available:
+    python development/benchmark_models.py --devices 1000 --ports 48
+"""
+
+# pylint: disable=wrong-import-position
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+import uuid
+from typing import Optional
+from uuid import UUID
+
+import nautobot
+
+nautobot.setup()
+
+from diffsync import DiffSyncModel  # noqa: E402
+from netutils.ip import netmask_to_cidr  # noqa: E402
+
+from fake_dnac import SyntheticDataset  # noqa: E402
+from nautobot_ssot_dna_center.diffsync.models.base import IPAddress, IPAddressOnInterface, Port  # noqa: E402
+from nautobot_ssot_dna_center.utils.dna_center import DnaCenterClient  # noqa: E402
+
+
+class BaselinePort(DiffSyncModel):
+    """Plain DiffSyncModel with the same fields as Port."""
+
+    _modelname = "port"
+    _identifiers = ("name", "device")
+    _attributes = ("description", "mac_addr", "port_type", "port_mode", "mtu", "status", "enabled")
+    _children = {}
+
+    name: str
+    device: str
+    description: Optional[str]
+    port_type: str
+    port_mode: str
+    mac_addr: Optional[str]
+    mtu: int
+    status: str
+    enabled: bool
+
+    uuid: Optional[UUID]
+
+
+class BaselineIPAddress(DiffSyncModel):
+    """Plain DiffSyncModel with the same fields as IPAddress."""
+
+    _modelname = "ipaddress"
+    _identifiers = ("host", "namespace")
+    _attributes = ("mask_length", "tenant")
+    _children = {}
+
+    host: str
+    mask_length: int
+    namespace: str
+    tenant: Optional[str]
+
+    uuid: Optional[UUID]
+
+
+class BaselineIPAddressOnInterface(DiffSyncModel):
+    """Plain DiffSyncModel with the same fields as IPAddressOnInterface."""
+
+    _modelname = "ip_on_intf"
+    _identifiers = ("host", "device", "port")
+    _attributes = ("primary",)
+    _children = {}
+
+    host: str
+    device: str
+    port: str
+    primary: bool
+
+    uuid: Optional[UUID]
+
+
+MODEL_CLASSES = {
+    "baseline": {"port": BaselinePort, "ipaddress": BaselineIPAddress, "ip_on_intf": BaselineIPAddressOnInterface},
+    "compact": {"port": Port, "ipaddress": IPAddress, "ip_on_intf": IPAddressOnInterface},
+}
+
+
+def build_models(dataset: SyntheticDataset, set_uuid: bool, classes: dict) -> dict:
+    """Build Port, IPAddress and IPAddressOnInterface models for every generated interface.
+
+    Args:
+        dataset (SyntheticDataset): Generated topology to build models from.
+        set_uuid (bool): Whether to assign a UUID to each model as the Nautobot adapter does.
+        classes (dict): Model class to build for each model name.
+
+    Returns:
+        dict: Models built for each model name.
+    """
+    models = {"port": [], "ipaddress": [], "ip_on_intf": []}
+    for index in range(dataset.devices):
+        device = json.loads(json.dumps(dataset.get_device(index)))
+        for port in json.loads(json.dumps(dataset.get_ports(device["id"]))):
+            models["port"].append(
+                classes["port"](
+                    name=port["portName"],
+                    device=device["hostname"],
+                    description=port["description"],
+                    enabled=port["adminStatus"] == "UP",
+                    port_type=DnaCenterClient.get_port_type(port_info=port),
+                    port_mode="tagged" if port["portMode"] == "trunk" else "access",
+                    mac_addr=port["macAddress"].upper() if port.get("macAddress") else None,
+                    mtu=port["mtu"] if port.get("mtu") else 1500,
+                    status=DnaCenterClient.get_port_status(port_info=port),
+                    uuid=uuid.uuid4() if set_uuid else None,
+                )
+            )
+            for addr in port["addresses"] or []:
+                host = addr["address"]["ipAddress"]["address"]
+                models["ipaddress"].append(
+                    classes["ipaddress"](
+                        host=host,
+                        mask_length=netmask_to_cidr(addr["address"]["ipMask"]["address"]),
+                        namespace=json.loads('"Global"'),
+                        tenant=None,
+                        uuid=uuid.uuid4() if set_uuid else None,
+                    )
+                )
+                models["ip_on_intf"].append(
+                    classes["ip_on_intf"](
+                        host=host,
+                        device=device["hostname"],
+                        port=port["portName"],
+                        primary=host == device["managementIpAddress"],
+                        uuid=uuid.uuid4() if set_uuid else None,
+                    )
+                )
+    return models
+
+
+def measure(dataset: SyntheticDataset, set_uuid: bool, classes: dict) -> dict:
+    """Get the bytes of memory held per model instance, including referenced values, for each model name."""
+    results = {}
+    for name in ["port", "ipaddress", "ip_on_intf"]:
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        models = build_models(dataset, set_uuid=set_uuid, classes=classes)[name]
+        gc.collect()
+        held = tracemalloc.get_traced_memory()[0] - before - sys.getsizeof(models)
+        tracemalloc.stop()
+        results[name] = {"count": len(models), "bytes_per_object": round(held / len(models))}
+        del models
+    return results
+
+
+def main():
+    """Parse command line arguments, measure memory held by the models and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    parser.add_argument("--devices", type=int, default=1000, help="Number of Devices to generate interfaces for.")
+    parser.add_argument("--ports", type=int, default=48, help="Number of interfaces per Device.")
+    args = parser.parse_args()
+
+    dataset = SyntheticDataset(devices=args.devices, ports=args.ports)
+    print(f"{'scenario':<10} {'model':<10} {'objects':>9} {'baseline':>9} {'compact':>9} {'saved':>6}")
+    for scenario, set_uuid in [("dna_center", False), ("nautobot", True)]:
+        results = {
+            variant: measure(dataset, set_uuid=set_uuid, classes=classes) for variant, classes in MODEL_CLASSES.items()
+        }
+        for name, stats in results["compact"].items():
+            baseline = results["baseline"][name]["bytes_per_object"]
+            saved = 1 - stats["bytes_per_object"] / baseline
+            print(
+                f"{scenario:<10} {name:<10} {stats['count']:>9} {baseline:>9} {stats['bytes_per_object']:>9} {saved:>6.0%}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""Micro-benchmark port type and status classification used when loading DNA Center interfaces.
+
+Compares `DnaCenterClient.get_port_type` and `DnaCenterClient.get_port_status` against the original per-port regex and
+string comparison implementations using interfaces generated by `fake_dnac.py`. Both implementations are first checked
+to return the same results for every generated interface and every known interface name prefix.
+
+Run inside the development container so the plugin settings are available:
+    python development/benchmark_ports.py --devices 1000 --ports 48
+"""
+
+# pylint: disable=wrong-import-position
+import argparse
+import re
+import sys
+import timeit
+
+import nautobot
+
+nautobot.setup()
+
+from netutils.constants import BASE_INTERFACES  # noqa: E402
+
+from fake_dnac import SyntheticDataset  # noqa: E402
+from nautobot_ssot_dna_center.constants import BASE_INTERFACE_MAP  # noqa: E402
+from nautobot_ssot_dna_center.utils.dna_center import DnaCenterClient, classify_port_type  # noqa: E402
+
+
+def original_port_type(port_info: dict) -> str:
+    """Determine port type with a regex and BASE_INTERFACES lookup for every port as originally implemented."""
+    if port_info["portType"] == "Ethernet SVI" or port_info["portType"] == "Service Module Interface":
+        return "virtual"
+
+    base_port_name = re.match("[a-zA-Z]+", port_info["portName"])
+    if base_port_name and BASE_INTERFACES.get(base_port_name.group()):
+        base_port_name = BASE_INTERFACES[base_port_name.group()]
+
+    if port_info["portType"] == "Ethernet Port" and base_port_name in BASE_INTERFACE_MAP:
+        return BASE_INTERFACE_MAP[base_port_name]
+    return "other"
+
+
+def original_port_status(port_info: dict) -> str:
+    """Determine port status by comparing strings for every port as originally implemented."""
+    status = "Active"
+    if port_info["status"] == "down" and port_info["adminStatus"] == "DOWN":
+        status = "Maintenance"
+    if port_info["status"] == "down" and port_info["adminStatus"] == "UP":
+        status = "Failed"
+    if port_info["status"] == "up" and port_info["adminStatus"] == "DOWN":
+        status = "Planned"
+    return status
+
+
+def verify(ports: list):
+    """Raise AssertionError if the implementations classify any port or known interface name differently."""
+    names = [f"{prefix}1/0/1" for prefix in BASE_INTERFACES] + ["0/1", "Wlan-GigabitEthernet0"]
+    checks = ports + [
+        {"portType": port_type, "portName": name, "status": status, "adminStatus": admin}
+        for port_type in ["Ethernet Port", "Ethernet SVI", "Service Module Interface", "Other"]
+        for name in names
+        for status, admin in [("up", "UP"), ("up", "DOWN"), ("down", "UP"), ("down", "DOWN"), ("", "")]
+    ]
+    for port in checks:
+        assert DnaCenterClient.get_port_type(port) == original_port_type(port), port
+        assert DnaCenterClient.get_port_status(port) == original_port_status(port), port
+
+
+def time_classification(ports: list, port_type, port_status, repeat: int) -> float:
+    """Get the best time in seconds of classifying the type and status of every port."""
+
+    def classify():
+        classify_port_type.cache_clear()
+        for port in ports:
+            port_type(port)
+            port_status(port)
+
+    return min(timeit.repeat(classify, number=1, repeat=repeat))
+
+
+def main():
+    """Parse command line arguments, verify and time both implementations and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    parser.add_argument("--devices", type=int, default=1000, help="Number of Devices to generate interfaces for.")
+    parser.add_argument("--ports", type=int, default=48, help="Number of interfaces per Device.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of times to time each implementation.")
+    args = parser.parse_args()
+
+    dataset = SyntheticDataset(devices=args.devices, ports=args.ports)
+    ports = [dataset.get_port(index, port) for index in range(args.devices) for port in range(args.ports)]
+    verify(ports)
+
+    original = time_classification(ports, original_port_type, original_port_status, args.repeat)
+    current = time_classification(ports, DnaCenterClient.get_port_type, DnaCenterClient.get_port_status, args.repeat)
+    for name, seconds in [("original", original), ("current", current)]:
+        print(f"{name:<9} {seconds:>8.3f}s {seconds / len(ports) * 1e9:>8.0f}ns per port")
+    print(f"Classified {len(ports)} ports {original / current:.1f}x faster. {classify_port_type.cache_info()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
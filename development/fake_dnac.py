@@ -0,0 +1,541 @@
+"""Local stand-in for the DNA Center API used to exercise the DNA Center adapter at scale.
+
+The server implements the handful of DNA Center endpoints that `DnaCenterClient` uses: token authentication, the
+paginated site, device and interface lists, device detail and interfaces by device. Data is either generated on demand
+for an arbitrary number of Devices or replayed from a recording of a real DNA Center instance.
+
+Usage:
+    python fake_dnac.py serve --devices 50000 --ports 30 --latency 0.05
+    python fake_dnac.py serve --replay recording.json.gz
+    python fake_dnac.py record --url https://dnac.example.com --username admin --password secret -o recording.json.gz
+"""
+
+import argparse
+import gzip
+import json
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+from urllib.parse import parse_qs, urlparse
+
+API_PREFIX = "/dna/intent/api/v1"
+AUTH_PATH = "/dna/system/api/v1/auth/token"
+DEFAULT_LIMIT = 500
+UPDATE_TIME = 1700000000000
+
+GLOBAL_ID = "9e5f9fc2-0000-4000-8000-000000000000"
+AREA_ID = "a0000000-0000-4000-8000-{:012d}"
+BUILDING_ID = "b0000000-0000-4000-8000-{:012d}"
+FLOOR_ID = "f0000000-0000-4000-8000-{:012d}"
+DEVICE_ID = "d0000000-0000-4000-8000-{:012d}"
+PORT_ID = "e{:07d}-0000-4000-8000-{:012d}"
+
+
+def get_page(items: list, offset: int, limit: int) -> list:
+    """Get limit items starting at the 1-based offset used by DNA Center pagination."""
+    start = offset - 1
+    end = start + limit
+    return items[start:end]
+
+
+class SyntheticDataset:
+    """Deterministic DNA Center topology generated on demand so even very large datasets use little memory.
+
+    Sites are laid out as Global > Area > Building > Floor. Each Device is assigned to a Floor and has an SVI holding its
+    management address, a loopback and the remaining ports as GigabitEthernet interfaces.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        devices: int = 1000,
+        ports: int = 30,
+        devices_per_building: int = 50,
+        floors: int = 2,
+        buildings_per_area: int = 25,
+        update_time: int = UPDATE_TIME,
+    ):
+        """Initialize dataset.
+
+        Args:
+            devices (int): Number of Devices to generate.
+            ports (int): Number of interfaces per Device.
+            devices_per_building (int): Number of Devices in each Building.
+            floors (int): Number of Floors in each Building.
+            buildings_per_area (int): Number of Buildings in each Area.
+            update_time (int): Base lastUpdateTime of Devices, the Device index is added to it.
+        """
+        self.devices = devices
+        self.ports = ports
+        self.devices_per_building = max(devices_per_building, 1)
+        self.floors = max(floors, 1)
+        self.buildings_per_area = max(buildings_per_area, 1)
+        self.update_time = update_time
+        self.buildings = -(-devices // self.devices_per_building)
+        self.areas = -(-self.buildings // self.buildings_per_area)
+        self.sites = self._build_sites()
+
+    @staticmethod
+    def _site(site_id: str, name: str, hierarchy: List[str], names: List[str], info: Optional[dict] = None) -> dict:
+        """Build site as returned by the site endpoint."""
+        site = {
+            "additionalInfo": [{"nameSpace": "Location", "attributes": info}] if info else [],
+            "id": site_id,
+            "name": name,
+            "siteHierarchy": "/".join(hierarchy),
+            "siteNameHierarchy": "/".join(names),
+        }
+        if len(hierarchy) > 1:
+            site["parentId"] = hierarchy[-2]
+        return site
+
+    def _build_sites(self) -> List[dict]:
+        """Build all sites, parents ahead of their children."""
+        sites = [self._site(GLOBAL_ID, "Global", [GLOBAL_ID], ["Global"])]
+        for area in range(self.areas):
+            sites.append(
+                self._site(
+                    AREA_ID.format(area),
+                    f"Area{area}",
+                    [GLOBAL_ID, AREA_ID.format(area)],
+                    ["Global", f"Area{area}"],
+                    {"addressInheritedFrom": AREA_ID.format(area), "type": "area"},
+                )
+            )
+        for building in range(self.buildings):
+            area = building // self.buildings_per_area
+            hierarchy = [GLOBAL_ID, AREA_ID.format(area), BUILDING_ID.format(building)]
+            names = ["Global", f"Area{area}", f"Building{building}"]
+            sites.append(
+                self._site(
+                    hierarchy[-1],
+                    names[-1],
+                    hierarchy,
+                    names,
+                    {
+                        "address": f"{building} Benchmark Way",
+                        "addressInheritedFrom": hierarchy[-1],
+                        "country": "United States",
+                        "latitude": f"{35 + (building % 1000) / 100:.2f}",
+                        "longitude": f"{-120 + (building % 1000) / 100:.2f}",
+                        "type": "building",
+                    },
+                )
+            )
+            for floor in range(self.floors):
+                floor_index = building * self.floors + floor
+                sites.append(
+                    self._site(
+                        FLOOR_ID.format(floor_index),
+                        f"Floor{floor + 1}",
+                        hierarchy + [FLOOR_ID.format(floor_index)],
+                        names + [f"Floor{floor + 1}"],
+                        {"address": "", "addressInheritedFrom": hierarchy[-1], "type": "floor"},
+                    )
+                )
+        return sites
+
+    @staticmethod
+    def get_index(device_id: str) -> Optional[int]:
+        """Get index of Device from its ID. Returns None if device_id isn't a generated ID."""
+        suffix = device_id.rsplit("-", maxsplit=1)[-1]
+        if not device_id.startswith(DEVICE_ID.split("{", maxsplit=1)[0]) or not suffix.isdigit():
+            return None
+        return int(suffix)
+
+    @staticmethod
+    def get_mgmt_address(index: int) -> str:
+        """Get management address of the Device at index, 250 Devices per /24."""
+        subnet = index // 250
+        return f"10.{subnet // 256 % 256}.{subnet % 256}.{index % 250 + 2}"
+
+    def site_count(self) -> int:
+        """Get number of sites."""
+        return len(self.sites)
+
+    def get_sites(self, offset: int, limit: int) -> List[dict]:
+        """Get page of sites starting at 1-based offset."""
+        return get_page(self.sites, offset, limit)
+
+    def device_count(self) -> int:
+        """Get number of Devices."""
+        return self.devices
+
+    def get_device(self, index: int) -> dict:
+        """Build Device at index as returned by the network-device endpoint."""
+        return {
+            "family": "Switches and Hubs",
+            "hostname": f"{'dist' if index % 25 == 0 else 'leaf'}{index:06d}.bench.local",
+            "id": DEVICE_ID.format(index),
+            "lastUpdateTime": self.update_time + index,
+            "macAddress": f"00:b0:{index >> 24 & 255:02x}:{index >> 16 & 255:02x}:{index >> 8 & 255:02x}:{index & 255:02x}",
+            "managementIpAddress": self.get_mgmt_address(index),
+            "platformId": "C9300-48U",
+            "reachabilityStatus": "Reachable",
+            "role": "DISTRIBUTION" if index % 25 == 0 else "ACCESS",
+            "serialNumber": f"FBN{index:08d}",
+            "series": "Cisco Catalyst 9300 Series Switches",
+            "softwareType": "IOS-XE",
+            "softwareVersion": "17.9.4a",
+            "type": "Cisco Catalyst 9300 Switch",
+        }
+
+    def get_devices(self, offset: int, limit: int) -> List[dict]:
+        """Get page of Devices starting at 1-based offset."""
+        return [self.get_device(index) for index in range(offset - 1, min(offset - 1 + limit, self.devices))]
+
+    def get_device_detail(self, device_id: str) -> Optional[dict]:
+        """Get details of Device with device_id. Returns None if the Device doesn't exist."""
+        index = self.get_index(device_id)
+        if index is None or index >= self.devices:
+            return None
+        building = index // self.devices_per_building
+        floor_index = building * self.floors + index % self.floors
+        hierarchy = [GLOBAL_ID, AREA_ID.format(building // self.buildings_per_area), BUILDING_ID.format(building)]
+        return {
+            "managementIpAddr": self.get_mgmt_address(index),
+            "nwDeviceId": device_id,
+            "nwDeviceName": self.get_device(index)["hostname"],
+            "platformId": "C9300-48U",
+            "serialNumber": f"FBN{index:08d}",
+            "siteHierarchyGraphId": f"/{'/'.join(hierarchy + [FLOOR_ID.format(floor_index)])}/",
+            "softwareVersion": "17.9.4a",
+        }
+
+    def get_port(self, index: int, port: int) -> dict:
+        """Build interface number port of Device at index as returned by the interface endpoints."""
+        addresses = None
+        if port == 0:
+            name, port_type, mode = "Vlan1", "Ethernet SVI", "routed"
+            addresses = [(self.get_mgmt_address(index), "255.255.255.0")]
+        elif port == 1:
+            name, port_type, mode = "Loopback0", "Ethernet Port", "routed"
+            addresses = [(f"172.{16 + index // 65536 % 16}.{index // 256 % 256}.{index % 256}", "255.255.255.255")]
+        else:
+            name, port_type, mode = f"GigabitEthernet1/0/{port - 1}", "Ethernet Port", "access"
+        return {
+            "addresses": (
+                [
+                    {
+                        "address": {"ipAddress": {"address": host}, "ipMask": {"address": mask}},
+                        "type": "IPV4_PRIMARY",
+                    }
+                    for host, mask in addresses
+                ]
+                if addresses
+                else None
+            ),
+            "adminStatus": "UP",
+            "description": "",
+            "deviceId": DEVICE_ID.format(index),
+            "duplex": "FullDuplex",
+            "id": PORT_ID.format(index, port),
+            "ifIndex": str(port + 1),
+            "interfaceType": "Virtual" if port < 2 else "Physical",
+            "macAddress": f"00:b1:{index >> 16 & 255:02x}:{index >> 8 & 255:02x}:{index & 255:02x}:{port % 256:02x}",
+            "mtu": "1500",
+            "portMode": "trunk" if port == 2 else mode,
+            "portName": name,
+            "portType": port_type,
+            "speed": "1000000",
+            "status": "down" if port % 3 == 2 else "up",
+            "vlanId": "1",
+        }
+
+    def get_ports(self, device_id: str) -> Optional[List[dict]]:
+        """Get interfaces of Device with device_id. Returns None if the Device doesn't exist."""
+        index = self.get_index(device_id)
+        if index is None or index >= self.devices:
+            return None
+        return [self.get_port(index, port) for port in range(self.ports)]
+
+    def interface_count(self) -> int:
+        """Get number of interfaces across all Devices."""
+        return self.devices * self.ports
+
+    def get_interfaces(self, offset: int, limit: int) -> List[dict]:
+        """Get page of interfaces across all Devices starting at 1-based offset."""
+        return [
+            self.get_port(position // self.ports, position % self.ports)
+            for position in range(offset - 1, min(offset - 1 + limit, self.interface_count()))
+        ]
+
+
+class ReplayDataset:
+    """Dataset replayed from a recording of a real DNA Center instance made with `record()`."""
+
+    def __init__(self, path: str):
+        """Load recording from path.
+
+        Args:
+            path (str): Location of the gzip compressed JSON recording.
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            data = json.load(file)
+        self.sites = data["sites"]
+        self.devices = data["devices"]
+        self.details = data["details"]
+        self.ports = data["ports"]
+        self.interfaces = [port for dev in self.devices for port in self.ports.get(dev["id"]) or []]
+
+    def site_count(self) -> int:
+        """Get number of sites."""
+        return len(self.sites)
+
+    def get_sites(self, offset: int, limit: int) -> List[dict]:
+        """Get page of sites starting at 1-based offset."""
+        return get_page(self.sites, offset, limit)
+
+    def device_count(self) -> int:
+        """Get number of Devices."""
+        return len(self.devices)
+
+    def get_devices(self, offset: int, limit: int) -> List[dict]:
+        """Get page of Devices starting at 1-based offset."""
+        return get_page(self.devices, offset, limit)
+
+    def get_device_detail(self, device_id: str) -> Optional[dict]:
+        """Get details of Device with device_id. Returns None if the Device doesn't exist."""
+        return self.details.get(device_id)
+
+    def get_ports(self, device_id: str) -> Optional[List[dict]]:
+        """Get interfaces of Device with device_id. Returns None if the Device doesn't exist."""
+        return self.ports.get(device_id)
+
+    def interface_count(self) -> int:
+        """Get number of interfaces across all Devices."""
+        return len(self.interfaces)
+
+    def get_interfaces(self, offset: int, limit: int) -> List[dict]:
+        """Get page of interfaces across all Devices starting at 1-based offset."""
+        return get_page(self.interfaces, offset, limit)
+
+
+class FakeDnaCenterHandler(BaseHTTPRequestHandler):
+    """Request handler serving the DNA Center endpoints from the server's dataset."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Only log requests when the server is verbose."""
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def send_json(self, data, status: int = 200):
+        """Send data as JSON response."""
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Hand out a token for any credentials."""
+        self.server.record_request("auth")
+        if urlparse(self.path).path != AUTH_PATH:
+            self.send_json({"error": "Not Found"}, status=404)
+            return
+        self.send_json({"Token": "fake-dnac-token"})
+
+    def do_GET(self):  # pylint: disable=invalid-name,too-many-return-statements
+        """Serve site, device and interface endpoints."""
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        path = url.path.replace(API_PREFIX, "", 1) if url.path.startswith(API_PREFIX) else None
+        dataset = self.server.dataset
+        offset = int(params.get("offset", 1))
+        limit = int(params.get("limit", DEFAULT_LIMIT))
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        if path and path.startswith("/interface/network-device/"):
+            self.server.record_request("/interface/network-device/{deviceId}")
+        else:
+            self.server.record_request(path or url.path)
+
+        if path == "/site/count":
+            return self.send_json({"response": dataset.site_count(), "version": "1.0"})
+        if path == "/site":
+            return self.send_json({"response": dataset.get_sites(offset, limit)})
+        if path == "/network-device/count":
+            return self.send_json({"response": dataset.device_count(), "version": "1.0"})
+        if path == "/network-device":
+            return self.send_json({"response": dataset.get_devices(offset, limit), "version": "1.0"})
+        if path == "/interface/count":
+            return self.send_json({"response": dataset.interface_count(), "version": "1.0"})
+        if path == "/interface":
+            return self.send_json({"response": dataset.get_interfaces(offset, limit), "version": "1.0"})
+        if path == "/device-detail":
+            details = dataset.get_device_detail(params.get("searchBy", ""))
+            if details is not None:
+                return self.send_json({"response": details})
+        elif path and path.startswith("/interface/network-device/"):
+            ports = dataset.get_ports(path.rsplit("/", 1)[-1])
+            if ports is not None:
+                return self.send_json({"response": ports, "version": "1.0"})
+        return self.send_json({"error": "Not Found", "path": url.path}, status=404)
+
+
+class FakeDnaCenterServer(ThreadingHTTPServer):
+    """Threaded HTTP server answering DNA Center API requests from a dataset with an optional per-request latency."""
+
+    daemon_threads = True
+
+    def __init__(self, dataset, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, verbose: bool = False):
+        """Initialize server.
+
+        Args:
+            dataset (SyntheticDataset|ReplayDataset): Data to serve.
+            host (str): Address to listen on.
+            port (int): Port to listen on. Defaults to a free port chosen by the OS.
+            latency (float): Number of seconds to delay each API response by.
+            verbose (bool): Whether to log each request.
+        """
+        super().__init__((host, port), FakeDnaCenterHandler)
+        self.dataset = dataset
+        self.latency = latency
+        self.verbose = verbose
+        self.request_counts = Counter()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """URL to pass to DnaCenterClient, without the port."""
+        return f"http://{self.server_address[0]}"
+
+    @property
+    def port(self) -> int:
+        """Port the server is listening on."""
+        return self.server_address[1]
+
+    def record_request(self, endpoint: str):
+        """Count request to endpoint."""
+        with self._lock:
+            self.request_counts[endpoint] += 1
+
+    def start(self):
+        """Serve requests from a background thread. Returns the server so it can be used as a context manager."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving requests and close the socket."""
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        """Start server in the background."""
+        return self.start()
+
+    def __exit__(self, *args):
+        """Stop server."""
+        self.stop()
+
+
+def record(url: str, username: str, password: str, output: str, verify: bool = True, max_workers: int = 10):
+    """Record sites, Devices, device details and interfaces from a DNA Center instance for replay.
+
+    Args:
+        url (str): Base URL of DNA Center including the port, ie https://dnac.example.com:443.
+        username (str): Username to authenticate with.
+        password (str): Password to authenticate with.
+        output (str): Location to write the gzip compressed JSON recording to.
+        verify (bool): Whether to verify the DNA Center SSL certificate.
+        max_workers (int): Number of concurrent requests made for device details and interfaces.
+    """
+    from dnacentersdk import api  # pylint: disable=import-outside-toplevel
+    from dnacentersdk.exceptions import ApiError  # pylint: disable=import-outside-toplevel
+
+    conn = api.DNACenterAPI(base_url=url, username=username, password=password, verify=verify)
+
+    def get_all(count_func, page_func) -> List[dict]:
+        total = count_func()["response"]
+        results = []
+        for offset in range(1, total + 1, DEFAULT_LIMIT):
+            results.extend(page_func(offset=offset, limit=DEFAULT_LIMIT)["response"])
+        return results
+
+    def get_ports(device_id: str) -> Optional[List[dict]]:
+        try:
+            return conn.devices.get_interface_info_by_id(device_id=device_id)["response"]
+        except ApiError:
+            return None
+
+    sites = get_all(conn.sites.get_site_count, conn.sites.get_site)
+    devices = get_all(conn.devices.get_device_count, conn.devices.get_device_list)
+    dev_ids = [dev["id"] for dev in devices]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        details = pool.map(
+            lambda dev_id: conn.devices.get_device_detail(search_by=dev_id, identifier="uuid")["response"], dev_ids
+        )
+        details = dict(zip(dev_ids, details))
+        ports = dict(zip(dev_ids, pool.map(get_ports, dev_ids)))
+    with gzip.open(output, "wt", encoding="utf-8") as file:
+        json.dump({"sites": sites, "devices": devices, "details": details, "ports": ports}, file)
+    print(f"Recorded {len(sites)} sites and {len(devices)} devices to {output}.")
+
+
+def main():
+    """Parse command line arguments and serve or record."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparsers.add_parser("serve", help="Serve synthetic or replayed data.")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="Address to listen on.")
+    serve_parser.add_argument("--port", type=int, default=8443, help="Port to listen on.")
+    serve_parser.add_argument("--latency", type=float, default=0.0, help="Seconds to delay each API response by.")
+    serve_parser.add_argument("--devices", type=int, default=1000, help="Number of synthetic Devices.")
+    serve_parser.add_argument("--ports", type=int, default=30, help="Number of interfaces per synthetic Device.")
+    serve_parser.add_argument("--devices-per-building", type=int, default=50, help="Synthetic Devices per Building.")
+    serve_parser.add_argument("--floors", type=int, default=2, help="Floors per synthetic Building.")
+    serve_parser.add_argument("--update-time", type=int, default=UPDATE_TIME, help="Base lastUpdateTime of Devices.")
+    serve_parser.add_argument("--replay", help="Serve data from a recording instead of synthetic data.")
+    serve_parser.add_argument("--verbose", action="store_true", help="Log each request.")
+
+    record_parser = subparsers.add_parser("record", help="Record data from a DNA Center instance for replay.")
+    record_parser.add_argument("--url", required=True, help="Base URL of DNA Center including the port.")
+    record_parser.add_argument("--username", required=True)
+    record_parser.add_argument("--password", required=True)
+    record_parser.add_argument("--no-verify", action="store_true", help="Skip SSL certificate verification.")
+    record_parser.add_argument("--max-workers", type=int, default=10, help="Number of concurrent requests.")
+    record_parser.add_argument("-o", "--output", default="dnac_recording.json.gz", help="File to write to.")
+
+    args = parser.parse_args()
+    if args.command == "record":
+        record(
+            url=args.url,
+            username=args.username,
+            password=args.password,
+            output=args.output,
+            verify=not args.no_verify,
+            max_workers=args.max_workers,
+        )
+        return
+
+    if args.replay:
+        dataset = ReplayDataset(path=args.replay)
+    else:
+        dataset = SyntheticDataset(
+            devices=args.devices,
+            ports=args.ports,
+            devices_per_building=args.devices_per_building,
+            floors=args.floors,
+            update_time=args.update_time,
+        )
+    server = FakeDnaCenterServer(dataset, host=args.host, port=args.port, latency=args.latency, verbose=args.verbose)
+    print(f"Serving {dataset.device_count()} devices on {server.url}:{server.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
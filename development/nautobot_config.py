@@ -279,6 +279,11 @@ PLUGINS_CONFIG = {
         "import_merakis": is_truthy(os.getenv("NAUTOBOT_DNAC_SSOT_IMPORT_MERAKIS", False)),
         "update_locations": is_truthy(os.getenv("NAUTOBOT_DNAC_SSOT_UPDATE_LOCATIONS", True)),
         "show_failures": is_truthy(os.getenv("NAUTOBOT_DNAC_SSOT_SHOW_FAILURES", True)),
+        "max_workers": int(os.getenv("NAUTOBOT_DNAC_SSOT_MAX_WORKERS", 10)),
+        "fetch_all_interfaces": is_truthy(os.getenv("NAUTOBOT_DNAC_SSOT_FETCH_ALL_INTERFACES", False)),
+        "load_chunk_size": int(os.getenv("NAUTOBOT_DNAC_SSOT_LOAD_CHUNK_SIZE", 2000)),
+        "validate_bulk_updates": is_truthy(os.getenv("NAUTOBOT_DNAC_SSOT_VALIDATE_BULK_UPDATES", False)),
+        "save_batch_size": int(os.getenv("NAUTOBOT_DNAC_SSOT_SAVE_BATCH_SIZE", 0)),
     },
 }
 
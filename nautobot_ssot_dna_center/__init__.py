@@ -20,7 +20,7 @@ class NautobotSsotDnaCenterConfig(PluginConfig):
     required_settings = ["import_global", "update_locations"]
     min_version = "2.0.0"
     max_version = "2.9999"
-    default_settings = {"import_global": True, "update_locations": True}
+    default_settings = {"import_global": True, "update_locations": True, "max_workers": 10, "load_chunk_size": 2000}
     caching_config = {}
 
     def ready(self):
@@ -5,6 +5,9 @@ from django.conf import settings
 # Import config vars from nautobot_config.py
 PLUGIN_CFG = settings.PLUGINS_CONFIG["nautobot_ssot_dna_center"]
 
+# Maximum number of records DNA Center returns in a single page of a list call.
+DNAC_PAGE_SIZE = 500
+
 DNAC_PLATFORM_MAPPER = {
     "IOS": "cisco_ios",
     "IOS-XE": "cisco_ios",
@@ -1,6 +1,6 @@
 """Nautobot SSoT for Cisco DNA Center Adapter for DNA Center SSoT plugin."""
 
-from typing import List
+from typing import Iterator, List, Optional, Tuple
 import json
 from netutils.ip import ipaddress_interface, netmask_to_cidr
 from diffsync import DiffSync
@@ -20,7 +20,8 @@ from nautobot_ssot_dna_center.diffsync.models.dna_center import (
     DnaCenterPort,
     DnaCenterIPAddressonInterface,
 )
-from nautobot_ssot_dna_center.utils.dna_center import DnaCenterClient
+from nautobot_ssot_dna_center.utils.dna_center import DnaCenterClient, build_hostname_role_matcher
+from nautobot_ssot_dna_center.utils.snapshot import DeviceSnapshot
 
 
 class DnaCenterAdapter(DiffSync):
@@ -37,7 +38,16 @@ class DnaCenterAdapter(DiffSync):
 
     top_level = ["area", "building", "device", "prefix", "ipaddress", "ip_on_intf"]
 
-    def __init__(self, *args, job=None, sync=None, client: DnaCenterClient, tenant: Tenant, **kwargs):
+    def __init__(
+        self,
+        *args,
+        job=None,
+        sync=None,
+        client: DnaCenterClient,
+        tenant: Tenant,
+        snapshot: Optional[DeviceSnapshot] = None,
+        **kwargs,
+    ):
         """Initialize DNA Center.
 
         Args:
@@ -45,6 +55,7 @@ class DnaCenterAdapter(DiffSync):
             sync (object, optional): DNA Center DiffSync. Defaults to None.
             client (DnaCenterClient): DNA Center API client connection object.
             tenant (Tenant): Tenant to attach to imported objects. Can be set to None for no Tenant to be attached.
+            snapshot (DeviceSnapshot, optional): Snapshot from the last successful sync for an incremental load.
         """
         super().__init__(*args, **kwargs)
         self.job = job
@@ -53,6 +64,8 @@ class DnaCenterAdapter(DiffSync):
         self.failed_import_devices = []
         self.dnac_location_map = {}
         self.tenant = tenant
+        self.snapshot = snapshot
+        self.unchanged_devices = set()
 
     def load_locations(self):
         """Load location data from DNA Center into DiffSync models."""
@@ -200,6 +213,9 @@ class DnaCenterAdapter(DiffSync):
     def build_dnac_location_map(self, locations: List[dict]):
         """Build out the initial DNAC location map for Location ID to name and type.
 
+        The map is the index of Locations by site ID shared by `parse_and_sort_locations`, the area, building and floor
+        loaders and Device site lookups, so parents are resolved without rescanning the list of Locations.
+
         Args:
             locations (List[dict]): List of Locations (Sites) from DNAC.
 
@@ -218,6 +234,16 @@ class DnaCenterAdapter(DiffSync):
         """Load Device data from DNA Center info DiffSync models."""
         PLUGIN_CFG = settings.PLUGINS_CONFIG["nautobot_ssot_dna_center"]
         devices = self.conn.get_devices()
+        # prefetch Device details concurrently so the loop below doesn't wait on one request per Device
+        device_details = self.get_device_details(
+            devices=[
+                dev
+                for dev in devices
+                if dev.get("hostname") and (PLUGIN_CFG.get("import_merakis") or not self.is_meraki(dev))
+            ]
+        )
+        get_role = build_hostname_role_matcher(PLUGIN_CFG.get("hostname_mapping"))
+        loaded_devices = {}
         for dev in devices:
             platform = "unknown"
             dev_role = "Unknown"
@@ -230,9 +256,7 @@ class DnaCenterAdapter(DiffSync):
                 self.failed_import_devices.append(dev)
                 continue
             if PLUGIN_CFG.get("hostname_mapping"):
-                dev_role = self.conn.parse_hostname_for_role(
-                    hostname_map=PLUGIN_CFG["hostname_mapping"], device_hostname=dev["hostname"]
-                )
+                dev_role = get_role(dev["hostname"])
             if dev_role == "Unknown":
                 dev_role = dev["role"]
             if dev["softwareType"] in DNAC_PLATFORM_MAPPER:
@@ -240,13 +264,13 @@ class DnaCenterAdapter(DiffSync):
             else:
                 if not dev.get("softwareType") and dev.get("type") and ("3800" in dev["type"] or "9130" in dev["type"]):
                     platform = "cisco_ios"
-                if not dev.get("softwareType") and dev.get("family") and "Meraki" in dev["family"]:
+                if self.is_meraki(dev):
                     if not PLUGIN_CFG.get("import_merakis"):
                         continue
                     platform = "cisco_meraki"
             if dev.get("type") and "Juniper" in dev["type"]:
                 vendor = "Juniper"
-            dev_details = self.conn.get_device_detail(dev_id=dev["id"])
+            dev_details = device_details.get(dev["id"], {})
             loc_data = {}
             if dev_details and dev_details.get("siteHierarchyGraphId"):
                 loc_data = self.conn.parse_site_hierarchy(
@@ -299,7 +323,7 @@ class DnaCenterAdapter(DiffSync):
                 )
                 try:
                     self.add(new_dev)
-                    self.load_ports(device_id=dev["id"], dev=new_dev, mgmt_addr=dev["managementIpAddress"])
+                    loaded_devices[dev["id"]] = (new_dev, dev["managementIpAddress"])
                 except ValidationError as err:
                     self.job.logger.warning(f"Unable to load device {dev['hostname']}. {err}")
                     dev["field_validation"] = {
@@ -308,16 +332,89 @@ class DnaCenterAdapter(DiffSync):
                         "location_data": loc_data,
                     }
                     self.failed_import_devices.append(dev)
+        for device_id, ports in self.get_device_ports(device_ids=list(loaded_devices)):
+            new_dev, mgmt_addr = loaded_devices[device_id]
+            self.load_ports(device_id=device_id, dev=new_dev, mgmt_addr=mgmt_addr, ports=ports)
+
+    @staticmethod
+    def is_meraki(device: dict) -> bool:
+        """Determine whether device is a Meraki device, which are only imported if `import_merakis` is enabled.
+
+        Args:
+            device (dict): Device returned by get_devices().
+
+        Returns:
+            bool: Whether device is a Meraki device.
+        """
+        return bool(not device.get("softwareType") and device.get("family") and "Meraki" in device["family"])
+
+    def get_device_details(self, devices: List[dict]) -> dict:
+        """Retrieve details for devices, reusing the snapshot for Devices unchanged since the last successful sync.
+
+        Args:
+            devices (List[dict]): Devices from DNAC to retrieve details for.
+
+        Returns:
+            dict: Dictionary mapping each Device ID to its details.
+        """
+        if not self.snapshot:
+            return self.conn.get_device_details(dev_ids=[dev["id"] for dev in devices])
+        self.unchanged_devices = {dev["id"] for dev in devices if self.snapshot.is_unchanged(dev)}
+        self.job.logger.info(
+            f"Reusing details for {len(self.unchanged_devices)} of {len(devices)} Devices unchanged since last sync."
+        )
+        details = {dev_id: self.snapshot.get_details(dev_id) for dev_id in self.unchanged_devices}
+        details.update(
+            self.conn.get_device_details(
+                dev_ids=[dev["id"] for dev in devices if dev["id"] not in self.unchanged_devices]
+            )
+        )
+        for dev in devices:
+            self.snapshot.record_details(device=dev, details=details[dev["id"]])
+        return details
+
+    def get_device_ports(self, device_ids: List[str]) -> Iterator[Tuple[str, List[dict]]]:
+        """Retrieve interfaces for device_ids, reusing the snapshot for Devices unchanged since the last successful sync.
+
+        Args:
+            device_ids (List[str]): IDs of the Devices to retrieve Ports for.
+
+        Returns:
+            Iterator[Tuple[str, List[dict]]]: Device ID and list of Ports for each Device, in the order of device_ids.
+        """
+        if settings.PLUGINS_CONFIG["nautobot_ssot_dna_center"].get("fetch_all_interfaces"):
+            port_index = self.conn.get_all_interfaces()
+            device_ports = ((device_id, port_index.get(device_id, [])) for device_id in device_ids)
+        else:
+            reused = {
+                device_id
+                for device_id in device_ids
+                if device_id in self.unchanged_devices and self.snapshot.has_ports(device_id)
+            }
+            # interfaces are fetched by a pool of workers while the Port models are built as each result arrives
+            fetched = self.conn.get_port_info_for_devices(
+                device_ids=[device_id for device_id in device_ids if device_id not in reused]
+            )
+            device_ports = (
+                (device_id, self.snapshot.get_ports(device_id)) if device_id in reused else next(fetched)
+                for device_id in device_ids
+            )
+        for device_id, ports in device_ports:
+            if self.snapshot:
+                self.snapshot.record_ports(device_id=device_id, ports=ports)
+            yield device_id, ports
 
-    def load_ports(self, device_id: str, dev: DnaCenterDevice, mgmt_addr: str = ""):
+    def load_ports(self, device_id: str, dev: DnaCenterDevice, mgmt_addr: str = "", ports: Optional[List[dict]] = None):
         """Load port info from DNAC into Port DiffSyncModel.
 
         Args:
             device_id (str): ID for Device in DNAC to retrieve ports for.
             dev (DnaCenterDevice): Device associated with ports.
             mgmt_addr (str): Management IP address for device.
+            ports (List[dict], optional): Ports already retrieved for device. Retrieved from DNAC if not provided.
         """
-        ports = self.conn.get_port_info(device_id=device_id)
+        if ports is None:
+            ports = self.conn.get_port_info(device_id=device_id)
         for port in ports:
             try:
                 found_port = self.get(
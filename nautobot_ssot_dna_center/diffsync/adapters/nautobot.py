@@ -1,26 +1,34 @@
 """Nautobot Adapter for DNA Center SSoT plugin."""
 
 try:
-    from nautobot_device_lifecycle_mgmt.models import SoftwareLCM  # noqa: F401
+    from nautobot_device_lifecycle_mgmt.models import SoftwareLCM
 
     LIFECYCLE_MGMT = True
 except ImportError:
     LIFECYCLE_MGMT = False
 
+import ipaddress
 from collections import defaultdict
+from contextlib import nullcontext
+from itertools import islice
 from typing import Optional
 from diffsync import DiffSync
 from diffsync.enum import DiffSyncModelFlags
 from diffsync.exceptions import ObjectNotFound
+from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.db.models import ProtectedError
+from django.db import transaction
+from django.db.models import OuterRef, ProtectedError, Q, Subquery
 from django.db.utils import IntegrityError
 from nautobot.dcim.models import Device as OrmDevice
+from nautobot.dcim.models import DeviceType as OrmDeviceType
 from nautobot.dcim.models import Interface as OrmInterface
 from nautobot.dcim.models import Location as OrmLocation
 from nautobot.dcim.models import LocationType as OrmLocationType
+from nautobot.dcim.models import Manufacturer as OrmManufacturer
+from nautobot.dcim.models import Platform as OrmPlatform
+from nautobot.extras.models import Role as OrmRole
 from nautobot.extras.models import Status as OrmStatus
-from nautobot.extras.models import Relationship as OrmRelationship
 from nautobot.extras.models import RelationshipAssociation as OrmRelationshipAssociation
 from nautobot.ipam.models import IPAddress as OrmIPAddress
 from nautobot.ipam.models import IPAddressToInterface as OrmIPAddressToInterface
@@ -28,6 +36,8 @@ from nautobot.ipam.models import Namespace
 from nautobot.ipam.models import Prefix as OrmPrefix
 from nautobot.tenancy.models import Tenant as OrmTenant
 from nautobot_ssot.jobs.base import DataTarget
+from nautobot_ssot_dna_center.utils.metrics import SyncMetrics
+from nautobot_ssot_dna_center.utils.nautobot import assign_software_versions
 from nautobot_ssot_dna_center.diffsync.models.nautobot import (
     NautobotArea,
     NautobotBuilding,
@@ -65,9 +75,28 @@ class NautobotAdapter(DiffSync):
     namespace_map = {}
     prefix_map = {}
     ipaddr_map = {}
+    manufacturer_map = {}
+    role_map = {}
+    devicetype_map = {}
+    platform_map = {}
+
+    load_chunk_size = 2000
+
+    update_models = {
+        "devices": (OrmDevice, ()),
+        "interfaces": (OrmInterface, ()),
+        "prefixes": (OrmPrefix, ()),
+        "ipaddresses": (OrmIPAddress, ("parent__namespace",)),
+    }
 
     def __init__(
-        self, *args, job: Optional[DataTarget] = None, sync=None, tenant: Optional[OrmTenant] = None, **kwargs
+        self,
+        *args,
+        job: Optional[DataTarget] = None,
+        sync=None,
+        tenant: Optional[OrmTenant] = None,
+        metrics: Optional[SyncMetrics] = None,
+        **kwargs,
     ):
         """Initialize Nautobot.
 
@@ -75,20 +104,144 @@ class NautobotAdapter(DiffSync):
             job (DataTarget, optional): Nautobot job. Defaults to None.
             sync (object, optional): Nautobot DiffSync. Defaults to None.
             tenant (OrmTenant, optional): Tenant defined in Job form that all non-location objects should belong to.
+            metrics (SyncMetrics, optional): Metrics to record the `sync_complete` phase in. Defaults to None.
         """
         super().__init__(*args, **kwargs)
         self.job = job
         self.sync = sync
         self.tenant = tenant
+        self.metrics = metrics
         self.objects_to_create = defaultdict(list)
         self.objects_to_delete = defaultdict(list)
+        self.objects_to_update = defaultdict(dict)
+        self.prefix_index = {}
+        self.load_chunk_size = settings.PLUGINS_CONFIG["nautobot_ssot_dna_center"].get(
+            "load_chunk_size", self.load_chunk_size
+        )
+
+    def iterate(self, queryset):
+        """Iterate over queryset in chunks of `load_chunk_size` rows instead of caching every result in memory.
+
+        Args:
+            queryset (QuerySet): Query to iterate over.
+
+        Returns:
+            Iterator: Rows of queryset.
+        """
+        return queryset.iterator(chunk_size=self.load_chunk_size)
+
+    def update_object(self, obj_type: str, obj_id, fields: dict, custom_fields: Optional[dict] = None):
+        """Update fields and custom fields of a Nautobot object, deferring the update to sync_complete in bulk import mode.
+
+        Args:
+            obj_type (str): Type of object from `update_models`, ie `devices`.
+            obj_id (UUID): ID of object to update.
+            fields (dict): Model field names, using the attname for foreign keys, mapped to their new value.
+            custom_fields (dict, optional): Custom field keys mapped to their new value.
+        """
+        update = {"fields": fields, "custom_fields": custom_fields or {}}
+        if self.job.bulk_import:
+            queued = self.objects_to_update[obj_type].setdefault(obj_id, {"fields": {}, "custom_fields": {}})
+            queued["fields"].update(update["fields"])
+            queued["custom_fields"].update(update["custom_fields"])
+            return
+        model, related = self.update_models[obj_type]
+        obj = model.objects.select_related(*related).get(id=obj_id)
+        self.apply_update(obj, update)
+        obj.validated_save()
+
+    @staticmethod
+    def apply_update(obj, update: dict) -> tuple:
+        """Set queued field and custom field values on a Nautobot object.
+
+        Args:
+            obj (Model): Nautobot object to update.
+            update (dict): Update with `fields` and `custom_fields` to set.
+
+        Returns:
+            tuple: Names of fields that were changed.
+        """
+        for field, value in update["fields"].items():
+            setattr(obj, field, value)
+        obj.custom_field_data.update(update["custom_fields"])
+        return tuple(sorted(update["fields"])) + (("_custom_field_data",) if update["custom_fields"] else ())
+
+    def bulk_update_objects(self):
+        """Apply queued updates in batches with a bulk_update() per set of changed fields.
+
+        Each batch of objects is fetched with a single query. Objects are validated before saving if the
+        `validate_bulk_updates` setting is enabled.
+        """
+        validate = settings.PLUGINS_CONFIG["nautobot_ssot_dna_center"].get("validate_bulk_updates", False)
+        for obj_type, (model, related) in self.update_models.items():
+            updates = self.objects_to_update.pop(obj_type, {})
+            if not updates:
+                continue
+            self.job.logger.info(f"Performing bulk update of {len(updates)} {obj_type} in Nautobot.")
+            obj_ids = iter(updates)
+            while batch_ids := list(islice(obj_ids, 250)):
+                objs = model.objects.select_related(*related).in_bulk(batch_ids)
+                changed = defaultdict(list)
+                for obj_id in batch_ids:
+                    if obj_id not in objs:
+                        self.job.logger.warning(f"Unable to find {model._meta.verbose_name} {obj_id} to update.")
+                        continue
+                    fields = self.apply_update(objs[obj_id], updates[obj_id])
+                    if validate:
+                        try:
+                            objs[obj_id].full_clean()
+                        except ValidationError as err:
+                            self.job.logger.warning(f"Unable to update {objs[obj_id]}. {err}")
+                            continue
+                    changed[fields].append(objs[obj_id])
+                for fields, changed_objs in changed.items():
+                    if fields:
+                        model.objects.bulk_update(changed_objs, fields)
+
+    def get_prefix_index(self, namespace_id) -> dict:
+        """Get map of CIDR to ID for every Prefix in a Namespace, including Prefixes queued for bulk creation.
+
+        Args:
+            namespace_id (UUID): ID of Namespace to get Prefixes for.
+
+        Returns:
+            dict: Map of Prefix CIDR to ID.
+        """
+        if namespace_id not in self.prefix_index:
+            self.prefix_index[namespace_id] = {
+                f"{network}/{prefix_length}": prefix_id
+                for prefix_id, network, prefix_length in OrmPrefix.objects.filter(
+                    namespace_id=namespace_id
+                ).values_list("id", "network", "prefix_length")
+            }
+        return self.prefix_index[namespace_id]
+
+    def get_closest_prefix_id(self, namespace_id, cidr: str, include_self: bool = False):
+        """Find ID of the most specific Prefix in Namespace containing CIDR without querying the database per object.
+
+        Args:
+            namespace_id (UUID): ID of Namespace to find Prefix in.
+            cidr (str): CIDR of Prefix or host address of IPAddress to find parent for.
+            include_self (bool): Whether a Prefix matching the CIDR itself can be returned.
+
+        Returns:
+            Optional[UUID]: ID of closest parent Prefix or None if no Prefix contains CIDR.
+        """
+        index = self.get_prefix_index(namespace_id)
+        network = ipaddress.ip_network(cidr, strict=False)
+        start = network.prefixlen if include_self else network.prefixlen - 1
+        for prefix_length in range(start, -1, -1):
+            supernet = ipaddress.ip_network(f"{network.network_address}/{prefix_length}", strict=False)
+            if str(supernet) in index:
+                return index[str(supernet)]
+        return None
 
     def load_regions(self):
         """Load Region data from Nautobt into DiffSync models."""
         try:
             loc_type = OrmLocationType.objects.get(name="Region")
-            locations = OrmLocation.objects.filter(location_type=loc_type)
-            for region in locations:
+            locations = OrmLocation.objects.filter(location_type=loc_type).select_related("parent")
+            for region in self.iterate(locations):
                 self.region_map[region.name] = region.id
                 try:
                     self.get(self.area, {"name": region.name, "parent": region.parent.name if region.parent else None})
@@ -109,8 +262,8 @@ class NautobotAdapter(DiffSync):
         """Load Site data from Nautobot into DiffSync models."""
         try:
             loc_type = OrmLocationType.objects.get(name="Site")
-            locations = OrmLocation.objects.filter(location_type=loc_type)
-            for site in locations:
+            locations = OrmLocation.objects.filter(location_type=loc_type).select_related("parent", "tenant")
+            for site in self.iterate(locations):
                 self.site_map[site.name] = site.id
                 try:
                     self.get(self.building, {"name": site.name, "area": site.parent.name if site.parent else None})
@@ -132,8 +285,8 @@ class NautobotAdapter(DiffSync):
         """Load LocationType floors from Nautobot into DiffSync models."""
         try:
             loc_type = OrmLocationType.objects.get(name="Floor")
-            locations = OrmLocation.objects.filter(location_type=loc_type)
-            for location in locations:
+            locations = OrmLocation.objects.filter(location_type=loc_type).select_related("parent", "tenant")
+            for location in self.iterate(locations):
                 self.floor_map[location.name] = location.id
                 new_floor = self.floor(
                     name=location.name,
@@ -154,66 +307,111 @@ class NautobotAdapter(DiffSync):
             self.job.logger.warning(f"Unable to find LocationType: Floor so can't find floor Locations to load. {err}")
 
     def load_devices(self):
-        """Load Device data from Nautobot into DiffSync models."""
+        """Load Device data from Nautobot into DiffSync models.
+
+        The Device columns and those of its related objects are read as joined values rows so the number of queries
+        doesn't grow with the number of Devices.
+        """
         if self.tenant:
             devices = OrmDevice.objects.filter(tenant=self.tenant)
         else:
             devices = OrmDevice.objects.filter(_custom_field_data__system_of_record="DNA Center")
-        for dev in devices:
-            self.device_map[dev.name] = dev.id
-            version = dev.custom_field_data.get("os_version")
-            if LIFECYCLE_MGMT:
-                try:
-                    soft_lcm = OrmRelationship.objects.get(label="Software on Device")
-                    version = OrmRelationshipAssociation.objects.get(
-                        relationship=soft_lcm, destination_id=dev.id
-                    ).source.version
-                except OrmRelationshipAssociation.DoesNotExist:
-                    pass
+        software_versions = self.get_software_versions(devices=devices)
+        rows = devices.values(
+            "id",
+            "name",
+            "serial",
+            "_custom_field_data",
+            "status__name",
+            "role__name",
+            "device_type__manufacturer__name",
+            "device_type__model",
+            "location__name",
+            "location__parent__name",
+            "platform__network_driver",
+            "tenant__name",
+        )
+        for dev in self.iterate(rows):
+            self.device_map[dev["name"]] = dev["id"]
+            version = software_versions.get(dev["id"], dev["_custom_field_data"].get("os_version"))
             new_dev = self.device(
-                name=dev.name,
-                status=dev.status.name,
-                role=dev.role.name,
-                vendor=dev.device_type.manufacturer.name,
-                model=dev.device_type.model,
-                site=dev.location.parent.name if dev.location.parent else None,
-                floor=dev.location.name if dev.location else None,
-                serial=dev.serial,
+                name=dev["name"],
+                status=dev["status__name"],
+                role=dev["role__name"],
+                vendor=dev["device_type__manufacturer__name"],
+                model=dev["device_type__model"],
+                site=dev["location__parent__name"],
+                floor=dev["location__name"],
+                serial=dev["serial"],
                 version=version,
-                platform=dev.platform.network_driver if dev.platform else "",
-                tenant=dev.tenant.name if dev.tenant else None,
-                uuid=dev.id,
+                platform=dev["platform__network_driver"] or "",
+                tenant=dev["tenant__name"],
+                uuid=dev["id"],
             )
             if self.tenant:
                 new_dev.model_flags = DiffSyncModelFlags.SKIP_UNMATCHED_DST
             self.add(new_dev)
 
+    @staticmethod
+    def get_software_versions(devices) -> dict:
+        """Get version of the SoftwareLCM related to each of devices by the Software on Device Relationship.
+
+        Args:
+            devices (QuerySet): Devices to get software versions for.
+
+        Returns:
+            dict: Dictionary mapping Device ID to version. Empty if Device Lifecycle Management isn't installed.
+        """
+        if not LIFECYCLE_MGMT:
+            return {}
+        associations = OrmRelationshipAssociation.objects.filter(
+            relationship__label="Software on Device", destination_id__in=devices.values("id")
+        ).annotate(version=Subquery(SoftwareLCM.objects.filter(id=OuterRef("source_id")).values("version")[:1]))
+        return dict(associations.values_list("destination_id", "version"))
+
     def load_ports(self):
-        """Load Interface data from Nautobot into DiffSync models."""
+        """Load Interface data from Nautobot into DiffSync models.
+
+        Only the needed columns, with the Device and Status names joined in, are streamed from the database as tuples
+        in chunks of `load_chunk_size` rows. Interfaces are ordered by Device so the parent Device is only looked up
+        once per Device.
+        """
         if self.tenant:
             ports = OrmInterface.objects.filter(device__tenant=self.tenant)
         else:
             ports = OrmInterface.objects.filter(device___custom_field_data__system_of_record="DNA Center")
-        for port in ports:
-            if port.device.name not in self.port_map:
-                self.port_map[port.device.name] = {}
-            self.port_map[port.device.name][port.name] = port.id
+        rows = ports.order_by("device").values_list(
+            "id",
+            "name",
+            "device__name",
+            "description",
+            "enabled",
+            "type",
+            "mode",
+            "mac_address",
+            "mtu",
+            "status__name",
+        )
+        device = None
+        for port_id, name, dev_name, description, enabled, port_type, mode, mac_addr, mtu, status in self.iterate(rows):
+            self.port_map.setdefault(dev_name, {})[name] = port_id
             new_port = self.port(
-                name=port.name,
-                device=port.device.name,
-                description=port.description,
-                enabled=port.enabled,
-                port_type=port.type,
-                port_mode=port.mode,
-                mac_addr=str(port.mac_address) if getattr(port, "mac_address") else None,
-                mtu=port.mtu if port.mtu else 1500,
-                status=port.status.name,
-                uuid=port.id,
+                name=name,
+                device=dev_name,
+                description=description,
+                enabled=enabled,
+                port_type=port_type,
+                port_mode=mode,
+                mac_addr=str(mac_addr) if mac_addr else None,
+                mtu=mtu if mtu else 1500,
+                status=status,
+                uuid=port_id,
             )
             if self.tenant:
                 new_port.model_flags = DiffSyncModelFlags.SKIP_UNMATCHED_DST
             self.add(new_port)
-            device = self.get(self.device, port.device.name)
+            if device is None or device.name != dev_name:
+                device = self.get(self.device, dev_name)
             device.add_child(new_port)
 
     def load_prefixes(self):
@@ -222,7 +420,7 @@ class NautobotAdapter(DiffSync):
             prefixes = OrmPrefix.objects.filter(tenant=self.tenant)
         else:
             prefixes = OrmPrefix.objects.filter(_custom_field_data__system_of_record="DNA Center")
-        for prefix in prefixes:
+        for prefix in self.iterate(prefixes.select_related("namespace", "tenant")):
             self.prefix_map[str(prefix.prefix)] = prefix.id
             new_prefix = self.prefix(
                 prefix=str(prefix.prefix),
@@ -240,7 +438,7 @@ class NautobotAdapter(DiffSync):
             addresses = OrmIPAddress.objects.filter(tenant=self.tenant)
         else:
             addresses = OrmIPAddress.objects.filter(_custom_field_data__system_of_record="DNA Center")
-        for ipaddr in addresses:
+        for ipaddr in self.iterate(addresses.select_related("parent__namespace", "tenant")):
             self.ipaddr_map[str(ipaddr.host)] = ipaddr.id
             new_ipaddr = self.ipaddress(
                 host=str(ipaddr.host),
@@ -253,24 +451,42 @@ class NautobotAdapter(DiffSync):
                 new_ipaddr.model_flags = DiffSyncModelFlags.SKIP_UNMATCHED_DST
             self.add(new_ipaddr)
 
+    @staticmethod
+    def get_primary_ip_ids(ip_ids) -> set:
+        """Get IDs of the IP Addresses among ip_ids that are the primary IPv4 or IPv6 address of any Device.
+
+        Args:
+            ip_ids (QuerySet): IP Address IDs to check.
+
+        Returns:
+            set: IDs of the primary IP Addresses.
+        """
+        primary_ips = OrmDevice.objects.filter(Q(primary_ip4__in=ip_ids) | Q(primary_ip6__in=ip_ids)).values_list(
+            "primary_ip4", "primary_ip6"
+        )
+        return {ip_id for pair in primary_ips for ip_id in pair if ip_id}
+
     def load_ipaddress_to_interface(self):
-        """Load IPAddressonInterface data from Nautobot into DiffSync models."""
+        """Load IPAddressonInterface data from Nautobot into DiffSync models.
+
+        The IP Addresses that are primary on a Device are found with one query up front and the mappings are read with
+        their host, Interface and Device names as joined values rows, so two queries are made in total.
+        """
         if self.tenant:
             mappings = OrmIPAddressToInterface.objects.filter(ip_address__tenant=self.tenant)
         else:
             mappings = OrmIPAddressToInterface.objects.filter(
                 ip_address___custom_field_data__system_of_record="DNA Center"
             )
-        for mapping in mappings:
+        primary_ip_ids = self.get_primary_ip_ids(ip_ids=mappings.values("ip_address"))
+        rows = mappings.values("id", "ip_address", "ip_address__host", "interface__name", "interface__device__name")
+        for mapping in self.iterate(rows):
             new_ipaddr_to_interface = self.ip_on_intf(
-                host=str(mapping.ip_address.host),
-                device=mapping.interface.device.name,
-                port=mapping.interface.name,
-                primary=bool(
-                    len(mapping.ip_address.primary_ip4_for.all()) > 0
-                    or len(mapping.ip_address.primary_ip6_for.all()) > 0
-                ),
-                uuid=mapping.id,
+                host=str(mapping["ip_address__host"]),
+                device=mapping["interface__device__name"],
+                port=mapping["interface__name"],
+                primary=mapping["ip_address"] in primary_ip_ids,
+                uuid=mapping["id"],
             )
             if self.tenant:
                 new_ipaddr_to_interface.model_flags = DiffSyncModelFlags.SKIP_UNMATCHED_DST
@@ -285,23 +501,80 @@ class NautobotAdapter(DiffSync):
         Args:
             source (DiffSync): DiffSync
         """
-        for grouping in ["ipaddresses", "prefixes", "ports", "devices", "floors", "sites", "regions"]:
-            for nautobot_obj in self.objects_to_delete[grouping]:
-                try:
-                    self.job.logger.info(f"Deleting {nautobot_obj}.")
-                    nautobot_obj.delete()
-                except ProtectedError:
-                    self.job.logger.info(f"Deletion failed protected object: {nautobot_obj}")
-            self.objects_to_delete[grouping] = []
+        with self.metrics.phase("sync_complete") if self.metrics else nullcontext():
+            for grouping in ["ipaddresses", "prefixes", "ports", "devices", "floors", "sites", "regions"]:
+                if self.job.bulk_import and self.objects_to_delete[grouping]:
+                    self.job.logger.info(f"Deleting {len(self.objects_to_delete[grouping])} {grouping}.")
+                    self.bulk_delete(self.objects_to_delete[grouping])
+                else:
+                    for nautobot_obj in self.objects_to_delete[grouping]:
+                        try:
+                            self.job.logger.info(f"Deleting {nautobot_obj}.")
+                            nautobot_obj.delete()
+                        except ProtectedError:
+                            self.job.logger.info(f"Deletion failed protected object: {nautobot_obj}")
+                self.objects_to_delete[grouping] = []
 
-        if self.job.bulk_import:
-            self.bulk_create_update()
-        else:
-            self.update_database()
+            if self.job.bulk_import:
+                self.bulk_create_update()
+            else:
+                self.update_database()
+            if LIFECYCLE_MGMT and self.objects_to_create["software_versions"]:
+                self.job.logger.info("Performing assignment of Device software versions in Nautobot.")
+                assign_software_versions(diffsync=self, software_versions=self.objects_to_create["software_versions"])
+                self.objects_to_create["software_versions"] = []
         return super().sync_complete(source, *args, **kwargs)
 
+    def bulk_delete(self, objects: list):
+        """Delete objects of the same type with a single query by primary key.
+
+        If any object is protected the batch is split in half and each half deleted separately, down to deleting the
+        protected objects one at a time so their own delete() can resolve the protection, ie reparenting Prefixes.
+
+        Args:
+            objects (list): Nautobot objects of a single model to delete.
+        """
+        if len(objects) == 1:
+            try:
+                objects[0].delete()
+            except ProtectedError:
+                self.job.logger.info(f"Deletion failed protected object: {objects[0]}")
+            return
+        try:
+            objects[0]._meta.model.objects.filter(pk__in=[obj.pk for obj in objects]).delete()
+        except ProtectedError:
+            middle = len(objects) // 2
+            self.bulk_delete(objects[:middle])
+            self.bulk_delete(objects[middle:])
+
+    def save_in_batches(self, obj_type: str, objects: list, batch_size: int):
+        """Validate and save objects in transactions of batch_size objects instead of committing each one.
+
+        Each object is saved in its own savepoint so an object that fails to save doesn't roll back the rest of its
+        batch. Progress is logged once per batch.
+
+        Args:
+            obj_type (str): Type of objects being saved for logging, ie `devices`.
+            objects (list): Nautobot objects to save.
+            batch_size (int): Number of objects to save in each transaction.
+        """
+        saved, processed = 0, 0
+        objects_iter = iter(objects)
+        while batch := list(islice(objects_iter, batch_size)):
+            with transaction.atomic():
+                for nautobot_obj in batch:
+                    try:
+                        with transaction.atomic():
+                            nautobot_obj.validated_save()
+                        saved += 1
+                    except (ValidationError, IntegrityError) as err:
+                        self.job.logger.warning(f"Unable to save {nautobot_obj}. {err}")
+            processed += len(batch)
+            self.job.logger.info(f"Saved {saved} of {processed}/{len(objects)} {obj_type} processed.")
+
     def update_database(self):
         """Perform databse update using normal operations."""
+        save_batch_size = settings.PLUGINS_CONFIG["nautobot_ssot_dna_center"].get("save_batch_size")
         for obj_type in [
             "devices",
             "interfaces",
@@ -309,6 +582,9 @@ class NautobotAdapter(DiffSync):
         ]:
             if len(self.objects_to_create[obj_type]) > 0:
                 self.job.logger.info(f"Importing {len(self.objects_to_create[obj_type])} {obj_type} into Nautobot.")
+                if save_batch_size:
+                    self.save_in_batches(obj_type, self.objects_to_create[obj_type], save_batch_size)
+                    continue
                 for nautobot_obj in self.objects_to_create[obj_type]:
                     try:
                         self.job.logger.info(f"Saving {nautobot_obj}.")
@@ -317,28 +593,7 @@ class NautobotAdapter(DiffSync):
                         self.job.logger.warning(f"Unable to save {nautobot_obj}. {err}")
                     except IntegrityError as err:
                         self.job.logger.warning(f"Unable to save {nautobot_obj}. {err}")
-        if len(self.objects_to_create["primary_ip4"]) > 0:
-            self.job.logger.info("Performing assignment of device management IPv4 addresses in Nautobot.")
-            for _dev in self.objects_to_create["primary_ip4"]:
-                try:
-                    dev = OrmDevice.objects.get(id=_dev[0])
-                    dev.primary_ip4_id = _dev[1]
-                    dev.validated_save()
-                except OrmDevice.DoesNotExist as err:
-                    self.job.logger.warning(f"Unable to find Device ID {_dev[0]}. {err}")
-                except ValidationError as err:
-                    self.job.logger.warning(f"Unable to save Device {dev.name}. {err}")
-        if len(self.objects_to_create["primary_ip6"]) > 0:
-            self.job.logger.info("Performing assignment of device management IPv6 addresses in Nautobot.")
-            for _dev in self.objects_to_create["primary_ip6"]:
-                try:
-                    dev = OrmDevice.objects.get(id=_dev[0])
-                    dev.primary_ip6_id = _dev[1]
-                    dev.validated_save()
-                except OrmDevice.DoesNotExist as err:
-                    self.job.logger.warning(f"Unable to find Device ID {_dev[0]}. {err}")
-                except ValidationError as err:
-                    self.job.logger.warning(f"Unable to save Device {dev.name}. {err}")
+        self.assign_primary_ips(validate=True)
 
     def bulk_create_update(self):
         """Perform database update using bulk operations."""
@@ -348,25 +603,62 @@ class NautobotAdapter(DiffSync):
         if len(self.objects_to_create["interfaces"]) > 0:
             self.job.logger.info("Performing bulk create of Interfaces in Nautobot")
             OrmInterface.objects.bulk_create(self.objects_to_create["interfaces"], batch_size=250)
+        if len(self.objects_to_create["prefixes"]) > 0:
+            self.job.logger.info("Performing bulk create of Prefixes in Nautobot")
+            self.bulk_create_prefixes(self.objects_to_create["prefixes"])
+        if len(self.objects_to_create["ipaddresses"]) > 0:
+            self.job.logger.info("Performing bulk create of IPAddresses in Nautobot")
+            OrmIPAddress.objects.bulk_create(self.objects_to_create["ipaddresses"], batch_size=250)
         if len(self.objects_to_create["mappings"]) > 0:
             self.job.logger.info("Performing assignment of IPAddress to Interface.")
             OrmIPAddressToInterface.objects.bulk_create(self.objects_to_create["mappings"], batch_size=250)
-        if len(self.objects_to_create["primary_ip4"]) > 0:
-            self.job.logger.info("Performing bulk update of device primary IPv4 addresses in Nautobot.")
-            device_primary_ip_objs = []
-            for d in self.objects_to_create["primary_ip4"]:
-                dev = OrmDevice.objects.get(id=d[0])
-                dev.primary_ip4_id = d[1]
-                device_primary_ip_objs.append(dev)
-            OrmDevice.objects.bulk_update(device_primary_ip_objs, ["primary_ip4_id"], batch_size=250)
-        if len(self.objects_to_create["primary_ip6"]) > 0:
-            self.job.logger.info("Performing bulk update of device primary IPv6 addresses in Nautobot.")
-            device_primary_ip_objs = []
-            for d in self.objects_to_create["primary_ip6"]:
-                dev = OrmDevice.objects.get(id=d[0])
-                dev.primary_ip6_id = d[1]
-                device_primary_ip_objs.append(dev)
-            OrmDevice.objects.bulk_update(device_primary_ip_objs, ["primary_ip6_id"], batch_size=250)
+        self.bulk_update_objects()
+        self.assign_primary_ips(validate=False)
+
+    def assign_primary_ips(self, validate: bool):
+        """Assign queued primary IPv4 and IPv6 addresses to Devices.
+
+        Args:
+            validate (bool): Whether to save each Device with validated_save() so change logging and signals still
+                apply. Devices are fetched with a single query per IP version either way. Without validation all
+                primary IPs of an IP version are written with a single bulk update from unsaved Device instances.
+        """
+        for version in [4, 6]:
+            field = f"primary_ip{version}_id"
+            assignments = dict(self.objects_to_create[f"primary_ip{version}"])
+            if not assignments:
+                continue
+            self.job.logger.info(f"Performing assignment of device management IPv{version} addresses in Nautobot.")
+            if not validate:
+                devices = [OrmDevice(id=dev_id, **{field: ip_id}) for dev_id, ip_id in assignments.items()]
+                OrmDevice.objects.bulk_update(devices, [field], batch_size=250)
+                continue
+            devices = OrmDevice.objects.in_bulk(list(assignments))
+            for dev_id in assignments.keys() - devices.keys():
+                self.job.logger.warning(f"Unable to find Device ID {dev_id}.")
+            for dev_id, dev in devices.items():
+                setattr(dev, field, assignments[dev_id])
+                try:
+                    dev.validated_save()
+                except ValidationError as err:
+                    self.job.logger.warning(f"Unable to save Device {dev.name}. {err}")
+
+    def bulk_create_prefixes(self, prefixes: list):
+        """Bulk create Prefixes with their parents assigned, then reparent existing Prefixes and IPAddresses under them.
+
+        Prefix.save() finds the parent and reparents children one Prefix at a time, which bulk_create() skips. Parents
+        are assigned from the Prefix index instead, creating less specific Prefixes first.
+
+        Args:
+            prefixes (list): Prefixes to create.
+        """
+        prefixes = sorted(prefixes, key=lambda pf: pf.prefix_length)
+        for prefix in prefixes:
+            prefix.parent_id = self.get_closest_prefix_id(prefix.namespace_id, str(prefix.prefix))
+        OrmPrefix.objects.bulk_create(prefixes, batch_size=250)
+        for prefix in prefixes:
+            prefix.reparent_subnets()
+            prefix.reparent_ips()
 
     def load(self):
         """Load data from Nautobot into DiffSync models."""
@@ -374,6 +666,18 @@ class NautobotAdapter(DiffSync):
         self.status_map = {status.name: status.id for status in OrmStatus.objects.only("id", "name")}
         self.tenant_map = {tenant.name: tenant.id for tenant in OrmTenant.objects.only("id", "name")}
         self.namespace_map = {ns.name: ns.id for ns in Namespace.objects.only("id", "name")}
+        self.manufacturer_map = {manu.name: manu.id for manu in OrmManufacturer.objects.only("id", "name")}
+        self.role_map = {role.name: role.id for role in OrmRole.objects.only("id", "name")}
+        self.devicetype_map = {
+            (manu, model): dt_id
+            for dt_id, manu, model in OrmDeviceType.objects.values_list("id", "manufacturer__name", "model")
+        }
+        self.platform_map = {
+            driver: platform_id
+            for platform_id, driver in OrmPlatform.objects.exclude(network_driver="").values_list(
+                "id", "network_driver"
+            )
+        }
 
         self.load_regions()
         self.load_sites()
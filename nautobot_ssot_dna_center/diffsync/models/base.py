@@ -1,9 +1,58 @@
 """DiffSyncModel subclasses for Nautobot-to-DNA Center data sync."""
 
+import sys
 from typing import Optional, List
 from uuid import UUID
 from diffsync import DiffSyncModel
 from diffsync.enum import DiffSyncModelFlags
+from pydantic import validator
+
+# Shared sets of explicitly set field names, keyed by model class and field names.
+_FIELDS_SETS = {}
+# Shared instances of integer values, which unlike small integers aren't cached by Python.
+_INTEGERS = {}
+
+
+def intern_value(value):
+    """Get the single shared instance of a string or integer value repeated across many models.
+
+    Args:
+        value (Optional[Union[str, int]]): Value to intern.
+
+    Returns:
+        Optional[Union[str, int]]: Interned value or value unchanged if it isn't a string or integer.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, int):
+        return _INTEGERS.setdefault(value, value)
+    return value
+
+
+class CompactModel(DiffSyncModel):
+    """DiffSyncModel holding less memory per instance for models loaded in large numbers.
+
+    Pydantic keeps a set of the field names explicitly set on every instance, which is larger than the values of most
+    models. Instances of the same model with the same fields set share a single set instead. Assigning a field that
+    isn't in the set, such as `diffsync` when the model is added to an adapter, switches to the shared set including
+    that field, so shared sets are never changed and each instance still reports its own set fields.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize model, sharing the set of explicitly set field names with earlier instances."""
+        super().__init__(*args, **kwargs)
+        object.__setattr__(self, "__fields_set__", self._get_fields_set(self.__fields_set__))
+
+    def __setattr__(self, name, value):
+        """Set attribute, switching to the shared set of explicitly set field names including the field first."""
+        if name in self.__fields__ and name not in self.__fields_set__:
+            object.__setattr__(self, "__fields_set__", self._get_fields_set(self.__fields_set__ | {name}))
+        super().__setattr__(name, value)
+
+    @classmethod
+    def _get_fields_set(cls, fields_set: set) -> set:
+        """Get the set of explicitly set field names shared by instances of the model with the same fields set."""
+        return _FIELDS_SETS.setdefault((cls, frozenset(fields_set)), fields_set)
 
 
 class Area(DiffSyncModel):
@@ -94,7 +143,7 @@ class Device(DiffSyncModel):
     uuid: Optional[UUID]
 
 
-class Port(DiffSyncModel):
+class Port(CompactModel):
     """DiffSync model for DNA Center interfaces."""
 
     _modelname = "port"
@@ -114,6 +163,8 @@ class Port(DiffSyncModel):
 
     uuid: Optional[UUID]
 
+    _intern = validator("name", "device", "port_type", "port_mode", "mtu", "status", allow_reuse=True)(intern_value)
+
 
 class Prefix(DiffSyncModel):
     """DiffSync Model for DNA Center prefixes."""
@@ -129,7 +180,7 @@ class Prefix(DiffSyncModel):
     uuid: Optional[UUID]
 
 
-class IPAddress(DiffSyncModel):
+class IPAddress(CompactModel):
     """DiffSync model for DNA Center IP addresses."""
 
     _modelname = "ipaddress"
@@ -144,8 +195,10 @@ class IPAddress(DiffSyncModel):
 
     uuid: Optional[UUID]
 
+    _intern = validator("namespace", "tenant", allow_reuse=True)(intern_value)
+
 
-class IPAddressOnInterface(DiffSyncModel):
+class IPAddressOnInterface(CompactModel):
     """DiffSync model for DNA Center tracking IPAddress on particular Device interfaces."""
 
     _modelname = "ip_on_intf"
@@ -160,6 +213,8 @@ class IPAddressOnInterface(DiffSyncModel):
 
     uuid: Optional[UUID]
 
+    _intern = validator("device", "port", allow_reuse=True)(intern_value)
+
 
 Area.update_forward_refs()
 Building.update_forward_refs()
@@ -2,20 +2,20 @@
 
 from datetime import datetime
 from django.conf import settings
-from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from nautobot.dcim.models import (
     Device,
-    DeviceType,
     Interface,
-    Manufacturer,
     Location,
     LocationType,
 )
-from nautobot.extras.models import Role
 from nautobot.ipam.models import IPAddress, IPAddressToInterface, Prefix, Namespace
 from nautobot_ssot_dna_center.diffsync.models import base
-from nautobot_ssot_dna_center.utils.nautobot import add_software_lcm, assign_version_to_device, verify_platform
+from nautobot_ssot_dna_center.utils.nautobot import (
+    get_device_type_id,
+    get_platform_id,
+    get_role_id,
+)
 
 try:
     import nautobot_device_lifecycle_mgmt  # noqa: F401
@@ -165,21 +165,16 @@ class NautobotDevice(base.Device):
         """Create Device in Nautobot from NautobotDevice object."""
         if diffsync.job.debug:
             diffsync.job.logger.info(f"Creating Device {ids['name']}.")
-        manufacturer, _ = Manufacturer.objects.get_or_create(name=attrs["vendor"])
-        device_role, created = Role.objects.get_or_create(name=attrs["role"])
-        if created:
-            device_role.content_types.add(ContentType.objects.get_for_model(Device))
-            device_role.validated_save()
-        device_type, _ = DeviceType.objects.get_or_create(model=attrs["model"], manufacturer=manufacturer)
-        platform = verify_platform(platform_name=attrs["platform"], manu=manufacturer.id)
         new_device = Device(
             name=ids["name"],
             status_id=diffsync.status_map[attrs["status"]],
-            role=device_role,
+            role_id=get_role_id(diffsync=diffsync, name=attrs["role"]),
             location_id=diffsync.site_map[attrs["site"]],
-            device_type=device_type,
+            device_type_id=get_device_type_id(diffsync=diffsync, model=attrs["model"], manufacturer=attrs["vendor"]),
             serial=attrs["serial"],
-            platform_id=platform.id,
+            platform_id=get_platform_id(
+                diffsync=diffsync, network_driver=attrs["platform"], manufacturer=attrs["vendor"]
+            ),
         )
         if attrs.get("floor"):
             new_device.location_id = diffsync.floor_map[attrs["floor"]]
@@ -188,10 +183,9 @@ class NautobotDevice(base.Device):
         if attrs.get("version"):
             new_device.custom_field_data.update({"os_version": attrs["version"]})
             if LIFECYCLE_MGMT:
-                lcm_obj = add_software_lcm(
-                    diffsync=diffsync, platform=platform.network_driver, version=attrs["version"]
+                diffsync.objects_to_create["software_versions"].append(
+                    (new_device.id, attrs["platform"], attrs["version"])
                 )
-                assign_version_to_device(diffsync=diffsync, device=new_device, software_lcm=lcm_obj)
         new_device.custom_field_data.update({"system_of_record": "DNA Center"})
         new_device.custom_field_data.update({"ssot_last_synchronized": datetime.today().date().isoformat()})
         diffsync.objects_to_create["devices"].append(new_device)
@@ -200,48 +194,41 @@ class NautobotDevice(base.Device):
 
     def update(self, attrs):
         """Update Device in Nautobot from NautobotDevice object."""
-        device = Device.objects.get(id=self.uuid)
         if self.diffsync.job.debug:
-            self.diffsync.job.logger.info(f"Updating Device {device.name} with {attrs}")
+            self.diffsync.job.logger.info(f"Updating Device {self.name} with {attrs}")
+        fields = {}
         if "status" in attrs:
-            device.status_id = self.diffsync.status_map[attrs["status"]]
+            fields["status_id"] = self.diffsync.status_map[attrs["status"]]
         if "role" in attrs:
-            dev_role, created = Role.objects.get_or_create(name=attrs["role"])
-            device.role = dev_role
-            if created:
-                dev_role.content_types.add(ContentType.objects.get_for_model(Device))
+            fields["role_id"] = get_role_id(diffsync=self.diffsync, name=attrs["role"])
         if attrs.get("site"):
-            device.location_id = self.diffsync.site_map[attrs["site"]]
+            fields["location_id"] = self.diffsync.site_map[attrs["site"]]
         if attrs.get("floor"):
-            device.location_id = self.diffsync.floor_map[attrs["floor"]]
+            fields["location_id"] = self.diffsync.floor_map[attrs["floor"]]
+        vendor = attrs["vendor"] if attrs.get("vendor") else self.vendor
         if "model" in attrs:
-            if attrs.get("vendor"):
-                vendor = Manufacturer.objects.get_or_create(name=attrs["vendor"])[0]
-            else:
-                vendor = Manufacturer.objects.get_or_create(name=self.vendor)[0]
-            device.device_type = DeviceType.objects.get_or_create(model=attrs["model"], manufacturer=vendor)[0]
+            fields["device_type_id"] = get_device_type_id(
+                diffsync=self.diffsync, model=attrs["model"], manufacturer=vendor
+            )
         if "serial" in attrs:
-            device.serial = attrs["serial"]
+            fields["serial"] = attrs["serial"]
         if "platform" in attrs:
-            vendor = attrs["vendor"] if attrs.get("vendor") else self.vendor
-            manufacturer = Manufacturer.objects.get(name=vendor)
-            device.platform = verify_platform(platform_name=attrs["platform"], manu=manufacturer.id)
+            fields["platform_id"] = get_platform_id(
+                diffsync=self.diffsync, network_driver=attrs["platform"], manufacturer=vendor
+            )
         if "tenant" in attrs:
-            if attrs.get("tenant"):
-                device.tenant_id = self.diffsync.tenant_map[attrs["tenant"]]
-            else:
-                device.tenant = None
+            fields["tenant_id"] = self.diffsync.tenant_map[attrs["tenant"]] if attrs.get("tenant") else None
+        custom_fields = {}
         if "version" in attrs:
-            device.custom_field_data.update({"os_version": attrs["version"]})
+            custom_fields["os_version"] = attrs["version"]
             if LIFECYCLE_MGMT:
                 platform_network_driver = attrs["platform"] if attrs.get("platform") else self.platform
-                lcm_obj = add_software_lcm(
-                    diffsync=self.diffsync, platform=platform_network_driver, version=attrs["version"]
+                self.diffsync.objects_to_create["software_versions"].append(
+                    (self.uuid, platform_network_driver, attrs["version"])
                 )
-                assign_version_to_device(diffsync=self.diffsync, device=device, software_lcm=lcm_obj)
-        device.custom_field_data.update({"system_of_record": "DNA Center"})
-        device.custom_field_data.update({"ssot_last_synchronized": datetime.today().date().isoformat()})
-        device.validated_save()
+        custom_fields.update({"system_of_record": "DNA Center"})
+        custom_fields.update({"ssot_last_synchronized": datetime.today().date().isoformat()})
+        self.diffsync.update_object("devices", self.uuid, fields, custom_fields)
         return super().update(attrs)
 
     def delete(self):
@@ -284,26 +271,26 @@ class NautobotPort(base.Port):
 
     def update(self, attrs):
         """Update Interface in Nautobot from Port object."""
-        port = Interface.objects.get(id=self.uuid)
         if self.diffsync.job.debug:
-            self.diffsync.job.logger.info(f"Updating Port {port.name} for Device {port.device.name}.")
+            self.diffsync.job.logger.info(f"Updating Port {self.name} for Device {self.device}.")
+        fields = {}
         if "description" in attrs:
-            port.description = attrs["description"]
+            fields["description"] = attrs["description"]
         if "mac_addr" in attrs:
-            port.mac_address = attrs["mac_addr"]
+            fields["mac_address"] = attrs["mac_addr"]
         if "port_type" in attrs:
-            port.type = attrs["port_type"]
+            fields["type"] = attrs["port_type"]
         if "port_mode" in attrs:
-            port.mode = attrs["port_mode"]
+            fields["mode"] = attrs["port_mode"]
         if "mtu" in attrs:
-            port.mtu = attrs["mtu"]
+            fields["mtu"] = attrs["mtu"]
         if "status" in attrs:
-            port.status_id = self.diffsync.status_map[attrs["status"]]
+            fields["status_id"] = self.diffsync.status_map[attrs["status"]]
         if "enabled" in attrs:
-            port.enabled = attrs["enabled"]
-        port.custom_field_data.update({"system_of_record": "DNA Center"})
-        port.custom_field_data.update({"ssot_last_synchronized": datetime.today().date().isoformat()})
-        port.validated_save()
+            fields["enabled"] = attrs["enabled"]
+        custom_fields = {"system_of_record": "DNA Center"}
+        custom_fields.update({"ssot_last_synchronized": datetime.today().date().isoformat()})
+        self.diffsync.update_object("interfaces", self.uuid, fields, custom_fields)
         return super().update(attrs)
 
     def delete(self):
@@ -326,6 +313,7 @@ class NautobotPrefix(base.Prefix):
             namespace = diffsync.namespace_map[ids["namespace"]]
         else:
             namespace = Namespace.objects.get_or_create(name=ids["namespace"])[0].id
+            diffsync.namespace_map[ids["namespace"]] = namespace
         if diffsync.job.debug:
             diffsync.job.logger.info(f"Creating Prefix {ids['prefix']}.")
         new_prefix = Prefix(
@@ -340,19 +328,20 @@ class NautobotPrefix(base.Prefix):
             new_prefix.tenant_id = diffsync.tenant_map[attrs["tenant"]]
         new_prefix.custom_field_data.update({"system_of_record": "DNA Center"})
         new_prefix.custom_field_data.update({"ssot_last_synchronized": datetime.today().date().isoformat()})
-        new_prefix.validated_save()
+        if diffsync.job.bulk_import:
+            diffsync.objects_to_create["prefixes"].append(new_prefix)
+            diffsync.get_prefix_index(namespace)[str(new_prefix.prefix)] = new_prefix.id
+        else:
+            new_prefix.validated_save()
         diffsync.prefix_map[ids["prefix"]] = new_prefix.id
         return super().create(diffsync=diffsync, ids=ids, attrs=attrs)
 
     def update(self, attrs):
         """Update Prefix in Nautobot from Prefix object."""
-        prefix = Prefix.objects.get(id=self.uuid)
+        fields = {}
         if "tenant" in attrs:
-            if attrs.get("tenant"):
-                prefix.tenant_id = self.diffsync.tenant_map[attrs["tenant"]]
-            else:
-                prefix.tenant = None
-        prefix.validated_save()
+            fields["tenant_id"] = self.diffsync.tenant_map[attrs["tenant"]] if attrs.get("tenant") else None
+        self.diffsync.update_object("prefixes", self.uuid, fields)
         return super().update(attrs)
 
     def delete(self):
@@ -360,6 +349,9 @@ class NautobotPrefix(base.Prefix):
         try:
             prefix = Prefix.objects.get(id=self.uuid)
             self.diffsync.objects_to_delete["prefixes"].append(prefix)
+            if self.diffsync.job.bulk_import:
+                # deleted before bulk creation so it can't be the parent of new Prefixes and IPAddresses
+                self.diffsync.get_prefix_index(prefix.namespace_id).pop(str(prefix.prefix), None)
             super().delete()
             return self
         except Prefix.DoesNotExist as err:
@@ -381,24 +373,32 @@ class NautobotIPAddress(base.IPAddress):
             new_ip.tenant_id = diffsync.tenant_map[attrs["tenant"]]
         new_ip.custom_field_data.update({"system_of_record": "DNA Center"})
         new_ip.custom_field_data.update({"ssot_last_synchronized": datetime.today().date().isoformat()})
-        new_ip.validated_save()
+        if diffsync.job.bulk_import:
+            new_ip.parent_id = diffsync.get_closest_prefix_id(
+                diffsync.namespace_map[ids["namespace"]], ids["host"], include_self=True
+            )
+            if new_ip.parent_id is None:
+                diffsync.job.logger.warning(
+                    f"Unable to find parent Prefix for IPAddress {ids['host']} in Namespace {ids['namespace']}."
+                )
+                return None
+            diffsync.objects_to_create["ipaddresses"].append(new_ip)
+        else:
+            new_ip.validated_save()
         diffsync.ipaddr_map[ids["host"]] = new_ip.id
         return super().create(diffsync=diffsync, ids=ids, attrs=attrs)
 
     def update(self, attrs):
         """Update IPAddress in Nautobot from IPAddress object."""
-        ipaddr = IPAddress.objects.get(id=self.uuid)
+        fields = {}
         if "tenant" in attrs:
-            if attrs.get("tenant"):
-                ipaddr.tenant_id = self.diffsync.tenant_map[attrs["tenant"]]
-            else:
-                ipaddr.tenant = None
-        ipaddr.custom_field_data.update({"system_of_record": "DNA Center"})
-        ipaddr.custom_field_data.update({"ssot_last_synchronized": datetime.today().date().isoformat()})
+            fields["tenant_id"] = self.diffsync.tenant_map[attrs["tenant"]] if attrs.get("tenant") else None
+        custom_fields = {"system_of_record": "DNA Center"}
+        custom_fields.update({"ssot_last_synchronized": datetime.today().date().isoformat()})
         try:
-            ipaddr.validated_save()
+            self.diffsync.update_object("ipaddresses", self.uuid, fields, custom_fields)
         except ValidationError as err:
-            self.diffsync.job.logger.warning(f"Unable to update {ipaddr}: {err}")
+            self.diffsync.job.logger.warning(f"Unable to update {self.host}/{self.mask_length}: {err}")
         return super().update(attrs)
 
     def delete(self):
@@ -415,6 +415,11 @@ class NautobotIPAddressOnInterface(base.IPAddressOnInterface):
     @classmethod
     def create(cls, diffsync, ids, attrs):
         """Create IPAddressToInterface in Nautobot from IPAddressOnInterface object."""
+        if ids["host"] not in diffsync.ipaddr_map:
+            diffsync.job.logger.warning(
+                f"Unable to find IPAddress {ids['host']} to assign to {ids['device']}'s {ids['port']} port."
+            )
+            return None
         new_map = IPAddressToInterface(
             ip_address_id=diffsync.ipaddr_map[ids["host"]],
             interface_id=diffsync.port_map[ids["device"]][ids["port"]],
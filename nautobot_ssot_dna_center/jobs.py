@@ -1,5 +1,8 @@
 """Jobs for DNA Center SSoT integration."""
 
+import json
+
+from django.conf import settings
 from django.urls import reverse
 from django.templatetags.static import static
 from nautobot.extras.choices import SecretsGroupAccessTypeChoices, SecretsGroupSecretTypeChoices
@@ -9,7 +12,10 @@ from nautobot.tenancy.models import Tenant
 from nautobot.core.celery import register_jobs
 from nautobot_ssot.jobs.base import DataSource, DataMapping
 from nautobot_ssot_dna_center.diffsync.adapters import dna_center, nautobot
+from nautobot_ssot_dna_center.utils.cache import ResponseCache
 from nautobot_ssot_dna_center.utils.dna_center import DnaCenterClient
+from nautobot_ssot_dna_center.utils.metrics import SyncMetrics
+from nautobot_ssot_dna_center.utils.snapshot import DeviceSnapshot
 
 
 name = "DNA Center SSoT"  # pylint: disable=invalid-name
@@ -27,6 +33,10 @@ class DnaCenterDataSource(DataSource):  # pylint: disable=too-many-instance-attr
     )
     debug = BooleanVar(description="Enable for more verbose debug logging", default=False)
     bulk_import = BooleanVar(description="Perform bulk operations when importing data", default=False)
+    incremental = BooleanVar(
+        description="Only fetch details and interfaces for Devices updated in DNAC since the last successful sync",
+        default=False,
+    )
     tenant = ObjectVar(model=Tenant, label="Tenant", required=False)
 
     class Meta:  # pylint: disable=too-few-public-methods
@@ -38,6 +48,12 @@ class DnaCenterDataSource(DataSource):  # pylint: disable=too-many-instance-attr
         description = "Sync information from DNA Center to Nautobot"
         data_source_icon = static("nautobot_ssot_dna_center/dna_center_logo.png")
 
+    def __init__(self):
+        """Initialize job with empty metrics and no response cache."""
+        super().__init__()
+        self.metrics = SyncMetrics()
+        self.response_cache = None
+
     @classmethod
     def config_information(cls):
         """Dictionary describing the configuration of this DataSource."""
@@ -57,6 +73,11 @@ class DnaCenterDataSource(DataSource):  # pylint: disable=too-many-instance-attr
 
     def load_source_adapter(self):
         """Load data from DNA Center into DiffSync models."""
+        with self.metrics.phase("load_source"):
+            self._load_source_adapter()
+
+    def _load_source_adapter(self):
+        """Connect to DNA Center and load its data into the source adapter."""
         self.logger.info(f"Loading data from {self.dnac.name}")
         _sg = self.dnac.secrets_group
         username = _sg.get_secret_value(
@@ -67,21 +88,78 @@ class DnaCenterDataSource(DataSource):  # pylint: disable=too-many-instance-attr
             access_type=SecretsGroupAccessTypeChoices.TYPE_HTTP,
             secret_type=SecretsGroupSecretTypeChoices.TYPE_PASSWORD,
         )
+        cache_settings = settings.PLUGINS_CONFIG["nautobot_ssot_dna_center"].get("response_cache")
+        self.response_cache = ResponseCache(**cache_settings) if cache_settings else None
         client = DnaCenterClient(
             url=self.dnac.remote_url,
             username=username,
             password=password,
             port=self.dnac.extra_config["port"],
             verify=self.dnac.verify_ssl,
+            max_workers=settings.PLUGINS_CONFIG["nautobot_ssot_dna_center"].get("max_workers", 10),
+            cache=self.response_cache,
+            metrics=self.metrics,
         )
         client.connect()
-        self.source_adapter = dna_center.DnaCenterAdapter(job=self, sync=self.sync, client=client, tenant=self.tenant)
+        snapshot = None
+        if self.incremental:
+            snapshot = DeviceSnapshot.for_instance(
+                base_url=client.base_url,
+                directory=settings.PLUGINS_CONFIG["nautobot_ssot_dna_center"].get("snapshot_dir"),
+            )
+        self.source_adapter = dna_center.DnaCenterAdapter(
+            job=self, sync=self.sync, client=client, tenant=self.tenant, snapshot=snapshot
+        )
         self.source_adapter.load()
 
     def load_target_adapter(self):
         """Load data from Nautobot into DiffSync models."""
-        self.target_adapter = nautobot.NautobotAdapter(job=self, sync=self.sync, tenant=self.tenant)
-        self.target_adapter.load()
+        with self.metrics.phase("load_target"):
+            self.target_adapter = nautobot.NautobotAdapter(
+                job=self, sync=self.sync, tenant=self.tenant, metrics=self.metrics
+            )
+            self.target_adapter.load()
+
+    def calculate_diff(self):
+        """Calculate diff between the adapters, recording time spent and queries made."""
+        with self.metrics.phase("diff"):
+            super().calculate_diff()
+
+    def execute_sync(self):
+        """Sync diff into Nautobot, recording time spent and queries made."""
+        with self.metrics.phase("sync"):
+            super().execute_sync()
+
+    def report_metrics(self):
+        """Write phase and DNA Center API metrics to the job log and store them as a JSON file on the job result.
+
+        Job file outputs require Nautobot 2.1 or later so the JSON is written to the job log instead on older versions.
+        """
+        self.metrics.log_summary(self.logger)
+        create_file = getattr(self, "create_file", None)
+        if create_file:
+            create_file("dna_center_sync_metrics.json", json.dumps(self.metrics.summary(), indent=2))
+        else:
+            self.logger.info(
+                f"Job file outputs aren't supported by this Nautobot version so skipped storing metrics file. "
+                f"Metrics: {json.dumps(self.metrics.summary())}"
+            )
+
+    def sync_data(self, memory_profiling):
+        """Perform data synchronization and save the Device snapshot for the next incremental load once it succeeds.
+
+        The snapshot isn't saved on a dry run as Nautobot hasn't been updated with the data it holds.
+        """
+        try:
+            super().sync_data(memory_profiling)
+        finally:
+            self.report_metrics()
+            if self.response_cache is not None:
+                self.response_cache.close()
+                self.response_cache = None
+        if self.incremental and not self.dryrun and self.source_adapter and self.source_adapter.snapshot:
+            self.source_adapter.snapshot.save()
+            self.logger.info("Saved Device snapshot for the next incremental load.")
 
     def run(
         self,
@@ -92,6 +170,7 @@ class DnaCenterDataSource(DataSource):  # pylint: disable=too-many-instance-attr
         bulk_import,
         tenant,
         *args,
+        incremental=False,
         **kwargs,  # pylint: disable=arguments-differ, too-many-arguments
     ):
         """Perform data synchronization."""
@@ -99,6 +178,7 @@ class DnaCenterDataSource(DataSource):  # pylint: disable=too-many-instance-attr
         self.tenant = tenant
         self.debug = debug
         self.bulk_import = bulk_import
+        self.incremental = incremental
         self.dryrun = dryrun
         self.memory_profiling = memory_profiling
         super().run(dryrun=self.dryrun, memory_profiling=self.memory_profiling, *args, **kwargs)
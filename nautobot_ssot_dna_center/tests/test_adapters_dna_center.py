@@ -1,5 +1,7 @@
 """Test DNA Center adapter."""
 
+import os
+import tempfile
 import uuid
 from unittest.mock import MagicMock
 
@@ -24,6 +26,7 @@ from nautobot_ssot_dna_center.tests.fixtures import (
     EXPECTED_FLOORS,
 )
 from nautobot_ssot_dna_center.jobs import DnaCenterDataSource
+from nautobot_ssot_dna_center.utils.snapshot import DeviceSnapshot
 
 
 @override_settings(PLUGINS_CONFIG={"nautobot_ssot_dna_center": {"import_global": True}})
@@ -46,6 +49,9 @@ class TestDnaCenterAdapterTestCase(
         ]
         self.dna_center_client.find_latitude_and_longitude.return_value = ("", "")
         self.dna_center_client.get_device_detail.return_value = DEVICE_DETAIL_FIXTURE
+        self.dna_center_client.get_device_details.return_value = {
+            dev["id"]: DEVICE_DETAIL_FIXTURE for dev in DEVICE_FIXTURE
+        }
         self.dna_center_client.get_model_name.return_value = "WS-C3850-24P-L"
         self.dna_center_client.parse_site_hierarchy.return_value = {
             "areas": ["Global", "NY"],
@@ -53,6 +59,9 @@ class TestDnaCenterAdapterTestCase(
             "floor": "Floor1",
         }
         self.dna_center_client.get_port_info.return_value = PORT_FIXTURE
+        self.dna_center_client.get_port_info_for_devices.side_effect = lambda device_ids: (
+            (dev_id, PORT_FIXTURE) for dev_id in device_ids
+        )
         self.dna_center_client.get_port_type.return_value = "virtual"
         self.dna_center_client.get_port_status.return_value = "active"
 
@@ -248,6 +257,23 @@ class TestDnaCenterAdapterTestCase(
             {dev.get_unique_id() for dev in self.dna_center.get_all("device")},
         )
         self.dna_center.load_ports.assert_called()
+        self.dna_center_client.get_device_details.assert_called_once_with(
+            dev_ids=[dev["id"] for dev in DEVICE_FIXTURE if dev.get("hostname")]
+        )
+        self.dna_center_client.get_device_detail.assert_not_called()
+        self.dna_center_client.get_port_info.assert_not_called()
+
+    def test_load_devices_skips_meraki_details(self):
+        """Test Nautobot SSoT for Cisco DNA Center load_devices() function doesn't fetch details of skipped Merakis."""
+        meraki = {**DEVICE_FIXTURE[0], "id": "meraki1", "hostname": "ap1.abc.inc", "softwareType": None}
+        meraki["family"] = "Meraki Access Point"
+        self.dna_center_client.get_devices.return_value = DEVICE_FIXTURE + [meraki]
+        self.dna_center.load_ports = MagicMock()
+        self.dna_center.load_devices()
+        self.dna_center_client.get_device_details.assert_called_once_with(
+            dev_ids=[dev["id"] for dev in DEVICE_FIXTURE if dev.get("hostname")]
+        )
+        self.assertNotIn("ap1.abc.inc", {dev.get_unique_id() for dev in self.dna_center.get_all("device")})
 
     def test_load_ports(self):
         """Test Nautobot SSoT for Cisco DNA Center load_ports() function."""
@@ -261,6 +287,49 @@ class TestDnaCenterAdapterTestCase(
         actual_ports = [port.get_unique_id() for port in self.dna_center.get_all("port")]
         self.assertEqual(expected_ports, actual_ports)
 
+    @override_settings(
+        PLUGINS_CONFIG={"nautobot_ssot_dna_center": {"import_global": True, "fetch_all_interfaces": True}}
+    )
+    def test_load_ports_from_interface_index(self):
+        """Test Nautobot SSoT for Cisco DNA Center load_ports() function using the bulk interface index."""
+        self.dna_center_client.get_all_interfaces.return_value = {dev["id"]: PORT_FIXTURE for dev in DEVICE_FIXTURE}
+        self.dna_center.load_devices()
+        self.dna_center_client.get_all_interfaces.assert_called_once()
+        self.dna_center_client.get_port_info_for_devices.assert_not_called()
+        expected_ports = []
+        for dev in DEVICE_FIXTURE:
+            if dev.get("hostname"):
+                for port in PORT_FIXTURE:
+                    if port.get("portName"):
+                        expected_ports.append(f"{port['portName']}__{dev['hostname']}")
+        actual_ports = [port.get_unique_id() for port in self.dna_center.get_all("port")]
+        self.assertEqual(expected_ports, actual_ports)
+
+    def test_load_devices_incremental(self):
+        """Test Nautobot SSoT for Cisco DNA Center load_devices() function reuses the snapshot for unchanged Devices."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            previous = DeviceSnapshot(path=os.path.join(tmpdir, "snapshot.json.gz"))
+            for dev in DEVICE_FIXTURE:
+                previous.record_details(device=dev, details=DEVICE_DETAIL_FIXTURE)
+                previous.record_ports(device_id=dev["id"], ports=PORT_FIXTURE)
+            previous.save()
+            self.dna_center.snapshot = DeviceSnapshot(path=previous.path)
+            self.dna_center.load_devices()
+        self.dna_center_client.get_device_details.assert_called_once_with(dev_ids=[])
+        self.dna_center_client.get_port_info_for_devices.assert_called_once_with(device_ids=[])
+        self.assertEqual(
+            {f"{dev['hostname']}" for dev in DEVICE_FIXTURE if dev.get("hostname")},
+            {dev.get_unique_id() for dev in self.dna_center.get_all("device")},
+        )
+        expected_ports = []
+        for dev in DEVICE_FIXTURE:
+            if dev.get("hostname"):
+                for port in PORT_FIXTURE:
+                    if port.get("portName"):
+                        expected_ports.append(f"{port['portName']}__{dev['hostname']}")
+        actual_ports = [port.get_unique_id() for port in self.dna_center.get_all("port")]
+        self.assertEqual(expected_ports, actual_ports)
+
     def test_load_ports_validation_error(self):
         """Test Nautobot SSoT for Cisco DNA Center load_ports() function throwing ValidationError."""
         self.dna_center.add = MagicMock(side_effect=ValidationError(message="leaf3.abc.inc not found"))
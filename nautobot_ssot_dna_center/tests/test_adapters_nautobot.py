@@ -1,9 +1,11 @@
 """Unit tests for the Nautobot DiffSync adapter."""
 
 import uuid
+from unittest import skipIf
 from unittest.mock import MagicMock, patch
 from diffsync.exceptions import ObjectNotFound
 from django.contrib.contenttypes.models import ContentType
+from django.test import override_settings
 from nautobot.dcim.models import (
     Manufacturer,
     Location,
@@ -17,7 +19,13 @@ from nautobot.extras.models import Status, JobResult, Role
 from nautobot.ipam.models import IPAddress, Namespace, Prefix, IPAddressToInterface
 from nautobot.core.testing import TransactionTestCase
 from nautobot_ssot_dna_center.jobs import DnaCenterDataSource
-from nautobot_ssot_dna_center.diffsync.adapters.nautobot import NautobotAdapter
+from nautobot_ssot_dna_center.diffsync.adapters.nautobot import LIFECYCLE_MGMT, NautobotAdapter
+from nautobot_ssot_dna_center.diffsync.models.nautobot import (
+    NautobotIPAddress,
+    NautobotIPAddressOnInterface,
+    NautobotPrefix,
+)
+from nautobot_ssot_dna_center.utils.nautobot import assign_software_versions
 
 
 class NautobotDiffSyncTestCase(TransactionTestCase):
@@ -284,6 +292,279 @@ class NautobotDiffSyncTestCase(TransactionTestCase):
             sorted(ipaddr.get_unique_id() for ipaddr in self.nb_adapter.get_all("ipaddress")),
         )
 
+    def test_load_reference_maps(self):
+        """Test the load() function preloads Manufacturer, Role, DeviceType and Platform maps."""
+        self.build_nautobot_objects()
+        cisco = Manufacturer.objects.get(name="Cisco")
+        ios_xe = Platform.objects.create(name="cisco_xe", manufacturer=cisco, network_driver="cisco_xe")
+        self.nb_adapter.load()
+        self.assertEqual(self.nb_adapter.manufacturer_map["Cisco"], cisco.id)
+        self.assertEqual(self.nb_adapter.role_map["LEAF"], Role.objects.get(name="LEAF").id)
+        self.assertEqual(
+            self.nb_adapter.devicetype_map[("Cisco", "Cisco Catalyst 9300 Switch")],
+            DeviceType.objects.get(model="Cisco Catalyst 9300 Switch", manufacturer=cisco).id,
+        )
+        self.assertEqual(self.nb_adapter.platform_map, {"cisco_xe": ios_xe.id})
+
+    @patch("nautobot_ssot_dna_center.diffsync.adapters.nautobot.LIFECYCLE_MGMT", False)
+    def test_load_devices_constant_queries(self):
+        """Test the load_devices method uses a single query regardless of the number of Devices."""
+        self.build_nautobot_objects()
+        with self.assertNumQueries(1):
+            self.nb_adapter.load_devices()
+        leaf1 = self.nb_adapter.get("device", "leaf1.abc.inc")
+        self.assertEqual(leaf1.site, "HQ")
+        self.assertEqual(leaf1.floor, "HQ Floor 1")
+        self.assertEqual(leaf1.vendor, "Cisco")
+        self.assertEqual(leaf1.model, "Cisco Catalyst 9300 Switch")
+        self.assertEqual(leaf1.role, "LEAF")
+        self.assertEqual(leaf1.status, "Active")
+        self.assertEqual(leaf1.platform, "")
+        self.assertIsNone(leaf1.tenant)
+
+    @skipIf(not LIFECYCLE_MGMT, "Device Lifecycle Management is not installed.")
+    def test_load_devices_software_versions(self):
+        """Test the load_devices method reads versions from the Software on Device Relationship in one query."""
+        self.build_nautobot_objects()
+        leaf1 = Device.objects.get(name="leaf1.abc.inc")
+        leaf1.platform.network_driver = "cisco_ios"
+        leaf1.platform.validated_save()
+        assign_software_versions(diffsync=self.nb_adapter, software_versions=[(leaf1.id, "cisco_ios", "17.9.4a")])
+        with self.assertNumQueries(2):
+            self.nb_adapter.load_devices()
+        self.assertEqual(self.nb_adapter.get("device", "leaf1.abc.inc").version, "17.9.4a")
+        self.assertIsNone(self.nb_adapter.get("device", "leaf2.abc.inc").version)
+
+    @skipIf(not LIFECYCLE_MGMT, "Device Lifecycle Management is not installed.")
+    def test_sync_complete_assigns_software_versions(self):
+        """Test the sync_complete() method assigns queued software versions in bulk, replacing existing versions."""
+        self.build_nautobot_objects()
+        leaf1 = Device.objects.get(name="leaf1.abc.inc")
+        leaf2 = Device.objects.get(name="leaf2.abc.inc")
+        leaf1.platform.network_driver = "cisco_ios"
+        leaf1.platform.validated_save()
+        assign_software_versions(diffsync=self.nb_adapter, software_versions=[(leaf1.id, "cisco_ios", "17.9.4a")])
+        self.nb_adapter.objects_to_create["software_versions"] = [
+            (leaf1.id, "cisco_ios", "17.12.1"),
+            (leaf2.id, "cisco_ios", "17.12.1"),
+        ]
+        self.nb_adapter.sync_complete(diff=MagicMock(), source=MagicMock())
+        self.assertEqual(
+            self.nb_adapter.get_software_versions(Device.objects.filter(id__in=[leaf1.id, leaf2.id])),
+            {leaf1.id: "17.12.1", leaf2.id: "17.12.1"},
+        )
+        self.nb_adapter.job.logger.info.assert_any_call("Creating Version 17.12.1 for cisco_ios.")
+        self.assertEqual(self.nb_adapter.objects_to_create["software_versions"], [])
+
+    @skipIf(not LIFECYCLE_MGMT, "Device Lifecycle Management is not installed.")
+    def test_assign_software_versions_keeps_version_without_platform(self):
+        """Test the assign_software_versions function keeps the version of Devices whose Platform isn't found."""
+        self.build_nautobot_objects()
+        leaf1 = Device.objects.get(name="leaf1.abc.inc")
+        leaf1.platform.network_driver = "cisco_ios"
+        leaf1.platform.validated_save()
+        assign_software_versions(diffsync=self.nb_adapter, software_versions=[(leaf1.id, "cisco_ios", "17.9.4a")])
+        assign_software_versions(diffsync=self.nb_adapter, software_versions=[(leaf1.id, "", "17.12.1")])
+        self.assertEqual(
+            self.nb_adapter.get_software_versions(Device.objects.filter(id=leaf1.id)), {leaf1.id: "17.9.4a"}
+        )
+        self.nb_adapter.job.logger.warning.assert_called_with("Unable to find Platform  to assign Version 17.12.1.")
+
+    @skipIf(not LIFECYCLE_MGMT, "Device Lifecycle Management is not installed.")
+    def test_assign_software_versions_removes_cleared_version(self):
+        """Test the assign_software_versions function removes the version of Devices queued without one."""
+        self.build_nautobot_objects()
+        leaf1 = Device.objects.get(name="leaf1.abc.inc")
+        leaf1.platform.network_driver = "cisco_ios"
+        leaf1.platform.validated_save()
+        assign_software_versions(diffsync=self.nb_adapter, software_versions=[(leaf1.id, "cisco_ios", "17.9.4a")])
+        assign_software_versions(diffsync=self.nb_adapter, software_versions=[(leaf1.id, "cisco_ios", None)])
+        self.assertEqual(self.nb_adapter.get_software_versions(Device.objects.filter(id=leaf1.id)), {})
+
+    def test_load_ipaddress_to_interface_constant_queries(self):
+        """Test the load_ipaddress_to_interface method detects primary IPs without a query per mapping."""
+        self.build_nautobot_objects()
+        leaf1_mgmt = Interface.objects.get(device__name="leaf1.abc.inc", name="Management")
+        secondary_ip = IPAddress.objects.create(
+            address="10.10.10.2/24", parent=Prefix.objects.get(prefix="10.10.10.0/24"), status=self.status_active
+        )
+        secondary_ip.custom_field_data["system_of_record"] = "DNA Center"
+        secondary_ip.validated_save()
+        IPAddressToInterface.objects.create(ip_address=secondary_ip, interface=leaf1_mgmt)
+        with self.assertNumQueries(2):
+            self.nb_adapter.load_ipaddress_to_interface()
+        self.assertTrue(self.nb_adapter.get("ip_on_intf", "10.10.10.1__leaf1.abc.inc__Management").primary)
+        self.assertFalse(self.nb_adapter.get("ip_on_intf", "10.10.10.2__leaf1.abc.inc__Management").primary)
+        self.assertEqual(len(self.nb_adapter.get_all("ip_on_intf")), 5)
+
+    def test_load_ports_streams_values(self):
+        """Test the load_ports method loads Interfaces in a single query and attaches them to their Device."""
+        self.build_nautobot_objects()
+        self.nb_adapter.load_devices()
+        with self.assertNumQueries(1):
+            self.nb_adapter.load_ports()
+        port = self.nb_adapter.get("port", "Management__leaf1.abc.inc")
+        self.assertEqual(port.status, "Active")
+        self.assertEqual(port.port_type, "virtual")
+        self.assertEqual(port.mac_addr, "AA:BB:CC:DD:EE:F1")
+        self.assertEqual(port.mtu, 1500)
+        self.assertEqual(self.nb_adapter.get("device", "leaf1.abc.inc").ports, ["Management__leaf1.abc.inc"])
+        self.assertEqual(self.nb_adapter.port_map["leaf1.abc.inc"]["Management"], port.uuid)
+
+    @override_settings(PLUGINS_CONFIG={"nautobot_ssot_dna_center": {"load_chunk_size": 1}})
+    def test_load_in_chunks(self):
+        """Test the load() function loads everything when iterating over a single row at a time."""
+        self.build_nautobot_objects()
+        nb_adapter = NautobotAdapter(job=self.nb_adapter.job, sync=None)
+        self.assertEqual(nb_adapter.load_chunk_size, 1)
+        nb_adapter.load()
+        self.nb_adapter.load()
+        for model in self.nb_adapter.top_level:
+            self.assertEqual(
+                sorted(obj.get_unique_id() for obj in nb_adapter.get_all(model)),
+                sorted(obj.get_unique_id() for obj in self.nb_adapter.get_all(model)),
+            )
+
+    def test_bulk_create_prefixes_and_ipaddresses(self):
+        """Test Prefixes and IPAddresses are bulk created with their parents in bulk import mode."""
+        self.build_nautobot_objects()
+        self.nb_adapter.job.bulk_import = True
+        self.nb_adapter.status_map = {"Active": self.status_active.id}
+        self.nb_adapter.namespace_map = {"Global": Namespace.objects.get(name="Global").id}
+        for prefix in ["10.20.0.0/24", "10.0.0.0/8"]:
+            NautobotPrefix.create(self.nb_adapter, {"prefix": prefix, "namespace": "Global"}, {"tenant": None})
+        NautobotIPAddress.create(
+            self.nb_adapter, {"host": "10.20.0.1", "namespace": "Global"}, {"mask_length": 24, "tenant": None}
+        )
+        self.assertIsNone(
+            NautobotIPAddress.create(
+                self.nb_adapter, {"host": "192.168.0.1", "namespace": "Global"}, {"mask_length": 24, "tenant": None}
+            )
+        )
+        self.assertFalse(Prefix.objects.filter(prefix="10.0.0.0/8").exists())
+        self.nb_adapter.bulk_create_update()
+        supernet = Prefix.objects.get(prefix="10.0.0.0/8")
+        self.assertIsNone(supernet.parent)
+        self.assertEqual(Prefix.objects.get(prefix="10.20.0.0/24").parent, supernet)
+        self.assertEqual(Prefix.objects.get(prefix="10.10.10.0/24").parent, supernet)
+        self.assertEqual(IPAddress.objects.get(host="10.20.0.1").parent, Prefix.objects.get(prefix="10.20.0.0/24"))
+        self.assertFalse(IPAddress.objects.filter(host="192.168.0.1").exists())
+
+    def test_bulk_create_ipaddress_in_deleted_prefix(self):
+        """Test IPAddresses in a Prefix deleted during the sync are created under the next closest Prefix."""
+        self.build_nautobot_objects()
+        self.nb_adapter.job.bulk_import = True
+        self.nb_adapter.status_map = {"Active": self.status_active.id}
+        global_ns = Namespace.objects.get(name="Global")
+        self.nb_adapter.namespace_map = {"Global": global_ns.id}
+        subnet = Prefix.objects.create(prefix="10.10.10.0/28", namespace=global_ns, status=self.status_active)
+        NautobotPrefix(
+            prefix="10.10.10.0/28", namespace="Global", tenant=None, uuid=subnet.id, diffsync=self.nb_adapter
+        ).delete()
+        self.assertNotIn("10.10.10.0/28", self.nb_adapter.get_prefix_index(global_ns.id))
+        NautobotIPAddress.create(
+            self.nb_adapter, {"host": "10.10.10.5", "namespace": "Global"}, {"mask_length": 24, "tenant": None}
+        )
+        self.nb_adapter.sync_complete(diff=MagicMock(), source=MagicMock())
+        self.assertFalse(Prefix.objects.filter(id=subnet.id).exists())
+        self.assertEqual(IPAddress.objects.get(host="10.10.10.5").parent, Prefix.objects.get(prefix="10.10.10.0/24"))
+
+    def test_create_mapping_without_ipaddress(self):
+        """Test IPAddress to Interface mappings are skipped when the IPAddress wasn't created."""
+        self.nb_adapter.ipaddr_map = {}
+        self.assertIsNone(
+            NautobotIPAddressOnInterface.create(
+                self.nb_adapter,
+                {"host": "192.168.0.1", "device": "leaf1.abc.inc", "port": "Management"},
+                {"primary": True},
+            )
+        )
+        self.assertEqual(self.nb_adapter.objects_to_create["mappings"], [])
+        self.nb_adapter.job.logger.warning.assert_called_once()
+
+    def test_bulk_update_objects(self):
+        """Test updates are deferred in bulk import mode and applied with a bulk update per set of changed fields."""
+        self.build_nautobot_objects()
+        self.nb_adapter.job.bulk_import = True
+        leaf1 = Device.objects.get(name="leaf1.abc.inc")
+        leaf2 = Device.objects.get(name="leaf2.abc.inc")
+        spine1 = Device.objects.get(name="spine1.abc.in")
+        self.nb_adapter.update_object("devices", leaf1.id, {"serial": "A1"}, {"os_version": "17.12.1"})
+        self.nb_adapter.update_object("devices", leaf2.id, {"serial": "A2"}, {"os_version": "17.12.1"})
+        self.nb_adapter.update_object("devices", spine1.id, {"tenant_id": None})
+        self.assertNotEqual(Device.objects.get(id=leaf1.id).serial, "A1")
+        with self.assertNumQueries(3):
+            self.nb_adapter.bulk_update_objects()
+        leaf1.refresh_from_db()
+        self.assertEqual(leaf1.serial, "A1")
+        self.assertEqual(leaf1.custom_field_data["os_version"], "17.12.1")
+        self.assertEqual(leaf1.custom_field_data["system_of_record"], "DNA Center")
+        self.assertEqual(Device.objects.get(id=leaf2.id).serial, "A2")
+        self.assertEqual(self.nb_adapter.objects_to_update, {})
+
+    @override_settings(PLUGINS_CONFIG={"nautobot_ssot_dna_center": {"validate_bulk_updates": True}})
+    def test_bulk_update_objects_validation(self):
+        """Test invalid objects are skipped when validating bulk updates."""
+        self.build_nautobot_objects()
+        self.nb_adapter.job.bulk_import = True
+        leaf1_mgmt = Interface.objects.get(device__name="leaf1.abc.inc", name="Management")
+        leaf2_mgmt = Interface.objects.get(device__name="leaf2.abc.inc", name="Management")
+        self.nb_adapter.update_object("interfaces", leaf1_mgmt.id, {"mtu": 0})
+        self.nb_adapter.update_object("interfaces", leaf2_mgmt.id, {"mtu": 9000})
+        self.nb_adapter.bulk_update_objects()
+        self.assertNotEqual(Interface.objects.get(id=leaf1_mgmt.id).mtu, 0)
+        self.assertEqual(Interface.objects.get(id=leaf2_mgmt.id).mtu, 9000)
+        self.nb_adapter.job.logger.warning.assert_called_once()
+
+    @override_settings(PLUGINS_CONFIG={"nautobot_ssot_dna_center": {"save_batch_size": 2}})
+    def test_update_database_save_batches(self):
+        """Test update_database() saves objects in batches where a failed save doesn't affect the rest of its batch."""
+        self.build_nautobot_objects()
+        leaf1 = Device.objects.get(name="leaf1.abc.inc")
+        self.nb_adapter.objects_to_create["interfaces"] = [
+            Interface(name=name, device=leaf1, type="1000base-t", status=self.status_active)
+            for name in ["Gi1/0/1", "Management", "Gi1/0/2"]
+        ]
+        self.nb_adapter.update_database()
+        self.assertEqual(
+            sorted(Interface.objects.filter(device=leaf1).values_list("name", flat=True)),
+            ["Gi1/0/1", "Gi1/0/2", "Management"],
+        )
+        self.nb_adapter.job.logger.warning.assert_called_once()
+        self.nb_adapter.job.logger.info.assert_any_call("Saved 1 of 2/3 interfaces processed.")
+        self.nb_adapter.job.logger.info.assert_any_call("Saved 2 of 3/3 interfaces processed.")
+
+    def test_assign_primary_ips(self):
+        """Test assign_primary_ips() sets primary IPs with a single query per IP version without validation."""
+        self.build_nautobot_objects()
+        leaf1 = Device.objects.get(name="leaf1.abc.inc")
+        leaf2 = Device.objects.get(name="leaf2.abc.inc")
+        primary_ips = {leaf1.id: leaf1.primary_ip4_id, leaf2.id: leaf2.primary_ip4_id}
+        Device.objects.filter(id__in=primary_ips).update(primary_ip4=None)
+        self.nb_adapter.objects_to_create["primary_ip4"] = list(primary_ips.items())
+        with self.assertNumQueries(1):
+            self.nb_adapter.assign_primary_ips(validate=False)
+        self.assertEqual(dict(Device.objects.filter(id__in=primary_ips).values_list("id", "primary_ip4")), primary_ips)
+
+    def test_assign_primary_ips_validated(self):
+        """Test assign_primary_ips() saves Devices fetched in one query with validated_save() and skips invalid ones."""
+        self.build_nautobot_objects()
+        leaf1 = Device.objects.get(name="leaf1.abc.inc")
+        leaf2 = Device.objects.get(name="leaf2.abc.inc")
+        leaf1_ip = leaf1.primary_ip4_id
+        Device.objects.filter(id__in=[leaf1.id, leaf2.id]).update(primary_ip4=None)
+        self.nb_adapter.objects_to_create["primary_ip4"] = [
+            (leaf1.id, leaf1_ip),
+            (leaf2.id, leaf1_ip),
+            (uuid.uuid4(), leaf1_ip),
+        ]
+        with patch.object(Device, "validated_save", autospec=True, side_effect=Device.validated_save) as mock_save:
+            self.nb_adapter.assign_primary_ips(validate=True)
+        self.assertEqual(mock_save.call_count, 2)
+        self.assertEqual(Device.objects.get(id=leaf1.id).primary_ip4_id, leaf1_ip)
+        self.assertIsNone(Device.objects.get(id=leaf2.id).primary_ip4_id)
+        self.assertEqual(self.nb_adapter.job.logger.warning.call_count, 2)
+
     def test_load_regions_failure(self):
         """Test the load_regions method failing with loading duplicate Regions."""
         self.build_nautobot_objects()
@@ -302,7 +583,7 @@ class NautobotDiffSyncTestCase(TransactionTestCase):
         mock_floor.tenant = None
         mock_floor.id = uuid.uuid4()
         mock_loc_type.objects.get.return_value = mock_loc_type
-        mock_floors.objects.filter.return_value = [mock_floor]
+        mock_floors.objects.filter.return_value.select_related.return_value.iterator.return_value = [mock_floor]
         self.nb_adapter.get = MagicMock()
         self.nb_adapter.get.side_effect = [ObjectNotFound()]
         self.nb_adapter.load_floors()
@@ -322,6 +603,7 @@ class NautobotDiffSyncTestCase(TransactionTestCase):
             "regions": [],
         }
         self.nb_adapter.job = MagicMock()
+        self.nb_adapter.job.bulk_import = False
         self.nb_adapter.job.logger.info = MagicMock()
 
         deleted_objs = []
@@ -346,3 +628,23 @@ class NautobotDiffSyncTestCase(TransactionTestCase):
         self.assertTrue(self.nb_adapter.job.logger.info.call_args_list[2].startswith("Deleting"))
         self.assertTrue(self.nb_adapter.job.logger.info.call_args_list[3].startswith("Deleting"))
         self.assertTrue(self.nb_adapter.job.logger.info.call_args_list[4].startswith("Deleting"))
+
+    def test_sync_complete_bulk_delete(self):
+        """Test the sync_complete() method deletes groupings in bulk and isolates protected objects in bulk import mode."""
+        self.build_nautobot_objects()
+        self.nb_adapter.job.bulk_import = True
+        namespace = Namespace.objects.get(name="Global")
+        protected = Prefix.objects.get(prefix="10.10.10.0/24")
+        empty = [
+            Prefix.objects.create(prefix=f"10.30.{num}.0/24", namespace=namespace, status=self.status_active)
+            for num in range(4)
+        ]
+        self.nb_adapter.objects_to_delete["prefixes"] = [empty[0], empty[1], protected, empty[2], empty[3]]
+
+        self.nb_adapter.sync_complete(diff=MagicMock(), source=MagicMock())
+
+        self.assertFalse(Prefix.objects.filter(id__in=[prefix.id for prefix in empty]).exists())
+        self.assertTrue(Prefix.objects.filter(id=protected.id).exists())
+        self.nb_adapter.job.logger.info.assert_any_call("Deleting 5 prefixes.")
+        self.nb_adapter.job.logger.info.assert_any_call(f"Deletion failed protected object: {protected}")
+        self.assertEqual(self.nb_adapter.objects_to_delete["prefixes"], [])
@@ -1,9 +1,12 @@
 """Test DNA Center Jobs."""
 
+from unittest.mock import MagicMock, patch
+
 from django.test import TestCase
 from django.urls import reverse
 
 from nautobot_ssot_dna_center import jobs
+from nautobot_ssot_dna_center.utils.metrics import SyncMetrics
 
 
 class DnaCenterDataSourceJobTest(TestCase):
@@ -53,3 +56,38 @@ class DnaCenterDataSourceJobTest(TestCase):
         """Verify the config_information() API."""
         config_information = jobs.DnaCenterDataSource.config_information()
         self.assertEqual(config_information, {"Instances": "Found in Extensibility -> External Integrations menu."})
+
+    @patch("nautobot_ssot_dna_center.jobs.DataSource.sync_data")
+    def test_sync_data_saves_snapshot(self, mock_sync_data):  # pylint: disable=unused-argument
+        """Verify the Device snapshot is saved after an incremental sync, but not on a dry run."""
+        job = jobs.DnaCenterDataSource()
+        job.incremental = True
+        job.source_adapter = MagicMock()
+        job.report_metrics = MagicMock()
+        job.dryrun = True
+        job.sync_data(memory_profiling=False)
+        job.source_adapter.snapshot.save.assert_not_called()
+        job.dryrun = False
+        job.sync_data(memory_profiling=False)
+        job.source_adapter.snapshot.save.assert_called_once()
+
+    @patch("nautobot_ssot_dna_center.jobs.DataSource.sync_data", side_effect=ValueError("failed"))
+    def test_sync_data_closes_response_cache(self, mock_sync_data):  # pylint: disable=unused-argument
+        """Verify the DNA Center response cache is closed once the sync finishes, even if it fails."""
+        job = jobs.DnaCenterDataSource()
+        job.report_metrics = MagicMock()
+        cache = MagicMock()
+        job.response_cache = cache
+        with self.assertRaises(ValueError):
+            job.sync_data(memory_profiling=False)
+        cache.close.assert_called_once()
+        self.assertIsNone(job.response_cache)
+
+    @patch.object(jobs.DnaCenterDataSource, "create_file", None, create=True)
+    def test_report_metrics_without_file_outputs(self):
+        """Verify metrics are logged as JSON when Job file outputs aren't supported by the Nautobot version."""
+        job = jobs.DnaCenterDataSource()
+        job.logger = MagicMock()
+        job.metrics = SyncMetrics()
+        job.report_metrics()
+        self.assertIn("skipped storing metrics file", job.logger.info.call_args.args[0])
@@ -0,0 +1,65 @@
+"""Tests of DNA Center SSoT base DiffSync models."""
+
+from unittest import TestCase
+
+from diffsync import DiffSync
+from diffsync.enum import DiffSyncModelFlags
+
+from nautobot_ssot_dna_center.diffsync.models.base import IPAddressOnInterface, Port
+
+
+class PortAdapter(DiffSync):
+    """DiffSync adapter holding Port models."""
+
+    port = Port
+    top_level = ["port"]
+
+
+class TestCompactModel(TestCase):
+    """Test memory-lean storage of high-cardinality models."""
+
+    @staticmethod
+    def build_port(name: str, mtu: str = "1500") -> Port:
+        """Build Port on a Device with values built at runtime so they aren't interned by the compiler."""
+        return Port(
+            name="".join(["GigabitEthernet1/0/", name]),
+            device="".join(["leaf1", ".bench.local"]),
+            description="",
+            port_type="".join(["1000base", "-t"]),
+            port_mode="access",
+            mac_addr=None,
+            mtu=int(mtu),
+            status="".join(["Act", "ive"]),
+            enabled=True,
+            uuid=None,
+        )
+
+    def test_repeated_values_interned(self):
+        """Validate repeated values of separate models are the same object."""
+        port1, port2 = self.build_port("1"), self.build_port("2")
+        self.assertIs(port1.device, port2.device)
+        self.assertIs(port1.port_type, port2.port_type)
+        self.assertIs(port1.status, port2.status)
+        self.assertIs(port1.mtu, port2.mtu)
+        self.assertEqual(port1.name, "GigabitEthernet1/0/1")
+        mapping1 = IPAddressOnInterface(host="10.0.0.1", device=port1.device, port=port1.name, primary=True)
+        mapping2 = IPAddressOnInterface(
+            host="10.0.0.2", device="".join(["leaf1", ".bench.local"]), port="x", primary=False
+        )
+        self.assertIs(mapping1.device, mapping2.device)
+
+    def test_fields_set_shared(self):
+        """Validate models with the same fields set share it and assigning a field doesn't affect other models."""
+        adapter = PortAdapter()
+        port1, port2 = self.build_port("1"), self.build_port("2")
+        self.assertIs(port1.__fields_set__, port2.__fields_set__)
+        adapter.add(port1)
+        self.assertIn("diffsync", port1.__fields_set__)
+        self.assertNotIn("diffsync", port2.__fields_set__)
+        adapter.add(port2)
+        self.assertIs(port1.__fields_set__, port2.__fields_set__)
+        port1.model_flags = DiffSyncModelFlags.SKIP_UNMATCHED_DST
+        self.assertIn("model_flags", port1.__fields_set__)
+        self.assertNotIn("model_flags", port2.__fields_set__)
+        self.assertEqual(port2.model_flags, DiffSyncModelFlags.NONE)
+        self.assertIs(adapter.get("port", port1.get_unique_id()), port1)
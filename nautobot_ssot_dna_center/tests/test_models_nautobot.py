@@ -7,6 +7,7 @@ from nautobot.dcim.models import (
     LocationType,
     DeviceType,
     Manufacturer,
+    Platform,
 )
 from nautobot.extras.models import Status, Role
 from nautobot.tenancy.models import Tenant
@@ -273,7 +274,11 @@ class TestNautobotDevice(TransactionTestCase):
         self.diffsync.site_map = {}
         self.diffsync.floor_map = {}
         self.diffsync.device_map = {}
-        self.diffsync.objects_to_create = {"devices": []}  # pylint: disable=no-member
+        self.diffsync.manufacturer_map = {}
+        self.diffsync.role_map = {}
+        self.diffsync.devicetype_map = {}
+        self.diffsync.platform_map = {}
+        self.diffsync.objects_to_create = {"devices": [], "software_versions": []}  # pylint: disable=no-member
 
     @patch("nautobot_ssot_dna_center.diffsync.models.nautobot.LIFECYCLE_MGMT", True)
     def test_create(self):
@@ -288,8 +293,11 @@ class TestNautobotDevice(TransactionTestCase):
         self.diffsync.floor_map = {"HQ - Floor 1": hq_floor.id}
 
         NautobotDevice.create(self.diffsync, self.ids, self.attrs)
-        self.diffsync.job.logger.info.assert_called_with("Creating Version 16.12.3 for cisco_ios.")
         new_dev = self.diffsync.objects_to_create["devices"][0]
+        self.assertEqual(
+            self.diffsync.objects_to_create["software_versions"],
+            [(new_dev.id, self.attrs["platform"], self.attrs["version"])],
+        )
         self.assertEqual(new_dev.role, Role.objects.get(name=self.attrs["role"]))
         self.assertEqual(
             new_dev.device_type,
@@ -303,3 +311,44 @@ class TestNautobotDevice(TransactionTestCase):
         self.assertEqual(new_dev.location_id, hq_floor.id)
         self.assertEqual(new_dev.tenant_id, self.ga_tenant.id)
         self.assertTrue(new_dev.custom_field_data["os_version"], self.attrs["version"])
+
+    @patch("nautobot_ssot_dna_center.diffsync.models.nautobot.LIFECYCLE_MGMT", False)
+    def test_create_uses_reference_maps(self):
+        """Test the NautobotDevice create() method looks up reference data from the adapter maps without queries."""
+        hq_site = Location.objects.create(
+            name="HQ", status=self.status_active, location_type=LocationType.objects.get(name="Site")
+        )
+        self.diffsync.site_map = {"HQ": hq_site.id}
+        cisco = Manufacturer.objects.create(name="Cisco")
+        core_role = Role.objects.create(name="core")
+        nexus = DeviceType.objects.create(model="Nexus 9300", manufacturer=cisco)
+        ios = Platform.objects.create(name="cisco.ios.ios", manufacturer=cisco, network_driver="cisco_ios")
+        self.diffsync.manufacturer_map = {"Cisco": cisco.id}
+        self.diffsync.role_map = {"core": core_role.id}
+        self.diffsync.devicetype_map = {("Cisco", "Nexus 9300"): nexus.id}
+        self.diffsync.platform_map = {"cisco_ios": ios.id}
+        attrs = dict(self.attrs, floor=None)
+        with self.assertNumQueries(0):
+            NautobotDevice.create(self.diffsync, self.ids, attrs)
+            NautobotDevice.create(self.diffsync, {"name": "core-router2.testexample.com"}, attrs)
+        new_dev = self.diffsync.objects_to_create["devices"][0]
+        self.assertEqual(new_dev.role_id, core_role.id)
+        self.assertEqual(new_dev.device_type_id, nexus.id)
+        self.assertEqual(new_dev.platform_id, ios.id)
+
+    def test_create_fills_reference_maps(self):
+        """Test the NautobotDevice create() method adds created reference data to the adapter maps."""
+        hq_site = Location.objects.create(
+            name="HQ", status=self.status_active, location_type=LocationType.objects.get(name="Site")
+        )
+        self.diffsync.site_map = {"HQ": hq_site.id}
+        attrs = dict(self.attrs, floor=None, version=None)
+        NautobotDevice.create(self.diffsync, self.ids, attrs)
+        cisco = Manufacturer.objects.get(name="Cisco")
+        self.assertEqual(self.diffsync.manufacturer_map, {"Cisco": cisco.id})
+        self.assertEqual(self.diffsync.role_map, {"core": Role.objects.get(name="core").id})
+        self.assertEqual(
+            self.diffsync.devicetype_map,
+            {("Cisco", "Nexus 9300"): DeviceType.objects.get(model="Nexus 9300", manufacturer=cisco).id},
+        )
+        self.assertEqual(self.diffsync.platform_map, {"cisco_ios": Platform.objects.get(network_driver="cisco_ios").id})
@@ -0,0 +1,59 @@
+"""Tests of DNA Center response cache."""
+
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from nautobot_ssot_dna_center.utils.cache import ResponseCache
+
+
+class TestResponseCache(TestCase):
+    """Test ResponseCache storage, expiry, and eviction."""
+
+    def setUp(self):
+        """Create cache in a temporary directory."""
+        self.tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = os.path.join(self.tmpdir.name, "cache.sqlite3")
+        self.cache = ResponseCache(path=self.path, default_ttl=60, ttls={"sites.get_site": 0})
+
+    def tearDown(self):
+        """Remove cache database."""
+        self.cache.close()
+        self.tmpdir.cleanup()
+
+    def test_set_and_get(self):
+        """Validate a stored response is returned for the same endpoint and parameters."""
+        self.cache.set("https://dnac:443", "devices.get_device_list", {"offset": 1}, {"response": [{"id": "1"}]})
+        self.assertEqual(
+            self.cache.get("https://dnac:443", "devices.get_device_list", {"offset": 1}), {"response": [{"id": "1"}]}
+        )
+        self.assertIsNone(self.cache.get("https://dnac:443", "devices.get_device_list", {"offset": 501}))
+        self.assertIsNone(self.cache.get("https://other:443", "devices.get_device_list", {"offset": 1}))
+
+    def test_persists_between_instances(self):
+        """Validate responses survive reopening the cache."""
+        self.cache.set("https://dnac:443", "devices.get_device_count", {}, {"response": 3})
+        second = ResponseCache(path=self.path, default_ttl=60)
+        self.assertEqual(second.get("https://dnac:443", "devices.get_device_count", {}), {"response": 3})
+        second.close()
+
+    def test_expired_response_ignored(self):
+        """Validate responses older than their TTL aren't returned."""
+        self.cache.set("https://dnac:443", "devices.get_device_count", {}, {"response": 3})
+        with patch("nautobot_ssot_dna_center.utils.cache.time.time", return_value=9999999999):
+            self.assertIsNone(self.cache.get("https://dnac:443", "devices.get_device_count", {}))
+
+    def test_zero_ttl_not_stored(self):
+        """Validate endpoints with a TTL of 0 are never cached."""
+        self.cache.set("https://dnac:443", "sites.get_site", {"offset": 1}, {"response": []})
+        self.assertIsNone(self.cache.get("https://dnac:443", "sites.get_site", {"offset": 1}))
+
+    def test_eviction(self):
+        """Validate the oldest responses are evicted once max_entries is exceeded."""
+        self.cache.max_entries = 5
+        self.cache.EVICT_INTERVAL = 1
+        for offset in range(10):
+            self.cache.set("https://dnac:443", "devices.get_device_list", {"offset": offset}, {"response": offset})
+        self.assertIsNone(self.cache.get("https://dnac:443", "devices.get_device_list", {"offset": 0}))
+        self.assertEqual(self.cache.get("https://dnac:443", "devices.get_device_list", {"offset": 9}), {"response": 9})
@@ -1,7 +1,9 @@
 """Tests of DNA Center utility methods."""
 
+import os
+import tempfile
 from unittest.mock import MagicMock, patch, create_autospec
-from requests import Response
+from requests import Response, Session
 from parameterized import parameterized
 from nautobot.core.testing import TestCase
 from dnacentersdk.exceptions import dnacentersdkException
@@ -15,7 +17,9 @@ from nautobot_ssot_dna_center.tests.fixtures import (
     RECV_LOCATION_FIXTURE,
     RECV_PORT_FIXTURE,
 )
-from nautobot_ssot_dna_center.utils.dna_center import DnaCenterClient
+from nautobot_ssot_dna_center.utils.cache import ResponseCache
+from nautobot_ssot_dna_center.utils.dna_center import DnaCenterClient, build_hostname_role_matcher, classify_port_type
+from nautobot_ssot_dna_center.utils.metrics import SyncMetrics
 
 
 class TestDnaCenterClient(TestCase):  # pylint: disable=too-many-public-methods
@@ -62,6 +66,63 @@ class TestDnaCenterClient(TestCase):  # pylint: disable=too-many-public-methods
         )
         self.assertIsNone(self.dnac.conn)
 
+    @patch("nautobot_ssot_dna_center.utils.dna_center.api.DNACenterAPI")
+    def test_connect_registers_metrics_hook(self, mock_api):
+        """Test the connect method registers a response hook on the SDK Session when metrics are enabled."""
+        session = Session()
+        mock_api.return_value.session._req_session = session  # pylint: disable=protected-access
+        self.dnac.metrics = SyncMetrics()
+        self.dnac.connect()
+        self.assertIn(self.dnac.metrics.record_response, session.hooks["response"])
+
+    def test_get_requests_session_missing(self):
+        """Test the get_requests_session method raises an error when the SDK doesn't hold a requests Session."""
+        self.dnac.conn.session = MagicMock(spec=[])
+        with self.assertRaises(dnacentersdkException):
+            self.dnac.get_requests_session()
+
+    def test_get_paginated(self):
+        """Test the get_paginated method in DnaCenterClient fetches every page and keeps them in order."""
+        records = [{"id": str(num)} for num in range(1234)]
+        self.dnac.conn.devices.get_device_count.return_value = {"response": len(records)}
+        self.dnac.conn.devices.get_device_list.side_effect = lambda offset, limit: {
+            "response": records[offset - 1 : offset - 1 + limit]  # noqa: E203
+        }
+        self.dnac.max_workers = 3
+        actual = self.dnac.get_paginated(
+            count_endpoint="devices.get_device_count", page_endpoint="devices.get_device_list"
+        )
+        self.assertEqual(actual, records)
+        self.assertEqual(
+            sorted(call.kwargs["offset"] for call in self.dnac.conn.devices.get_device_list.call_args_list),
+            [1, 501, 1001],
+        )
+
+    def test_api_call_uses_cache(self):
+        """Test the api_call method in DnaCenterClient serves repeated calls from the response cache."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.dnac.cache = ResponseCache(path=os.path.join(tmpdir, "cache.sqlite3"))
+            self.dnac.conn.devices.get_device_detail.return_value = RECV_DEVICE_DETAIL_FIXTURE
+            first = self.dnac.get_device_detail(dev_id="1234567890")
+            second = self.dnac.get_device_detail(dev_id="1234567890")
+            self.dnac.cache.close()
+        self.assertEqual(first, DEVICE_DETAIL_FIXTURE)
+        self.assertEqual(second, DEVICE_DETAIL_FIXTURE)
+        self.dnac.conn.devices.get_device_detail.assert_called_once_with(search_by="1234567890", identifier="uuid")
+
+    def test_api_call_records_metrics(self):
+        """Test the api_call method in DnaCenterClient records calls and cache hits in metrics."""
+        self.dnac.metrics = SyncMetrics()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.dnac.cache = ResponseCache(path=os.path.join(tmpdir, "cache.sqlite3"))
+            self.dnac.conn.devices.get_device_detail.return_value = RECV_DEVICE_DETAIL_FIXTURE
+            self.dnac.get_device_detail(dev_id="1234567890")
+            self.dnac.get_device_detail(dev_id="1234567890")
+            self.dnac.cache.close()
+        stats = self.dnac.metrics.summary()["api"]["devices.get_device_detail"]
+        self.assertEqual(stats["calls"], 1)
+        self.assertEqual(stats["cache_hits"], 1)
+
     def test_get_locations(self):
         """Test the get_locations method in DnaCenterClient."""
         self.dnac.conn.sites.get_site.return_value = RECV_LOCATION_FIXTURE
@@ -134,6 +195,19 @@ class TestDnaCenterClient(TestCase):  # pylint: disable=too-many-public-methods
             self.dnac.get_device_detail(dev_id="1234567890")
             self.assertIn("Unable to get device detail information from DNA Center.", log.output[0])
 
+    def test_get_device_details(self):
+        """Test the get_device_details method in DnaCenterClient."""
+        self.dnac.conn.devices.get_device_detail.return_value = RECV_DEVICE_DETAIL_FIXTURE
+        actual = self.dnac.get_device_details(dev_ids=["1234567890", "0987654321"])
+        self.assertEqual(actual, {"1234567890": DEVICE_DETAIL_FIXTURE, "0987654321": DEVICE_DETAIL_FIXTURE})
+        self.assertEqual(self.dnac.conn.devices.get_device_detail.call_count, 2)
+
+    def test_map_concurrently_preserves_order(self):
+        """Test the map_concurrently method in DnaCenterClient returns results in the order of the items."""
+        self.dnac.max_workers = 4
+        actual = list(self.dnac.map_concurrently(lambda x: x * 2, range(20)))
+        self.assertEqual(actual, [x * 2 for x in range(20)])
+
     def test_parse_site_hierarchy(self):
         """Test the parse_site_hierarchy method in DnaCenterClient."""
         mock_location_map = {
@@ -165,6 +239,31 @@ class TestDnaCenterClient(TestCase):  # pylint: disable=too-many-public-methods
         actual = self.dnac.get_port_info(device_id="1234567890")
         self.assertEqual(actual, PORT_FIXTURE)
 
+    def test_get_port_info_for_devices(self):
+        """Test the get_port_info_for_devices method in DnaCenterClient."""
+        self.dnac.conn.devices.get_interface_info_by_id.return_value = RECV_PORT_FIXTURE
+        actual = list(self.dnac.get_port_info_for_devices(device_ids=["1234567890", "0987654321"]))
+        self.assertEqual(actual, [("1234567890", PORT_FIXTURE), ("0987654321", PORT_FIXTURE)])
+
+    def test_get_all_interfaces(self):
+        """Test the get_all_interfaces method in DnaCenterClient indexes Ports by Device ID."""
+        self.dnac.conn.devices.get_device_interface_count.return_value = {"response": len(PORT_FIXTURE)}
+        self.dnac.conn.devices.get_all_interfaces.return_value = RECV_PORT_FIXTURE
+        actual = self.dnac.get_all_interfaces()
+        expected = {}
+        for port in PORT_FIXTURE:
+            expected.setdefault(port["deviceId"], []).append(port)
+        self.assertEqual(actual, expected)
+        self.dnac.conn.devices.get_all_interfaces.assert_called_once_with(offset=1, limit=500)
+
+    def test_get_all_interfaces_catches_api_error(self):
+        """Test the get_all_interfaces method in DnaCenterClient catches dnacentersdkException."""
+        self.dnac.conn.devices.get_device_interface_count.return_value = {"response": 1}
+        self.dnac.conn.devices.get_all_interfaces.side_effect = dnacentersdkException(self.mock_response)
+        with self.assertLogs(level="ERROR") as log:
+            self.assertEqual(self.dnac.get_all_interfaces(), {})
+            self.assertIn("Unable to get port information from DNA Center.", log.output[0])
+
     def test_get_port_info_catches_api_error(self):
         """Test the get_port_info method in DnaCenterClient catches dnacentersdkException."""
         self.dnac.conn.devices.get_interface_info_by_id.side_effect = dnacentersdkException(self.mock_response)
@@ -186,6 +285,18 @@ class TestDnaCenterClient(TestCase):  # pylint: disable=too-many-public-methods
         actual = self.dnac.get_port_type(port_info=sent)
         self.assertEqual(actual, received)
 
+    def test_get_port_type_cached(self):
+        """Test the get_port_type method only classifies each portType and portName combination once."""
+        classify_port_type.cache_clear()
+        for _ in range(3):
+            self.assertEqual(
+                self.dnac.get_port_type(port_info={"portType": "Ethernet Port", "portName": "TenGigabitEthernet1/1/1"}),
+                "10gbase-x-sfpp",
+            )
+        self.assertEqual(self.dnac.get_port_type(port_info={"portType": "Other", "portName": "Gi0/1"}), "other")
+        self.assertEqual(classify_port_type.cache_info().hits, 2)
+        self.assertEqual(classify_port_type.cache_info().misses, 2)
+
     mock_port_status = [
         ("Maintenance", {"adminStatus": "DOWN", "status": "down"}, "Maintenance"),
         ("Failed", {"adminStatus": "UP", "status": "down"}, "Failed"),
@@ -213,6 +324,28 @@ class TestDnaCenterClient(TestCase):  # pylint: disable=too-many-public-methods
         result = self.dnac.parse_hostname_for_role(hostname_map=hostname_mapping, device_hostname=hostname)
         self.assertEqual(result, "Unknown")
 
+    def test_parse_hostname_for_role_last_match(self):
+        """Validate the parse_hostname_for_role method uses the last matching entry."""
+        hostname_mapping = [(".*EDGE.*", "Edge"), (".*DMZ.*", "DMZ"), (".*DMZ-EDGE.*", "DMZ Edge")]
+        result = self.dnac.parse_hostname_for_role(hostname_map=hostname_mapping, device_hostname="DMZ-EDGE-1")
+        self.assertEqual(result, "DMZ Edge")
+        result = self.dnac.parse_hostname_for_role(hostname_map=hostname_mapping, device_hostname="EDGE-DMZ-1")
+        self.assertEqual(result, "DMZ")
+
+    def test_build_hostname_role_matcher(self):
+        """Validate the hostname Role matcher compiles patterns once and caches a bounded number of hostnames."""
+        hostname_mapping = [(".*EDGE.*", "Edge"), (".*DMZ.*", "DMZ"), (".*DMZ-EDGE.*", "DMZ Edge")]
+        get_role = build_hostname_role_matcher(hostname_mapping, cache_size=2)
+        with patch("nautobot_ssot_dna_center.utils.dna_center.re.compile") as mock_compile:
+            self.assertEqual(get_role("DMZ-EDGE-1"), "DMZ Edge")
+            self.assertEqual(get_role("EDGE-DMZ-1"), "DMZ")
+            self.assertEqual(get_role("DMZ-EDGE-1"), "DMZ Edge")
+            self.assertEqual(get_role("core-router"), "Unknown")
+        mock_compile.assert_not_called()
+        self.assertEqual(get_role.cache_info().hits, 1)
+        self.assertEqual(get_role.cache_info().currsize, 2)
+        self.assertEqual(build_hostname_role_matcher(None, default="Access")("core-router"), "Access")
+
     def test_get_model_name_single_model(self):
         """Validate the functionality of get_model_name method with single model in string."""
         test_model = "CSR1000v"
@@ -0,0 +1,73 @@
+"""Tests of DNA Center SSoT job metrics."""
+
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from nautobot_ssot_dna_center.utils.metrics import SyncMetrics, percentile
+
+
+class TestSyncMetrics(TestCase):
+    """Test SyncMetrics phase and API call recording."""
+
+    def setUp(self):
+        """Create empty metrics."""
+        self.metrics = SyncMetrics()
+
+    def test_percentile(self):
+        """Validate nearest-rank percentiles of sorted values."""
+        values = [float(num) for num in range(1, 101)]
+        self.assertEqual(percentile(values, 50), 50.0)
+        self.assertEqual(percentile(values, 99), 99.0)
+        self.assertEqual(percentile([5.0], 90), 5.0)
+        self.assertEqual(percentile([], 50), 0.0)
+
+    def test_api_call_records_bytes_and_retries(self):
+        """Validate every response seen during a call counts towards its bytes, with extra responses as retries."""
+        with self.metrics.api_call("devices.get_device_list"):
+            self.metrics.record_response(MagicMock(content=b"x" * 10))
+            self.metrics.record_response(MagicMock(content=b"x" * 20))
+        with self.metrics.api_call("devices.get_device_list"):
+            self.metrics.record_response(MagicMock(content=b"x" * 5))
+        self.metrics.record_response(MagicMock(content=b"x" * 100))
+        stats = self.metrics.summary()["api"]["devices.get_device_list"]
+        self.assertEqual(stats["calls"], 2)
+        self.assertEqual(stats["bytes"], 35)
+        self.assertEqual(stats["retries"], 1)
+        self.assertEqual(stats["errors"], 0)
+
+    def test_api_call_records_errors(self):
+        """Validate failed calls are counted and the exception propagates."""
+        with self.assertRaises(ValueError):
+            with self.metrics.api_call("sites.get_site"):
+                raise ValueError("failed")
+        self.metrics.record_cache_hit("sites.get_site")
+        stats = self.metrics.summary()["api"]["sites.get_site"]
+        self.assertEqual(stats["calls"], 1)
+        self.assertEqual(stats["errors"], 1)
+        self.assertEqual(stats["cache_hits"], 1)
+
+    def test_phase_records_time_in_start_order(self):
+        """Validate nested phases are reported in the order they started."""
+        with self.metrics.phase("sync"):
+            with self.metrics.phase("sync_complete"):
+                pass
+        self.assertEqual(list(self.metrics.summary()["phases"]), ["sync", "sync_complete"])
+        self.assertEqual(self.metrics.phases["sync"]["queries"], 0)
+
+    @patch("nautobot_ssot_dna_center.utils.metrics.time.perf_counter", side_effect=[0.0, 1.0, 3.0, 6.0])
+    def test_nested_phase_excluded(self, mock_perf_counter):  # pylint: disable=unused-argument
+        """Validate time of a nested phase isn't counted towards the enclosing phase."""
+        with self.metrics.phase("sync"):
+            with self.metrics.phase("sync_complete"):
+                pass
+        self.assertEqual(self.metrics.phases["sync_complete"]["seconds"], 2.0)
+        self.assertEqual(self.metrics.phases["sync"]["seconds"], 4.0)
+
+    def test_log_summary(self):
+        """Validate a line is logged for each phase and endpoint."""
+        logger = MagicMock()
+        with self.metrics.phase("load_source"):
+            with self.metrics.api_call("devices.get_device_list"):
+                pass
+        self.metrics.log_summary(logger)
+        self.assertEqual(logger.info.call_count, 2)
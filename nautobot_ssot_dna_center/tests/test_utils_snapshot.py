@@ -0,0 +1,84 @@
+"""Tests of DNA Center Device snapshot for incremental loads."""
+
+import os
+import tempfile
+from unittest import TestCase
+
+from nautobot_ssot_dna_center.utils.snapshot import DeviceSnapshot
+
+
+class TestDeviceSnapshot(TestCase):
+    """Test DeviceSnapshot lastUpdateTime tracking and persistence."""
+
+    def setUp(self):
+        """Create snapshot in a temporary directory."""
+        self.tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = os.path.join(self.tmpdir.name, "snapshot.json.gz")
+        self.device = {"id": "1234567890", "hostname": "leaf1.abc.inc", "lastUpdateTime": 1675903366371}
+
+    def tearDown(self):
+        """Remove snapshot file."""
+        self.tmpdir.cleanup()
+
+    def test_new_snapshot_has_nothing_unchanged(self):
+        """Validate Devices aren't considered unchanged without a previous run."""
+        snapshot = DeviceSnapshot(path=self.path)
+        self.assertEqual(snapshot.devices, {})
+        self.assertFalse(snapshot.is_unchanged(self.device))
+
+    def test_save_and_reload(self):
+        """Validate recorded details and ports are served on the next run for unchanged Devices."""
+        snapshot = DeviceSnapshot(path=self.path)
+        snapshot.record_details(device=self.device, details={"siteHierarchyGraphId": "/1/2/"})
+        snapshot.record_ports(device_id=self.device["id"], ports=[{"portName": "Vlan1"}])
+        snapshot.save()
+
+        next_run = DeviceSnapshot(path=self.path)
+        self.assertTrue(next_run.is_unchanged(self.device))
+        self.assertTrue(next_run.has_ports(self.device["id"]))
+        self.assertEqual(next_run.get_details(self.device["id"]), {"siteHierarchyGraphId": "/1/2/"})
+        self.assertEqual(next_run.get_ports(self.device["id"]), [{"portName": "Vlan1"}])
+
+    def test_updated_device_is_changed(self):
+        """Validate Devices with a different lastUpdateTime, or without one, are considered changed."""
+        snapshot = DeviceSnapshot(path=self.path)
+        snapshot.record_details(device=self.device, details={"siteHierarchyGraphId": "/1/2/"})
+        snapshot.save()
+        next_run = DeviceSnapshot(path=self.path)
+        self.assertFalse(next_run.is_unchanged({**self.device, "lastUpdateTime": 1675903366372}))
+        self.assertFalse(next_run.is_unchanged({**self.device, "lastUpdateTime": 1675903366370}))
+        self.assertFalse(next_run.is_unchanged({**self.device, "lastUpdateTime": None}))
+        self.assertFalse(next_run.is_unchanged({**self.device, "id": "0987654321"}))
+
+    def test_late_update_is_changed(self):
+        """Validate a Device updated with a lastUpdateTime earlier than another Device's is considered changed."""
+        other = {**self.device, "id": "0987654321", "lastUpdateTime": 1675903366000}
+        snapshot = DeviceSnapshot(path=self.path)
+        snapshot.record_details(device=self.device, details={"siteHierarchyGraphId": "/1/2/"})
+        snapshot.record_details(device=other, details={"siteHierarchyGraphId": "/1/2/"})
+        snapshot.save()
+        next_run = DeviceSnapshot(path=self.path)
+        self.assertTrue(next_run.is_unchanged(other))
+        self.assertFalse(next_run.is_unchanged({**other, "lastUpdateTime": 1675903366100}))
+
+    def test_failed_retrieval_not_recorded(self):
+        """Validate empty details and interfaces from failed requests are retrieved again on the next run."""
+        other = {**self.device, "id": "0987654321"}
+        snapshot = DeviceSnapshot(path=self.path)
+        snapshot.record_details(device=self.device, details={})
+        snapshot.record_details(device=other, details={"siteHierarchyGraphId": "/1/2/"})
+        snapshot.record_ports(device_id=self.device["id"], ports=[])
+        snapshot.record_ports(device_id=other["id"], ports=[])
+        snapshot.save()
+
+        next_run = DeviceSnapshot(path=self.path)
+        self.assertFalse(next_run.is_unchanged(self.device))
+        self.assertTrue(next_run.is_unchanged(other))
+        self.assertFalse(next_run.has_ports(other["id"]))
+
+    def test_for_instance(self):
+        """Validate snapshots are kept separately for each DNA Center instance."""
+        first = DeviceSnapshot.for_instance(base_url="https://dnac1:443", directory=self.tmpdir.name)
+        second = DeviceSnapshot.for_instance(base_url="https://dnac2:443", directory=self.tmpdir.name)
+        self.assertNotEqual(first.path, second.path)
+        self.assertEqual(os.path.dirname(first.path), self.tmpdir.name)
@@ -0,0 +1,129 @@
+"""Persistent cache for DNA Center API responses."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import zlib
+from typing import Any, Optional
+
+DEFAULT_CACHE_PATH = os.path.join(tempfile.gettempdir(), "nautobot_ssot_dna_center_cache.sqlite3")
+
+
+class ResponseCache:
+    """SQLite backed cache of DNA Center API responses with per-endpoint TTLs and a bounded size."""
+
+    EVICT_INTERVAL = 500
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        default_ttl: int = 900,
+        ttls: Optional[dict] = None,
+        max_entries: int = 100000,
+    ):
+        """Initialize instance of cache.
+
+        Args:
+            path (str): Location of the SQLite database file holding the cached responses.
+            default_ttl (int): Number of seconds a response is kept for endpoints without a TTL in `ttls`.
+            ttls (dict, optional): Dictionary mapping endpoint name, ie `devices.get_device_detail`, to TTL in seconds.
+            max_entries (int): Maximum number of responses kept. The least recently stored are evicted first. The
+                bound is enforced every `EVICT_INTERVAL` writes so it may be briefly exceeded by that many entries.
+        """
+        self.path = path
+        self.default_ttl = default_ttl
+        self.ttls = ttls if ttls else {}
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, endpoint TEXT, stored_at REAL, expires_at REAL, data BLOB)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS responses_stored_at ON responses (stored_at)")
+            self._evict(time.time())
+
+    @staticmethod
+    def make_key(scope: str, endpoint: str, params: dict) -> str:
+        """Build cache key for a call to endpoint with params.
+
+        Args:
+            scope (str): Identifier of the DNA Center instance the response came from.
+            endpoint (str): Name of the API endpoint, ie `devices.get_device_detail`.
+            params (dict): Parameters the endpoint was called with.
+
+        Returns:
+            str: Hash identifying the call.
+        """
+        material = json.dumps([scope, endpoint, params], sort_keys=True, default=str)
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get_ttl(self, endpoint: str) -> int:
+        """Determine TTL in seconds for responses from endpoint."""
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    def get(self, scope: str, endpoint: str, params: dict) -> Optional[Any]:
+        """Retrieve cached response for a call to endpoint with params.
+
+        Args:
+            scope (str): Identifier of the DNA Center instance the response came from.
+            endpoint (str): Name of the API endpoint, ie `devices.get_device_detail`.
+            params (dict): Parameters the endpoint was called with.
+
+        Returns:
+            Any: Cached response or None if there isn't an unexpired response cached.
+        """
+        key = self.make_key(scope, endpoint, params)
+        with self._lock:
+            row = self._db.execute("SELECT expires_at, data FROM responses WHERE key = ?", (key,)).fetchone()
+        if not row or row[0] < time.time():
+            return None
+        return json.loads(zlib.decompress(row[1]))
+
+    def set(self, scope: str, endpoint: str, params: dict, response: Any):
+        """Store response for a call to endpoint with params.
+
+        Args:
+            scope (str): Identifier of the DNA Center instance the response came from.
+            endpoint (str): Name of the API endpoint, ie `devices.get_device_detail`.
+            params (dict): Parameters the endpoint was called with.
+            response (Any): JSON serializable response to store.
+        """
+        ttl = self.get_ttl(endpoint)
+        if ttl <= 0:
+            return
+        now = time.time()
+        data = zlib.compress(json.dumps(response).encode("utf-8"))
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, endpoint, stored_at, expires_at, data) VALUES (?, ?, ?, ?, ?)",
+                (self.make_key(scope, endpoint, params), endpoint, now, now + ttl, data),
+            )
+            self._writes += 1
+            if self._writes % self.EVICT_INTERVAL == 0:
+                self._evict(now)
+
+    def _evict(self, now: float):
+        """Remove expired responses and the oldest responses beyond max_entries. Caller must hold the lock."""
+        self._db.execute("DELETE FROM responses WHERE expires_at < ?", (now,))
+        excess = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0] - self.max_entries
+        if excess > 0:
+            self._db.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY stored_at LIMIT ?)", (excess,)
+            )
+
+    def clear(self):
+        """Remove all cached responses."""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM responses")
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._db.close()
@@ -2,22 +2,97 @@
 
 import logging
 import re
-from typing import List, Tuple
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from dnacentersdk import api
 from dnacentersdk.exceptions import dnacentersdkException
 from netutils.constants import BASE_INTERFACES
+from requests import Session
 
-from nautobot_ssot_dna_center.constants import BASE_INTERFACE_MAP
+from nautobot_ssot_dna_center.constants import BASE_INTERFACE_MAP, DNAC_PAGE_SIZE
+from nautobot_ssot_dna_center.utils.cache import ResponseCache
+from nautobot_ssot_dna_center.utils.metrics import SyncMetrics
 
 LOGGER = logging.getLogger(__name__)
 
+PORT_NAME_PREFIX = re.compile("[a-zA-Z]+")
+VIRTUAL_PORT_TYPES = frozenset(["Ethernet SVI", "Service Module Interface"])
+# Interface type of each interface name prefix, normalized with BASE_INTERFACES, for `Ethernet Port` ports.
+ETHERNET_PORT_TYPES = {
+    prefix: BASE_INTERFACE_MAP[base_name]
+    for prefix, base_name in BASE_INTERFACES.items()
+    if base_name in BASE_INTERFACE_MAP
+}
+# Port status for each combination of operational and admin status. Any other combination is Active.
+PORT_STATUSES = {("down", "DOWN"): "Maintenance", ("down", "UP"): "Failed", ("up", "DOWN"): "Planned"}
+
+
+@lru_cache(maxsize=4096)
+def classify_port_type(port_type: str, port_name: str) -> str:
+    """Determine interface type from DNA Center portType and portName, caching results for repeated names.
+
+    Args:
+        port_type (str): The `portType` of the port, ie `Ethernet Port`.
+        port_name (str): The `portName` of the port, ie `GigabitEthernet1/0/1`.
+
+    Returns:
+        str: Interface type that was found. Will return "other" if unable to determine type.
+    """
+    if port_type in VIRTUAL_PORT_TYPES:
+        return "virtual"
+    if port_type != "Ethernet Port":
+        return "other"
+    name_prefix = PORT_NAME_PREFIX.match(port_name)
+    return ETHERNET_PORT_TYPES.get(name_prefix.group() if name_prefix else "", "other")
+
+
+def build_hostname_role_matcher(
+    hostname_map: Optional[List[Tuple[str, str]]], default: str = "Unknown", cache_size: int = 4096
+) -> Callable[[str], str]:
+    """Build function determining Device Role from hostname using the `hostname_mapping` setting.
+
+    Patterns are compiled once and results of the most recent cache_size hostnames cached. As with checking every entry
+    in order, the last matching entry in the mapping determines the Role. The patterns and cache are released along
+    with the returned function.
+
+    Args:
+        hostname_map (List[Tuple[str, str]]): List of tuples containing regex to compare with hostname and associated DeviceRole name.
+        default (str): Name of DeviceRole returned when no pattern matches. Defaults to Unknown.
+        cache_size (int): Number of hostnames to cache the Role of. Defaults to 4096.
+
+    Returns:
+        Callable[[str], str]: Function returning the name of DeviceRole for a hostname.
+    """
+    patterns = [(re.compile(pattern), role) for pattern, role in reversed(hostname_map or [])]
+
+    @lru_cache(maxsize=cache_size)
+    def get_role(hostname: str) -> str:
+        return next((role for pattern, role in patterns if pattern.match(hostname)), default)
+
+    return get_role
 
-class DnaCenterClient:
-    """Client for handling all interactions with DNA Center."""
+
+class DnaCenterClient:  # pylint: disable=too-many-instance-attributes
+    """Client for handling all interactions with DNA Center.
+
+    Along with the connection settings the client holds the number of concurrent workers, the optional response cache
+    and the optional metrics used by every API call, so they aren't passed to each method.
+    """
 
     def __init__(
-        self, url: str, username: str, password: str, port: int = 443, verify: bool = True
+        self,
+        url: str,
+        username: str,
+        password: str,
+        port: int = 443,
+        verify: bool = True,
+        max_workers: int = 10,
+        cache: Optional[ResponseCache] = None,
+        metrics: Optional[SyncMetrics] = None,
     ):  # pylint: disable=too-many-arguments
         """Initialize instance of client."""
         self.url = url
@@ -26,6 +101,9 @@ class DnaCenterClient:
         self.username = username
         self.password = password
         self.verify = verify
+        self.max_workers = max_workers
+        self.cache = cache
+        self.metrics = metrics
         self.conn = None
 
     def connect(self):  # pylint: disable=inconsistent-return-statements
@@ -36,23 +114,101 @@ class DnaCenterClient:
             )
         except dnacentersdkException as err:
             raise dnacentersdkException(f"Unable to connect to DNA Center: {err}") from err
+        if self.metrics:
+            self.get_requests_session().hooks["response"].append(self.metrics.record_response)
+
+    def get_requests_session(self) -> Session:
+        """Get the requests Session the DNA Center SDK sends API calls with.
+
+        The SDK doesn't expose its Session publicly so a change to the private attribute holding it raises an error
+        instead of silently recording no responses.
+
+        Raises:
+            dnacentersdkException: The SDK connection doesn't hold a requests Session.
+
+        Returns:
+            Session: Session used by the SDK connection.
+        """
+        session = getattr(self.conn.session, "_req_session", None)
+        if not isinstance(session, Session):
+            raise dnacentersdkException("Unable to find requests Session of DNA Center SDK connection.")
+        return session
+
+    def api_call(self, endpoint: str, **kwargs):
+        """Call DNA Center SDK endpoint, using the response cache if one is configured.
+
+        Args:
+            endpoint (str): Name of the SDK endpoint relative to the connection, ie `devices.get_device_detail`.
+            kwargs: Parameters to pass to the endpoint.
+
+        Returns:
+            dict: Response from DNA Center.
+        """
+        if self.cache:
+            response = self.cache.get(scope=self.base_url, endpoint=endpoint, params=kwargs)
+            if response is not None:
+                if self.metrics:
+                    self.metrics.record_cache_hit(endpoint)
+                return response
+        func = self.conn
+        for attr in endpoint.split("."):
+            func = getattr(func, attr)
+        with self.metrics.api_call(endpoint) if self.metrics else nullcontext():
+            response = func(**kwargs)
+        if self.cache:
+            self.cache.set(scope=self.base_url, endpoint=endpoint, params=kwargs, response=response)
+        return response
+
+    def map_concurrently(self, func: Callable, items: Iterable) -> Iterator:
+        """Call func for each of items using a bounded pool of worker threads.
+
+        Args:
+            func (Callable): Function to call with a single item as argument.
+            items (Iterable): Items to pass to func.
+
+        Returns:
+            Iterator: Results of func in the same order as items.
+        """
+        with ThreadPoolExecutor(max_workers=max(self.max_workers, 1)) as executor:
+            yield from executor.map(func, items)
+
+    def get_paginated(self, count_endpoint: str, page_endpoint: str, **kwargs) -> List[dict]:
+        """Retrieve all records from a paginated DNAC list call, fetching the pages concurrently.
+
+        Args:
+            count_endpoint (str): SDK endpoint returning the total number of records.
+            page_endpoint (str): SDK endpoint returning a single page of records for an offset and limit.
+            kwargs: Additional parameters passed to page_endpoint.
+
+        Returns:
+            List[dict]: All records in the order DNAC returns them.
+        """
+        total = self.api_call(count_endpoint)["response"]
+        offsets = range(1, total + 1, DNAC_PAGE_SIZE)
+        records = []
+        for page in self.map_concurrently(
+            lambda offset: self.api_call(page_endpoint, offset=offset, limit=DNAC_PAGE_SIZE, **kwargs)["response"],
+            offsets,
+        ):
+            records.extend(page)
+        return records
 
     def get_locations(self):
         """Retrieve all location data from DNA Center.
 
+        Locations are deduplicated by siteNameHierarchy, keeping the first occurrence. The DNA Center adapter indexes
+        the returned list by site ID once in `build_dnac_location_map`.
+
         Returns:
             list: List of Locations (Sites) from DNAC.
         """
-        locations, loc_data, loc_names = [], [], []
+        locations = []
+        seen_hierarchies = set()
         try:
-            total_num_sites = self.conn.sites.get_site_count()["response"]
-            offset = 1
-            while len(loc_data) < total_num_sites:
-                loc_data.extend(self.conn.sites.get_site(offset=offset)["response"])
-                offset = len(loc_data)
-            for _, item in enumerate(loc_data):
-                if item["siteNameHierarchy"] not in loc_names:
-                    loc_names.append(item["siteNameHierarchy"])
+            loc_data = self.get_paginated(count_endpoint="sites.get_site_count", page_endpoint="sites.get_site")
+            for item in loc_data:
+                if item["siteNameHierarchy"] not in seen_hierarchies:
+                    seen_hierarchies.add(item["siteNameHierarchy"])
                     locations.append(item)
         except dnacentersdkException as err:
             LOGGER.error("Unable to get site information from DNA Center. %s", err)
@@ -98,9 +254,9 @@ class DnaCenterClient:
         """Retrieve all Device data from DNA Center."""
         dev_list = []
         try:
-            total_num_devs = self.conn.devices.get_device_count()["response"]
-            while len(dev_list) < total_num_devs:
-                dev_list.extend(self.conn.devices.get_device_list(offset=len(dev_list) + 1)["response"])
+            dev_list = self.get_paginated(
+                count_endpoint="devices.get_device_count", page_endpoint="devices.get_device_list"
+            )
         except dnacentersdkException as err:
             LOGGER.error("Unable to get device information from DNA Center. %s", err)
         return dev_list
@@ -116,11 +272,22 @@ class DnaCenterClient:
         """
         dev_detail = {}
         try:
-            dev_detail = self.conn.devices.get_device_detail(search_by=dev_id, identifier="uuid")["response"]
+            dev_detail = self.api_call("devices.get_device_detail", search_by=dev_id, identifier="uuid")["response"]
         except dnacentersdkException as err:
             LOGGER.error("Unable to get device detail information from DNA Center. %s", err)
         return dev_detail
 
+    def get_device_details(self, dev_ids: List[str]) -> dict:
+        """Retrieve details for multiple Devices from DNA Center concurrently.
+
+        Args:
+            dev_ids (List[str]): IDs of devices in DNAC to query for details.
+
+        Returns:
+            dict: Dictionary mapping each device ID to its details.
+        """
+        return dict(zip(dev_ids, self.map_concurrently(lambda dev_id: self.get_device_detail(dev_id=dev_id), dev_ids)))
+
     @staticmethod
     def parse_site_hierarchy(location_map: dict, site_hier: str):
         """Parse siteHierarchyGraphId attribute from get_device_detail response.
@@ -161,11 +328,41 @@ class DnaCenterClient:
         """
         ports = []
         try:
-            ports = self.conn.devices.get_interface_info_by_id(device_id=device_id)["response"]
+            ports = self.api_call("devices.get_interface_info_by_id", device_id=device_id)["response"]
         except dnacentersdkException as err:
             LOGGER.error("Unable to get port information from DNA Center. %s", err)
         return ports
 
+    def get_port_info_for_devices(self, device_ids: List[str]) -> Iterator[Tuple[str, List[dict]]]:
+        """Retrieve all interfaces for multiple Devices from DNAC concurrently.
+
+        Args:
+            device_ids (List[str]): IDs of the Devices to retrieve Ports for.
+
+        Returns:
+            Iterator[Tuple[str, List[dict]]]: Device ID and list of Ports for each Device, in the order of device_ids.
+        """
+        yield from zip(
+            device_ids, self.map_concurrently(lambda dev_id: self.get_port_info(device_id=dev_id), device_ids)
+        )
+
+    def get_all_interfaces(self) -> Dict[str, List[dict]]:
+        """Retrieve every interface from DNAC and index them by the Device they belong to.
+
+        Returns:
+            Dict[str, List[dict]]: Dictionary mapping Device ID to list of Ports on that Device.
+        """
+        ports = defaultdict(list)
+        try:
+            port_list = self.get_paginated(
+                count_endpoint="devices.get_device_interface_count", page_endpoint="devices.get_all_interfaces"
+            )
+            for port in port_list:
+                ports[port["deviceId"]].append(port)
+        except dnacentersdkException as err:
+            LOGGER.error("Unable to get port information from DNA Center. %s", err)
+        return dict(ports)
+
     @staticmethod
     def get_port_type(port_info: dict):
         """Determine port type based on portType and portName attributes.
@@ -176,17 +373,9 @@ class DnaCenterClient:
         Returns:
             str: String defining the type of port that was found. Will return "other" if unable to determine type.
         """
-        if port_info["portType"] == "Ethernet SVI" or port_info["portType"] == "Service Module Interface":
+        if port_info["portType"] in VIRTUAL_PORT_TYPES:
             return "virtual"
-
-        base_port_name = re.match("[a-zA-Z]+", port_info["portName"])
-        # normalize interface name for BASE_INTERFACE_MAP
-        if base_port_name and BASE_INTERFACES.get(base_port_name.group()):
-            base_port_name = BASE_INTERFACES[base_port_name.group()]
-
-        if port_info["portType"] == "Ethernet Port" and base_port_name in BASE_INTERFACE_MAP:
-            return BASE_INTERFACE_MAP[base_port_name]
-        return "other"
+        return classify_port_type(port_info["portType"], port_info["portName"])
 
     @staticmethod
     def get_port_status(port_info: dict):
@@ -195,21 +384,14 @@ class DnaCenterClient:
         Args:
             port_info (dict): Dictionary containing information about a port from DNAC.
         """
-        status = "Active"
-        if port_info["status"] == "down" and port_info["adminStatus"] == "DOWN":
-            status = "Maintenance"
-
-        if port_info["status"] == "down" and port_info["adminStatus"] == "UP":
-            status = "Failed"
-
-        if port_info["status"] == "up" and port_info["adminStatus"] == "DOWN":
-            status = "Planned"
-        return status
+        return PORT_STATUSES.get((port_info["status"], port_info["adminStatus"]), "Active")
 
     @staticmethod
     def parse_hostname_for_role(hostname_map: List[Tuple[str, str]], device_hostname: str):
         """Parse device hostname from hostname_map to get Device Role.
 
+        The last matching entry determines the Role. Use `build_hostname_role_matcher` when matching many Devices.
+
         Args:
             hostname_map (List[Tuple[str, str]]): List of tuples containing regex to compare with hostname and associated DeviceRole name.
             device_hostname (str): Hostname of Device to determine role of.
@@ -217,13 +399,9 @@ class DnaCenterClient:
         Returns:
             str: Name of DeviceRole. Defaults to Unknown.
         """
-        device_role = "Unknown"
-        if hostname_map:
-            for entry in hostname_map:
-                match = re.match(pattern=entry[0], string=device_hostname)
-                if match:
-                    device_role = entry[1]
-        return device_role
+        return next(
+            (role for pattern, role in reversed(hostname_map or []) if re.match(pattern, device_hostname)), "Unknown"
+        )
 
     @staticmethod
     def get_model_name(models: str) -> str:
@@ -0,0 +1,156 @@
+"""Instrumentation of DNA Center SSoT job phases and DNA Center API calls."""
+
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import List
+
+from django.db import connection
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Get the nearest-rank percentile of values.
+
+    Args:
+        values (List[float]): Sorted values to get percentile from.
+        pct (float): Percentile to get, between 0 and 100.
+
+    Returns:
+        float: Value at the percentile or 0.0 if values is empty.
+    """
+    if not values:
+        return 0.0
+    rank = max(int(round(pct / 100 * len(values))), 1)
+    return values[min(rank, len(values)) - 1]
+
+
+class SyncMetrics:
+    """Collect wall time and ORM query counts per job phase along with statistics for each DNA Center API endpoint.
+
+    API calls are recorded by wrapping them in `api_call()`. Bytes received and retries are measured by registering
+    `record_response()` as a response hook on the requests session used by the DNA Center SDK, so every HTTP response
+    made during a call, including rate limited and re-authenticated attempts, is attributed to that call.
+    """
+
+    def __init__(self):
+        """Initialize empty metrics."""
+        self.phases = {}
+        self.endpoints = defaultdict(lambda: {"latencies": [], "bytes": 0, "retries": 0, "errors": 0, "cache_hits": 0})
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._nested = []
+
+    @contextmanager
+    def phase(self, name: str):
+        """Record wall time and number of ORM queries made by the current thread inside the context as phase name.
+
+        Time and queries of a phase started inside another phase are excluded from the enclosing phase, so the totals
+        of all phases don't count them twice.
+        """
+        queries = 0
+
+        def count_query(execute, sql, params, many, context):
+            nonlocal queries
+            queries += 1
+            return execute(sql, params, many, context)
+
+        self.phases[name] = {}
+        nested = {"seconds": 0.0, "queries": 0}
+        self._nested.append(nested)
+        start = time.perf_counter()
+        try:
+            with connection.execute_wrapper(count_query):
+                yield
+        finally:
+            seconds = time.perf_counter() - start
+            self._nested.pop()
+            if self._nested:
+                self._nested[-1]["seconds"] += seconds
+                self._nested[-1]["queries"] += queries
+            self.phases[name] = {
+                "seconds": round(seconds - nested["seconds"], 3),
+                "queries": queries - nested["queries"],
+            }
+
+    @contextmanager
+    def api_call(self, endpoint: str):
+        """Record latency, bytes received, retries and failure of the DNA Center API call made inside the context.
+
+        Args:
+            endpoint (str): Name of the SDK endpoint being called, ie `devices.get_device_detail`.
+        """
+        self._local.responses = []
+        failed = False
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            failed = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            responses, self._local.responses = self._local.responses, None
+            with self._lock:
+                stats = self.endpoints[endpoint]
+                stats["latencies"].append(elapsed)
+                stats["bytes"] += sum(responses)
+                stats["retries"] += max(len(responses) - 1, 0)
+                stats["errors"] += int(failed)
+
+    def record_cache_hit(self, endpoint: str):
+        """Record response for endpoint being served from the response cache."""
+        with self._lock:
+            self.endpoints[endpoint]["cache_hits"] += 1
+
+    def record_response(self, response, *args, **kwargs):  # pylint: disable=unused-argument
+        """Response hook for requests attributing the size of each HTTP response to the API call in progress."""
+        responses = getattr(self._local, "responses", None)
+        if responses is not None:
+            responses.append(len(response.content))
+
+    def summary(self) -> dict:
+        """Summarize metrics of each phase and API endpoint.
+
+        Returns:
+            dict: Dictionary with `phases` and `api` keys holding metrics per phase and per endpoint respectively.
+        """
+        api = {}
+        with self._lock:
+            for endpoint, stats in sorted(self.endpoints.items()):
+                latencies = sorted(stats["latencies"])
+                api[endpoint] = {
+                    "calls": len(latencies),
+                    "cache_hits": stats["cache_hits"],
+                    "errors": stats["errors"],
+                    "retries": stats["retries"],
+                    "bytes": stats["bytes"],
+                    "total_seconds": round(sum(latencies), 3),
+                    "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+                    "p90_ms": round(percentile(latencies, 90) * 1000, 1),
+                    "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+                    "max_ms": round(latencies[-1] * 1000, 1) if latencies else 0.0,
+                }
+        return {"phases": dict(self.phases), "api": api}
+
+    def log_summary(self, logger):
+        """Write summary of phases and API endpoints to logger."""
+        summary = self.summary()
+        for name, stats in summary["phases"].items():
+            logger.info("Phase %s took %ss with %s database queries.", name, stats["seconds"], stats["queries"])
+        for endpoint, stats in summary["api"].items():
+            logger.info(
+                "API %s: %s calls (%s cached, %s errors, %s retries), %s bytes, %ss total, p50 %sms, p90 %sms, "
+                "p99 %sms, max %sms.",
+                endpoint,
+                stats["calls"],
+                stats["cache_hits"],
+                stats["errors"],
+                stats["retries"],
+                stats["bytes"],
+                stats["total_seconds"],
+                stats["p50_ms"],
+                stats["p90_ms"],
+                stats["p99_ms"],
+                stats["max_ms"],
+            )
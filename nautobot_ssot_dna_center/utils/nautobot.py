@@ -1,10 +1,11 @@
 """Utility functions for working with Nautobot."""
 
+from typing import List, Optional, Tuple
 from uuid import UUID
 from django.contrib.contenttypes.models import ContentType
 from netutils.lib_mapper import ANSIBLE_LIB_MAPPER_REVERSE, NAPALM_LIB_MAPPER_REVERSE
-from nautobot.dcim.models import Device, Platform
-from nautobot.extras.models import Relationship, RelationshipAssociation
+from nautobot.dcim.models import Device, DeviceType, Manufacturer, Platform
+from nautobot.extras.models import Relationship, RelationshipAssociation, Role
 
 try:
     from nautobot_device_lifecycle_mgmt.models import SoftwareLCM
@@ -42,47 +43,138 @@ def verify_platform(platform_name: str, manu: UUID) -> Platform:
     return platform_obj
 
 
-def add_software_lcm(diffsync, platform: str, version: str):
-    """Add OS Version as SoftwareLCM if Device Lifecycle Plugin found.
+def get_manufacturer_id(diffsync, name: str) -> UUID:
+    """Get ID of Manufacturer from the adapter manufacturer_map, creating the Manufacturer if it doesn't exist.
 
     Args:
         diffsync (DiffSyncAdapter): DiffSync adapter with Job and maps.
-        platform (str): Name of platform to associate version to.
-        version (str): The software version to be created for specified platform.
+        name (str): Name of Manufacturer.
 
     Returns:
-        UUID: UUID of the OS Version that is being found or created.
+        UUID: ID of found or created Manufacturer.
     """
-    platform_obj = Platform.objects.get(network_driver=platform)
-    try:
-        os_ver = SoftwareLCM.objects.get(device_platform=platform_obj, version=version).id
-    except SoftwareLCM.DoesNotExist:
-        diffsync.job.logger.info(f"Creating Version {version} for {platform}.")
-        os_ver = SoftwareLCM(
-            device_platform=platform_obj,
-            version=version,
-        )
-        os_ver.validated_save()
-        os_ver = os_ver.id
-    return os_ver
+    if name not in diffsync.manufacturer_map:
+        diffsync.manufacturer_map[name] = Manufacturer.objects.get_or_create(name=name)[0].id
+    return diffsync.manufacturer_map[name]
 
 
-def assign_version_to_device(diffsync, device: Device, software_lcm: UUID):
-    """Add Relationship between Device and SoftwareLCM."""
-    try:
-        software_relation = Relationship.objects.get(label="Software on Device")
-        relationship = RelationshipAssociation.objects.get(relationship=software_relation, destination_id=device.id)
-        diffsync.job.logger.warning(
-            f"Deleting Software Version Relationships for {device.name} to assign a new version."
-        )
-        relationship.delete()
-    except RelationshipAssociation.DoesNotExist:
-        pass
-    new_assoc = RelationshipAssociation(
-        relationship=software_relation,
-        source_type=ContentType.objects.get_for_model(SoftwareLCM),
-        source_id=software_lcm,
-        destination_type=ContentType.objects.get_for_model(Device),
-        destination_id=device.id,
+def get_role_id(diffsync, name: str) -> UUID:
+    """Get ID of Role from the adapter role_map, creating the Role for Devices if it doesn't exist.
+
+    Args:
+        diffsync (DiffSyncAdapter): DiffSync adapter with Job and maps.
+        name (str): Name of Role.
+
+    Returns:
+        UUID: ID of found or created Role.
+    """
+    if name not in diffsync.role_map:
+        role, created = Role.objects.get_or_create(name=name)
+        if created:
+            role.content_types.add(ContentType.objects.get_for_model(Device))
+        diffsync.role_map[name] = role.id
+    return diffsync.role_map[name]
+
+
+def get_device_type_id(diffsync, model: str, manufacturer: str) -> UUID:
+    """Get ID of DeviceType from the adapter devicetype_map, creating the DeviceType if it doesn't exist.
+
+    Args:
+        diffsync (DiffSyncAdapter): DiffSync adapter with Job and maps.
+        model (str): Model of DeviceType.
+        manufacturer (str): Name of DeviceType Manufacturer.
+
+    Returns:
+        UUID: ID of found or created DeviceType.
+    """
+    if (manufacturer, model) not in diffsync.devicetype_map:
+        diffsync.devicetype_map[(manufacturer, model)] = DeviceType.objects.get_or_create(
+            model=model, manufacturer_id=get_manufacturer_id(diffsync=diffsync, name=manufacturer)
+        )[0].id
+    return diffsync.devicetype_map[(manufacturer, model)]
+
+
+def get_platform_id(diffsync, network_driver: str, manufacturer: str) -> UUID:
+    """Get ID of Platform from the adapter platform_map, verifying the Platform exists if not found.
+
+    Args:
+        diffsync (DiffSyncAdapter): DiffSync adapter with Job and maps.
+        network_driver (str): Network driver of Platform.
+        manufacturer (str): Name of Manufacturer to create Platform with.
+
+    Returns:
+        UUID: ID of found or created Platform.
+    """
+    if network_driver not in diffsync.platform_map:
+        diffsync.platform_map[network_driver] = verify_platform(
+            platform_name=network_driver, manu=get_manufacturer_id(diffsync=diffsync, name=manufacturer)
+        ).id
+    return diffsync.platform_map[network_driver]
+
+
+def assign_software_versions(diffsync, software_versions: List[Tuple[UUID, str, Optional[str]]]):
+    """Assign SoftwareLCM versions to Devices in bulk, creating any missing SoftwareLCM objects.
+
+    Existing Software on Device RelationshipAssociations for the Devices are replaced. Devices queued without a
+    version only have their existing association removed, while Devices whose Platform isn't found are left as is.
+
+    Args:
+        diffsync (DiffSyncAdapter): DiffSync adapter with Job and maps.
+        software_versions (List[Tuple[UUID, str, Optional[str]]]): Tuples of Device ID, platform network driver and
+            version, or None to remove the Device's version.
+    """
+    versions = {dev_id: (platform, version) for dev_id, platform, version in software_versions}
+    versions = {
+        dev_id: versions[dev_id] for dev_id in Device.objects.filter(id__in=versions).values_list("id", flat=True)
+    }
+    if not versions:
+        return
+    assigned = {platform_version for platform_version in versions.values() if platform_version[1]}
+    platform_ids = {
+        driver: platform_id
+        for platform_id, driver in Platform.objects.filter(
+            network_driver__in={platform for platform, _ in assigned}
+        ).values_list("id", "network_driver")
+    }
+    lcm_ids = {
+        (platform_id, version): lcm_id
+        for lcm_id, platform_id, version in SoftwareLCM.objects.filter(
+            device_platform_id__in=platform_ids.values(), version__in={version for _, version in assigned}
+        ).values_list("id", "device_platform_id", "version")
+    }
+    new_versions = []
+    for platform, version in sorted(assigned):
+        key = (platform_ids.get(platform), version)
+        if key[0] is None:
+            diffsync.job.logger.warning(f"Unable to find Platform {platform} to assign Version {version}.")
+        elif key not in lcm_ids:
+            diffsync.job.logger.info(f"Creating Version {version} for {platform}.")
+            new_version = SoftwareLCM(device_platform_id=key[0], version=version)
+            new_versions.append(new_version)
+            lcm_ids[key] = new_version.id
+    SoftwareLCM.objects.bulk_create(new_versions, batch_size=250)
+
+    # Devices whose Platform wasn't found keep their existing version
+    replaced = [dev_id for dev_id, (platform, version) in versions.items() if not version or platform in platform_ids]
+    software_relation = Relationship.objects.get(label="Software on Device")
+    deleted, _ = RelationshipAssociation.objects.filter(
+        relationship=software_relation, destination_id__in=replaced
+    ).delete()
+    if deleted:
+        diffsync.job.logger.info(f"Deleted {deleted} Software Version Relationships to assign new versions.")
+    source_type = ContentType.objects.get_for_model(SoftwareLCM)
+    destination_type = ContentType.objects.get_for_model(Device)
+    RelationshipAssociation.objects.bulk_create(
+        [
+            RelationshipAssociation(
+                relationship=software_relation,
+                source_type=source_type,
+                source_id=lcm_ids[(platform_ids[platform], version)],
+                destination_type=destination_type,
+                destination_id=dev_id,
+            )
+            for dev_id, (platform, version) in versions.items()
+            if version and platform in platform_ids
+        ],
+        batch_size=250,
     )
-    new_assoc.validated_save()
@@ -0,0 +1,108 @@
+"""Snapshot of DNA Center Device data used for incremental loads."""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from typing import List, Optional
+
+
+class DeviceSnapshot:
+    """Device details and interfaces from the last successful sync along with the lastUpdateTime of each Device.
+
+    Devices whose lastUpdateTime is the same as recorded by the previous run are considered unchanged, so their details
+    and interfaces can be served from the snapshot instead of being requested from DNA Center again. Each Device is
+    compared to its own lastUpdateTime, as a Device whose inventory collection finishes late can be updated with a
+    lastUpdateTime earlier than that of other Devices already recorded.
+    """
+
+    def __init__(self, path: str):
+        """Initialize snapshot, loading the previous run's data from path if it exists.
+
+        Args:
+            path (str): Location of the gzip compressed JSON file holding the snapshot.
+        """
+        self.path = path
+        self.devices = {}
+        self.new_devices = {}
+        if os.path.exists(self.path):
+            with gzip.open(self.path, "rt", encoding="utf-8") as file:
+                self.devices = json.load(file)["devices"]
+
+    @classmethod
+    def for_instance(cls, base_url: str, directory: Optional[str] = None):
+        """Create snapshot stored in directory for the DNA Center instance at base_url.
+
+        The default temp directory is local to each host, so set the `snapshot_dir` setting to storage shared by all
+        Nautobot workers for the snapshot to be used whichever worker runs the Job.
+
+        Args:
+            base_url (str): URL of the DNA Center instance the snapshot is for.
+            directory (str, optional): Directory to store snapshot in. Defaults to the system temp directory.
+
+        Returns:
+            DeviceSnapshot: Snapshot for the DNA Center instance.
+        """
+        name = hashlib.sha256(base_url.encode("utf-8")).hexdigest()[:16]
+        return cls(path=os.path.join(directory or tempfile.gettempdir(), f"dnac_snapshot_{name}.json.gz"))
+
+    @staticmethod
+    def get_update_time(device: dict) -> int:
+        """Get lastUpdateTime from Device returned by get_devices(). Returns 0 if not present."""
+        return device.get("lastUpdateTime") or 0
+
+    def is_unchanged(self, device: dict) -> bool:
+        """Determine whether device is unchanged since the previous run and has its details in the snapshot.
+
+        Args:
+            device (dict): Device returned by get_devices().
+
+        Returns:
+            bool: Whether the snapshot data for device can be used.
+        """
+        update_time = self.get_update_time(device)
+        return bool(update_time) and self.devices.get(device["id"], {}).get("update_time") == update_time
+
+    def has_ports(self, device_id: str) -> bool:
+        """Determine whether the snapshot holds interfaces for device_id."""
+        return self.devices.get(device_id, {}).get("ports") is not None
+
+    def get_details(self, device_id: str) -> dict:
+        """Get details for device_id from the previous run."""
+        return self.devices[device_id]["details"]
+
+    def get_ports(self, device_id: str) -> List[dict]:
+        """Get interfaces for device_id from the previous run."""
+        return self.devices[device_id]["ports"]
+
+    def record_details(self, device: dict, details: dict):
+        """Record details for device in the snapshot for the next run.
+
+        Empty details, returned when retrieving them from DNA Center failed, aren't recorded so the Device is
+        retrieved again on the next run instead of reusing the failed result.
+
+        Args:
+            device (dict): Device returned by get_devices().
+            details (dict): Details for the Device.
+        """
+        if not details:
+            return
+        self.new_devices[device["id"]] = {
+            "update_time": self.get_update_time(device),
+            "details": details,
+            "ports": None,
+        }
+
+    def record_ports(self, device_id: str, ports: List[dict]):
+        """Record interfaces for device_id in the snapshot for the next run, unless retrieving them failed."""
+        if ports and device_id in self.new_devices:
+            self.new_devices[device_id]["ports"] = ports
+
+    def save(self):
+        """Write the data recorded during this run to disk, replacing the previous snapshot."""
+        tmp_path = f"{self.path}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as file:
+            json.dump({"devices": self.new_devices}, file)
+        os.replace(tmp_path, self.path)
+        self.devices = self.new_devices
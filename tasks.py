@@ -397,6 +397,72 @@ def makemigrations(context, name=""):
     run_command(context, command)
 
 
+@task(
+    help={
+        "devices": "number of synthetic Devices to serve (default: 1000)",
+        "ports": "number of interfaces per synthetic Device (default: 30)",
+        "latency": "seconds to delay each API response by (default: 0)",
+        "port": "port to listen on (default: 8443)",
+        "replay": "recording made with `development/fake_dnac.py record` to serve instead of synthetic data",
+    }
+)
+def fake_dnac(context, devices=1000, ports=30, latency=0.0, port=8443, replay=""):
+    """Run a local stand-in DNA Center API serving synthetic or recorded data."""
+    command = f"python development/fake_dnac.py serve --host 0.0.0.0 --port {port} --latency {latency}"
+    if replay:
+        command += f" --replay {replay}"
+    else:
+        command += f" --devices {devices} --ports {ports}"
+
+    run_command(context, command)
+
+
+@task(
+    help={
+        "sizes": "comma separated numbers of Devices to benchmark (default: 1000,10000,50000)",
+        "ports": "number of interfaces per Device (default: 30)",
+        "output": "file to write JSON results to (default: benchmark.json)",
+        "compare": "JSON results of a previous run to compare against",
+        "bulk-import": "use bulk operations in the Nautobot adapter (default: False)",
+    }
+)
+def benchmark(context, sizes="1000,10000,50000", ports=30, output="benchmark.json", compare="", bulk_import=False):
+    """Benchmark load, diff and sync phases against a fake DNA Center."""
+    command = f"python development/benchmark.py --sizes {' '.join(sizes.split(','))} --ports {ports} --output {output}"
+    if compare:
+        command += f" --compare {compare}"
+    if bulk_import:
+        command += " --bulk-import"
+
+    run_command(context, command)
+
+
+@task(
+    help={
+        "devices": "number of Devices to generate interfaces for (default: 1000)",
+        "ports": "number of interfaces per Device (default: 48)",
+    }
+)
+def benchmark_ports(context, devices=1000, ports=48):
+    """Micro-benchmark classification of interface types and statuses."""
+    command = f"python development/benchmark_ports.py --devices {devices} --ports {ports}"
+
+    run_command(context, command)
+
+
+@task(
+    help={
+        "devices": "number of Devices to generate interfaces for (default: 1000)",
+        "ports": "number of interfaces per Device (default: 48)",
+    }
+)
+def benchmark_models(context, devices=1000, ports=48):
+    """Measure memory held per port and IP address DiffSync model."""
+    command = f"python development/benchmark_models.py --devices {devices} --ports {ports}"
+
+    run_command(context, command)
+
+
 @task
 def migrate(context):
     """Perform migrate operation in Django."""